@@ -0,0 +1,454 @@
+"""Benchmarks of the Scheme Build, Lookups and Output Formats
+
+Run from the repository root, writing the timings as Json:
+
+    PYTHONPATH=src:contrib python benchmarks/run_benchmarks.py -o bench.json
+
+and compare them with the timings of another commit:
+
+    PYTHONPATH=src:contrib python benchmarks/run_benchmarks.py --compare bench.json
+
+Each benchmark is run 'repeat' times after one warm-up run; the outputs of
+ConsoleOutput are timed with the scheme already built (and shared by the
+registry), the build itself is timed by 'scheme.all_name_codes'. The
+fixtures of the benchmarks (e.g. the synthetic scheme) are built once, and
+only for the benchmarks selected to run. The benchmarks of a series of
+sizes also report the time per code, so growth faster than the number of
+codes stands out."""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from io import StringIO
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from snakemd.generator import InlineText, Table
+
+from nautilus_namecodes._version import resolve_version
+from nautilus_namecodes.builder.name_cache import name_cache
+from nautilus_namecodes.builder.namecode_builder_dataclasses import Section
+from nautilus_namecodes.builder.synthetic_scheme import (
+    SyntheticShape,
+    build_synthetic_scheme,
+)
+from nautilus_namecodes.format.generate_console import ConsoleOutput
+from nautilus_namecodes.format.json_schema import get_json_schema
+from nautilus_namecodes.format.json_stream import JsonStream
+from nautilus_namecodes.format.markdown_stream import MarkdownStream
+from nautilus_namecodes.index.interval_index import IntervalIndex
+from nautilus_namecodes.index.reverse_index import ReverseIndex
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, SectionCodes
+from nautilus_namecodes.scheme.registry import namecodes_registry
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes, TreeStubGen
+
+SYNTHETIC_SECTION_SIZES: List[int] = [1_000, 10_000, 100_000]
+SYNTHETIC_SHAPE: SyntheticShape = SyntheticShape(
+    planes=2, blocks_per_plane=64, sections_per_block=4, values_per_section=200
+)
+SYNTHETIC_SHAPES: List[SyntheticShape] = [
+    replace(SYNTHETIC_SHAPE, planes=SYNTHETIC_SHAPE.planes * factor)
+    for factor in (1, 2, 4)
+]
+
+
+@dataclass
+class Benchmark:
+    """A named function to time, with an (untimed) setup run before each call.
+
+    The fixture, if any, is called once before the runs, also untimed, to
+    build (and cache) what the function uses. With 'codes' (the number of
+    codes the function handles) the time per code is reported too."""
+
+    name: str
+    function: Callable[[], Any]
+    setup: Optional[Callable[[], Any]] = None
+    fixture: Optional[Callable[[], Any]] = None
+    codes: Optional[int] = None
+
+
+@lru_cache(maxsize=None)
+def scheme_fixture() -> Tuple[AllCodes, List[int], List[str]]:
+    """The shared scheme, with its codepoints and names."""
+
+    all_codes: AllCodes = namecodes_registry.get_all_codes()
+    return all_codes, list(all_codes.codes), list(all_codes.codes.values())
+
+
+@lru_cache(maxsize=None)
+def synthetic_section(size: int) -> Section:
+    """A section of 'size' values."""
+
+    return Section(
+        name="synthetic",
+        description="Synthetic Section",
+        values=[f"value {index:06d}" for index in range(size)],
+    )
+
+
+def codes_table(section_codes: SectionCodes) -> Table:
+    """A snakemd table of codes, as rendered by MarkdownOutput."""
+
+    return Table(
+        header=[InlineText("Code"), InlineText("Name")],
+        body=[
+            [InlineText(f"0x{codepoint:=04X}"), InlineText(name)]
+            for codepoint, name in section_codes.codes.items()
+        ],
+    )
+
+
+def synthetic_section_codes(size: int) -> SectionCodes:
+    """The codes of the section of 'size' values."""
+    return synthetic_section(size).get_section_codes(0)
+
+
+@lru_cache(maxsize=None)
+def code_table_fixture(size: int) -> Tuple[Mapping[int, str], Dict[int, str]]:
+    """The CodeTable of a section of 'size' values, and the same codes as a dict."""
+
+    codes: Mapping[int, str] = synthetic_section_codes(size).codes
+    return codes, dict(codes.items())
+
+
+def lookup_all(codes: Mapping[int, str]) -> List[str]:
+    """Look up every code of a mapping, by its codepoint."""
+    return [codes[codepoint] for codepoint in codes]
+
+
+def code_table_benchmarks(size: int) -> List[Benchmark]:
+    """Point lookups and iteration of a CodeTable, and of a dict to compare."""
+
+    fixture: Callable[[], Tuple[Mapping[int, str], Dict[int, str]]] = partial(
+        code_table_fixture, size
+    )
+
+    return [
+        Benchmark(
+            f"code_table.lookup[{size}]",
+            lambda: lookup_all(fixture()[0]),
+            fixture=fixture,
+        ),
+        Benchmark(
+            f"code_table.items[{size}]",
+            lambda: list(fixture()[0].items()),
+            fixture=fixture,
+        ),
+        Benchmark(
+            f"code_table.dict_lookup[{size}]",
+            lambda: lookup_all(fixture()[1]),
+            fixture=fixture,
+        ),
+        Benchmark(
+            f"code_table.dict_items[{size}]",
+            lambda: list(fixture()[1].items()),
+            fixture=fixture,
+        ),
+    ]
+
+
+@lru_cache(maxsize=None)
+def table_fixture(size: int) -> Table:
+    """A snakemd table of the codes of a section of 'size' values."""
+    return codes_table(synthetic_section_codes(size))
+
+
+@lru_cache(maxsize=None)
+def synthetic_fixture(shape: SyntheticShape) -> Tuple[MarkdownStream, JsonStream]:
+    """The output streams of a synthetic scheme of the given shape."""
+
+    all_codes: AllCodes = build_synthetic_scheme(shape)
+    return MarkdownStream(all_codes), JsonStream(all_codes)
+
+
+def write_markdown_codes(markdown_stream: MarkdownStream) -> None:
+    """Write the Markdown codes of a scheme."""
+    markdown_stream.write(markdown_stream.stream_codes(), StringIO())
+
+
+def write_json(json_stream: JsonStream) -> None:
+    """Write the Json of a scheme."""
+    json_stream.write(json_stream.stream_all_codes(), StringIO())
+
+
+def synthetic_benchmarks(shape: SyntheticShape) -> List[Benchmark]:
+    """Build and output a synthetic scheme of the given shape."""
+
+    fixture: Callable[[], Tuple[MarkdownStream, JsonStream]] = partial(
+        synthetic_fixture, shape
+    )
+
+    return [
+        Benchmark(
+            f"synthetic.build[{shape.codes}]",
+            partial(build_synthetic_scheme, shape),
+            codes=shape.codes,
+        ),
+        Benchmark(
+            f"synthetic.markdown_codes[{shape.codes}]",
+            lambda: write_markdown_codes(fixture()[0]),
+            fixture=fixture,
+            codes=shape.codes,
+        ),
+        Benchmark(
+            f"synthetic.json[{shape.codes}]",
+            lambda: write_json(fixture()[1]),
+            fixture=fixture,
+            codes=shape.codes,
+        ),
+    ]
+
+
+def lookup_codepoints(all_codes: AllCodes, codepoints: List[int]) -> List[str]:
+    """Look up the names of the codepoints."""
+    return [all_codes.codes[codepoint] for codepoint in codepoints]
+
+
+def lookup_names(reverse_index: ReverseIndex, names: List[str]) -> List[int]:
+    """Look up the codepoints of the names."""
+    return [reverse_index.lookup(name) for name in names]
+
+
+def lookup_owners(interval_index: IntervalIndex, codepoints: List[int]) -> List[Any]:
+    """Look up the sections of the codepoints."""
+    return [interval_index.owner(codepoint) for codepoint in codepoints]
+
+
+def collect_benchmarks(select: Optional[str] = None) -> List[Benchmark]:
+    """All the benchmarks (with names containing 'select'), in the order
+    they are run. Their fixtures are not built until they are run."""
+
+    benchmarks: List[Benchmark] = [
+        Benchmark("scheme.all_name_codes", AllNameCodes),
+        Benchmark(
+            "scheme.tree_stub_gen",
+            lambda: TreeStubGen(scheme_fixture()[0]),
+            fixture=scheme_fixture,
+        ),
+        Benchmark(
+            "lookup.reverse_index",
+            lambda: ReverseIndex(scheme_fixture()[0]),
+            fixture=scheme_fixture,
+        ),
+        Benchmark(
+            "lookup.codepoints",
+            lambda: lookup_codepoints(*scheme_fixture()[:2]),
+            fixture=scheme_fixture,
+        ),
+        Benchmark(
+            "lookup.names",
+            lambda: lookup_names(
+                namecodes_registry.get_reverse_index(), scheme_fixture()[2]
+            ),
+            fixture=scheme_fixture,
+        ),
+        Benchmark(
+            "lookup.interval_index",
+            lambda: IntervalIndex(scheme_fixture()[0]),
+            fixture=scheme_fixture,
+        ),
+        Benchmark(
+            "lookup.owners",
+            lambda: lookup_owners(
+                namecodes_registry.get_interval_index(), scheme_fixture()[1]
+            ),
+            fixture=scheme_fixture,
+        ),
+    ]
+
+    name: str
+    for name in [
+        "generate_tree_output",
+        "generate_blocks_output",
+        "generate_codes_output",
+        "generate_json",
+        "generate_json_tree",
+        "generate_json_codelist",
+    ]:
+        benchmarks.append(Benchmark(f"console.{name}", getattr(ConsoleOutput, name)))
+
+    for name in [
+        "generate_json_schema",
+        "generate_json_schema_tree",
+        "generate_json_schema_codelist",
+    ]:
+        benchmarks.append(
+            Benchmark(
+                f"console.{name}",
+                getattr(ConsoleOutput, name),
+                setup=get_json_schema.cache_clear,
+            )
+        )
+
+    size: int
+    for size in SYNTHETIC_SECTION_SIZES:
+        benchmarks.append(
+            Benchmark(
+                f"builder.get_section_codes[{size}]",
+                partial(synthetic_section_codes, size),
+                fixture=partial(synthetic_section, size),
+                codes=size,
+            )
+        )
+        benchmarks.append(
+            Benchmark(
+                f"builder.get_section_codes_uncached[{size}]",
+                partial(synthetic_section_codes, size),
+                setup=name_cache.clear,
+                fixture=partial(synthetic_section, size),
+                codes=size,
+            )
+        )
+
+    benchmarks.extend(code_table_benchmarks(10_000))
+
+    benchmarks.append(
+        Benchmark(
+            "snakemd.table_render[10000]",
+            lambda: table_fixture(10_000).render(),
+            fixture=partial(table_fixture, 10_000),
+        )
+    )
+
+    shape: SyntheticShape
+    for shape in SYNTHETIC_SHAPES:
+        benchmarks.extend(synthetic_benchmarks(shape))
+
+    return [
+        benchmark
+        for benchmark in benchmarks
+        if select is None or select in benchmark.name
+    ]
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    """Time a benchmark, after a warm-up run."""
+
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, not {repeat}")
+
+    if benchmark.fixture is not None:
+        benchmark.fixture()
+
+    timings: List[float] = []
+
+    _: int
+    for _ in range(repeat + 1):
+        if benchmark.setup is not None:
+            benchmark.setup()
+        start: float = time.perf_counter()
+        benchmark.function()
+        timings.append(time.perf_counter() - start)
+
+    timings = timings[1:]
+
+    result: Dict[str, Any] = {
+        "repeat": repeat,
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if repeat > 1 else 0.0,
+    }
+
+    if benchmark.codes is not None:
+        result["codes"] = benchmark.codes
+        result["per_code"] = result["min"] / benchmark.codes
+
+    return result
+
+
+def git_commit() -> Optional[str]:
+    """The commit of the working tree, if it is a git checkout."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(repeat: int, select: Optional[str] = None) -> Dict[str, Any]:
+    """Run the (selected) benchmarks, returning the results document."""
+
+    results: Dict[str, Any] = {}
+
+    benchmark: Benchmark
+    for benchmark in collect_benchmarks(select):
+        results[benchmark.name] = run_benchmark(benchmark, repeat)
+        per_code: Optional[float] = results[benchmark.name].get("per_code")
+        print(
+            f"{benchmark.name:45} {results[benchmark.name]['min'] * 1000:12.3f} ms"
+            + ("" if per_code is None else f" {per_code * 1e6:10.3f} us/code"),
+            file=sys.stderr,
+        )
+
+    return {
+        "commit": git_commit(),
+        "package_version": resolve_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Print the minimum timings of both runs, and their ratio."""
+
+    print(f"{'benchmark':45} {'baseline ms':>12} {'current ms':>12} {'ratio':>8}")
+
+    name: str
+    result: Dict[str, Any]
+    for name, result in current["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            print(f"{name:45} {'-':>12} {result['min'] * 1000:12.3f} {'-':>8}")
+            continue
+        before: float = baseline["benchmarks"][name]["min"]
+        print(
+            f"{name:45} {before * 1000:12.3f} {result['min'] * 1000:12.3f}"
+            f" {result['min'] / before:8.2f}"
+        )
+
+
+def positive_int(value: str) -> int:
+    """An argument of at least 1."""
+
+    number: int = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+
+def main() -> None:
+    """Command line entry point of the benchmark runner."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-r", "--repeat", type=positive_int, default=5)
+    parser.add_argument("-k", "--select", help="only run names containing this")
+    parser.add_argument("-o", "--output", type=Path, help="write the results here")
+    parser.add_argument("--compare", type=Path, help="results to compare against")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = run_benchmarks(args.repeat, args.select)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf8")
+
+    if args.compare is not None:
+        compare(json.loads(args.compare.read_text(encoding="utf8")), results)
+    elif args.output is None:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
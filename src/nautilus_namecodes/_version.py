@@ -1,21 +1,33 @@
-"""Get Version from pyproject.toml"""
+"""Get Version from pyproject.toml
 
-from pathlib import Path
-from typing import Any
+The version is resolved on first access of '__version__', not on import:
+the version substituted on build, else the installed package metadata,
+else (in a development tree) the version in 'pyproject.toml'."""
 
-import atoml
-from atoml import TOMLDocument
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from nautilus_namecodes._helpers import get_unicode_document, path_to_pyproject_toml
 
+if TYPE_CHECKING:
+    from atoml import TOMLDocument
+
+UNVERSIONED: str = "0.0.0"
+
+# Substituted by 'poetry-dynamic-versioning' when the package is built.
+_BUILD_VERSION: str = "0.0.0"
 
-def get_toml_document(string: str) -> TOMLDocument:
+
+def get_toml_document(string: str) -> "TOMLDocument":
     """Get the Toml Document from Path"""
 
+    import atoml  # pylint: disable=import-outside-toplevel
+
     return atoml.parse(string=string)
 
 
-def get_version_from_toml(doc: TOMLDocument) -> str:
+def get_version_from_toml(doc: "TOMLDocument") -> str:
     """Get the version from the Toml Document"""
 
     # ["tool"]["poetry"]["version"]
@@ -36,11 +48,36 @@ def get_version() -> str:
     return version
 
 
-__version__: str = "0.0.0"
+def get_version_from_metadata() -> str:
+    """Get the version from the installed package metadata"""
+
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+
+    try:
+        return metadata.version("nautilus-namecodes")
+    except metadata.PackageNotFoundError:
+        return UNVERSIONED
+
+
+@lru_cache(maxsize=None)
+def resolve_version() -> str:
+    """Get the version, once, from the fastest source that knows it"""
+
+    if _BUILD_VERSION != UNVERSIONED:
+        return _BUILD_VERSION
+
+    version: str = get_version_from_metadata()
+    if version != UNVERSIONED:
+        return version
+
+    return get_version()
+
 
-if __version__ == "0.0.0":
-    __version__ = get_version()
+def __getattr__(name: str) -> str:
+    if name == "__version__":
+        return resolve_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    print(get_version())
+    print(resolve_version())
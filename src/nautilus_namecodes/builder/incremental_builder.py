@@ -0,0 +1,301 @@
+"""Incremental Rebuilds of a Scheme when a Section Changes
+
+A scheme is a list of planes at fixed starting codepoints, within a plane
+the blocks (and within a block the sections) follow each other by their
+allocated pages. So changing the values of one section only recomputes
+that section; if its page count changes, the later sections of its block
+(and, if the block's page count changes, the later blocks of its plane)
+are shifted, by moving their existing codes rather than generating them
+again. The other planes are reused as they are: the table of all the
+codes is spliced from the previous one and the table of the changed
+plane, and the nodes of the previous results are never changed, so the
+unchanged planes keep the views of the table they were built in."""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from nautilus_namecodes.builder.namecode_builder_dataclasses import (
+    Block,
+    ConstantValues,
+    Plane,
+    Section,
+)
+from nautilus_namecodes.code_table import CodeTable
+from nautilus_namecodes.namecodes_dataclasses import (
+    AllCodes,
+    BlockCodes,
+    Codes,
+    PlaneCodes,
+    Range,
+    SectionCodes,
+)
+
+
+class SchemeOverlapError(ValueError):
+    """Raised when a plane would grow into the plane after it."""
+
+
+@dataclass(frozen=True)
+class IncrementalUpdate:
+    """The result of changing a section.
+
+    'moved' maps the old to the new codepoint of every code that kept its
+    name but was shifted, 'added' and 'removed' are the codes of the
+    changed section that are new or gone."""
+
+    all_codes: AllCodes
+    moved: Dict[int, int] = field(default_factory=dict)
+    added: Dict[int, str] = field(default_factory=dict)
+    removed: Dict[int, str] = field(default_factory=dict)
+
+
+def _shift_range(_range: Range, delta: int) -> Range:
+    return Range(_range.stop + delta, _range.start + delta, _range.step)
+
+
+def _shift_section(section_codes: SectionCodes, delta: int) -> SectionCodes:
+    return SectionCodes(
+        name=section_codes.name,
+        description=section_codes.description,
+        codepoints_allocated=_shift_range(section_codes.codepoints_allocated, delta),
+        codes=CodeTable.concat([section_codes.codes]).shifted(delta),
+    )
+
+
+def _block_codes(block: Block, start: int, sections: List[SectionCodes]) -> BlockCodes:
+    return BlockCodes(  # pylint: disable=no-value-for-parameter
+        name=block.name,
+        description=block.description,
+        codepoints_allocated=block.get_layout(start).codepoints_allocated,
+        sections=sections,
+    )
+
+
+class IncrementalBuilder:
+    """Build a scheme once, then rebuild it a section at a time."""
+
+    def __init__(
+        self,
+        planes: Iterable[Tuple[int, Plane]],
+        *,
+        name: str,
+        description: Optional[str],
+        scheme_version: str,
+    ) -> None:
+        self._name: str = name
+        self._description: Optional[str] = description
+        self._scheme_version: str = scheme_version
+
+        self._starts: List[int] = []
+        self._planes: List[Plane] = []
+        self._plane_codes: List[PlaneCodes] = []
+
+        start: int
+        plane: Plane
+        for start, plane in sorted(planes, key=lambda item: item[0]):
+            # Copy the planes and blocks, so that the builder owns what it changes.
+            plane = copy.copy(plane)
+            plane.blocks = [copy.copy(block) for block in plane.blocks]
+            for block in plane.blocks:
+                block.sections = list(block.sections)
+
+            self._starts.append(start)
+            self._planes.append(plane)
+            self._plane_codes.append(plane.get_plane_codes(start))
+
+        self._check_overlaps(self._plane_codes)
+        self._all_codes: AllCodes = self._make_all_codes()
+
+    @property
+    def all_codes(self) -> AllCodes:
+        """The codes of the scheme, as last built."""
+        return self._all_codes
+
+    def _check_overlaps(self, plane_codes: List[PlaneCodes]) -> None:
+        before: PlaneCodes
+        after: PlaneCodes
+        for before, after in zip(plane_codes, plane_codes[1:]):
+            if before.codepoints_allocated.stop >= after.codepoints_allocated.start:
+                raise SchemeOverlapError(
+                    f"plane {before.name!r} overlaps plane {after.name!r}"
+                )
+
+    def _codepoints_allocated(self) -> Range:
+        return Range.mk_range(
+            range(
+                self._plane_codes[0].codepoints_allocated.start,
+                self._plane_codes[-1].codepoints_allocated.stop,
+            )
+        )
+
+    def _make_all_codes(self) -> AllCodes:
+        return AllCodes(  # pylint: disable=no-value-for-parameter
+            name=self._name,
+            description=self._description,
+            codepoints_allocated=self._codepoints_allocated(),
+            planes=list(self._plane_codes),
+            scheme_version=self._scheme_version,
+        )
+
+    def _splice_all_codes(self, old_plane_codes: PlaneCodes, index: int) -> AllCodes:
+        """The AllCodes of the previous build, with the plane at index replaced.
+
+        Not a new AllCodes, that would join the codes of every plane again,
+        and point the codes of the shared nodes at the new table."""
+
+        old_codes: Codes = self._all_codes.codes
+        if not isinstance(old_codes, CodeTable):
+            old_codes = CodeTable.concat([old_codes])
+
+        all_codes: AllCodes = copy.copy(self._all_codes)
+        all_codes.planes = list(self._plane_codes)
+        all_codes.codepoints_allocated = self._codepoints_allocated()
+        all_codes.codes = CodeTable.concat(
+            [
+                old_codes.view(0, old_plane_codes.codepoints_allocated.start - 1),
+                self._plane_codes[index].codes,
+                old_codes.view(
+                    old_plane_codes.codepoints_allocated.stop + 1,
+                    self._all_codes.codepoints_allocated.stop,
+                ),
+            ]
+        )
+        return all_codes
+
+    def _find(self, plane: str, block: str, section: str) -> Tuple[int, int, int]:
+        """Indices of a section, by the names of its plane, block and section."""
+
+        try:
+            plane_index: int = [_plane.name for _plane in self._planes].index(plane)
+            blocks: List[Block] = self._planes[plane_index].blocks
+            block_index: int = [_block.name for _block in blocks].index(block)
+            section_index: int = [
+                _section.name for _section in blocks[block_index].sections
+            ].index(section)
+        except ValueError:
+            raise KeyError((plane, block, section)) from None
+
+        return plane_index, block_index, section_index
+
+    def update_section(  # pylint: disable=too-many-locals
+        self, plane: str, block: str, section: str, values: Iterable[str]
+    ) -> IncrementalUpdate:
+        """Replace the values of a section, and rebuild what depends on it."""
+
+        plane_index, block_index, section_index = self._find(plane, block, section)
+        page_size: int = ConstantValues.page_size
+
+        old_plane: Plane = self._planes[plane_index]
+        old_block: Block = old_plane.blocks[block_index]
+        old_plane_codes: PlaneCodes = self._plane_codes[plane_index]
+        old_block_codes: BlockCodes = old_plane_codes.blocks[block_index]
+        old_section_codes: SectionCodes = old_block_codes.sections[section_index]
+
+        old_section: Section = list(old_block.sections)[section_index]
+        new_section: Section = copy.copy(old_section)
+        new_section.values = list(values)
+
+        new_sections: List[Section] = list(old_block.sections)
+        new_sections[section_index] = new_section
+        new_block: Block = copy.copy(old_block)
+        new_block.sections = new_sections
+
+        new_plane: Plane = copy.copy(old_plane)
+        new_plane.blocks = list(old_plane.blocks)
+        new_plane.blocks[block_index] = new_block
+
+        update: IncrementalUpdate = IncrementalUpdate(all_codes=self._all_codes)
+
+        # The changed section, at its same start.
+        new_section_codes: SectionCodes = new_section.get_section_codes(
+            old_section_codes.codepoints_allocated.start
+        )
+        self._diff_section(old_section_codes, new_section_codes, update)
+
+        # The later sections of the block, shifted by the change in pages.
+        section_delta: int = page_size * (
+            new_section.get_pages_allocated() - old_section.get_pages_allocated()
+        )
+        sections: List[SectionCodes] = list(old_block_codes.sections)
+        sections[section_index] = new_section_codes
+        for index in range(section_index + 1, len(sections)):
+            sections[index] = self._shift(sections[index], section_delta, update)
+
+        blocks: List[BlockCodes] = list(old_plane_codes.blocks)
+        blocks[block_index] = _block_codes(
+            new_block, old_block_codes.codepoints_allocated.start, sections
+        )
+
+        # The later blocks of the plane, shifted by the change in pages.
+        block_delta: int = page_size * (
+            new_block.get_pages_allocated() - old_block.get_pages_allocated()
+        )
+        for index in range(block_index + 1, len(blocks) if block_delta else 0):
+            blocks[index] = _block_codes(
+                new_plane.blocks[index],
+                blocks[index].codepoints_allocated.start + block_delta,
+                [
+                    self._shift(section_codes, block_delta, update)
+                    for section_codes in blocks[index].sections
+                ],
+            )
+
+        plane_codes: List[PlaneCodes] = list(self._plane_codes)
+        plane_codes[plane_index] = PlaneCodes(  # pylint: disable=no-value-for-parameter
+            name=new_plane.name,
+            description=new_plane.description,
+            codepoints_allocated=Range.mk_range(
+                range(
+                    self._starts[plane_index],
+                    self._starts[plane_index]
+                    + new_plane.get_pages_allocated() * page_size
+                    - 1,
+                )
+            ),
+            blocks=blocks,
+        )
+        self._check_overlaps(plane_codes)
+
+        self._planes[plane_index] = new_plane
+        self._plane_codes = plane_codes
+        self._all_codes = self._splice_all_codes(old_plane_codes, plane_index)
+
+        return IncrementalUpdate(
+            all_codes=self._all_codes,
+            moved=update.moved,
+            added=update.added,
+            removed=update.removed,
+        )
+
+    @staticmethod
+    def _shift(
+        section_codes: SectionCodes, delta: int, update: IncrementalUpdate
+    ) -> SectionCodes:
+        if not delta:
+            return section_codes
+
+        codepoint: int
+        for codepoint in section_codes.codes:
+            update.moved[codepoint] = codepoint + delta
+
+        return _shift_section(section_codes, delta)
+
+    @staticmethod
+    def _diff_section(
+        old: SectionCodes, new: SectionCodes, update: IncrementalUpdate
+    ) -> None:
+        old_names: Dict[str, int] = {name: code for code, name in old.codes.items()}
+        new_names: Dict[str, int] = {name: code for code, name in new.codes.items()}
+
+        name: str
+        codepoint: int
+        for name, codepoint in old_names.items():
+            if name not in new_names:
+                update.removed[codepoint] = name
+            elif new_names[name] != codepoint:
+                update.moved[codepoint] = new_names[name]
+
+        for name, codepoint in new_names.items():
+            if name not in old_names:
+                update.added[codepoint] = name
@@ -0,0 +1,146 @@
+"""Shared Cache of the Formatted Code Names
+
+The name of a code is the 'name_value_format' of its section filled with
+the section name and a value. A section gives the same names every time
+it is built, so they are formatted (and interned) once, and every later
+build of the same format, section name and values shares the same tuple
+of names, without making new strings to throw away.
+
+The formats themselves are split once per section name into the text
+before and after the value, so filling a format is a concatenation."""
+
+import string
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+NameKey = Tuple[str, str, Tuple[str, ...]]
+
+
+@dataclass
+class NameCacheStats:
+    """Counts of the cache, 'bytes_saved' is the size of the names shared
+    by cache hits, that would otherwise have been formatted again."""
+
+    hits: int = 0
+    misses: int = 0
+    names_formatted: int = 0
+    bytes_saved: int = 0
+
+
+@lru_cache(maxsize=1024)
+def name_template(name_value_format: str, name: str, /) -> Optional[Tuple[str, str]]:
+    """The text before and after '{value}' of a format filled with a name.
+
+    None if the format has other fields than '{name}' and one '{value}', or
+    uses a conversion or format spec, then it is filled with str.format()."""
+
+    before: str = ""
+    after: Optional[str] = None
+
+    literal: str
+    field: Optional[str]
+    spec: Optional[str]
+    conversion: Optional[str]
+    try:
+        parsed = list(string.Formatter().parse(name_value_format))
+    except ValueError:
+        return None
+
+    for literal, field, spec, conversion in parsed:
+        if after is None:
+            before += literal
+        else:
+            after += literal
+
+        if field is None:
+            continue
+        if spec or conversion:
+            return None
+        if field == "name":
+            if after is None:
+                before += name
+            else:
+                after += name
+        elif field == "value" and after is None:
+            after = ""
+        else:
+            return None
+
+    if after is None:
+        return None
+    return before, after
+
+
+def format_names(
+    name_value_format: str, name: str, values: Iterable[str], /
+) -> Tuple[str, ...]:
+    """Fill the format with the name and each value, interning the names."""
+
+    template: Optional[Tuple[str, str]] = name_template(name_value_format, name)
+
+    if template is None:
+        return tuple(
+            sys.intern(name_value_format.format(name=name, value=value))
+            for value in values
+        )
+
+    before, after = template
+    return tuple(sys.intern(f"{before}{value}{after}") for value in values)
+
+
+class NameCache:
+    """Least recently used cache of the names of the sections.
+
+    The names of up to 'maxsize' sections (a format, name and values) are
+    kept, or of every section if 'maxsize' is None. The cache is shared by
+    the threads building planes in parallel, so it is used under a lock."""
+
+    def __init__(self, maxsize: Optional[int] = 4096) -> None:
+        self.maxsize: Optional[int] = maxsize
+        self.stats: NameCacheStats = NameCacheStats()
+        self._lock: threading.Lock = threading.Lock()
+        # The names of each section, with their size in bytes.
+        self._names: "OrderedDict[NameKey, Tuple[Tuple[str, ...], int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def get_names(
+        self, name_value_format: str, name: str, values: Iterable[str], /
+    ) -> Tuple[str, ...]:
+        """The formatted names of a section, formatted once."""
+
+        key: NameKey = (name_value_format, name, tuple(values))
+
+        with self._lock:
+            cached: Optional[Tuple[Tuple[str, ...], int]] = self._names.get(key)
+
+            if cached is not None:
+                self._names.move_to_end(key)
+                self.stats.hits += 1
+                self.stats.bytes_saved += cached[1]
+                return cached[0]
+
+            names: Tuple[str, ...] = format_names(name_value_format, name, key[2])
+            self.stats.misses += 1
+            self.stats.names_formatted += len(names)
+
+            self._names[key] = (names, sum(map(sys.getsizeof, names)))
+            if self.maxsize is not None and len(self._names) > self.maxsize:
+                self._names.popitem(last=False)
+
+        return names
+
+    def clear(self) -> None:
+        """Empty the cache, and reset its stats."""
+
+        with self._lock:
+            self._names.clear()
+            self.stats = NameCacheStats()
+
+
+name_cache: NameCache = NameCache()
@@ -1,10 +1,23 @@
 """Data Classes used to build Namecodes"""
 
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import InitVar, dataclass
-from itertools import accumulate
-from typing import Iterable, Optional
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+from nautilus_namecodes.builder.name_cache import name_cache
+from nautilus_namecodes.code_table import CodeTable
 from nautilus_namecodes.namecodes_dataclasses import (
     BlockCodes,
     PlaneCodes,
@@ -12,6 +25,8 @@ from nautilus_namecodes.namecodes_dataclasses import (
     SectionCodes,
 )
 
+CachedT = TypeVar("CachedT")
+
 
 @dataclass(frozen=True)
 class ConstantValues:
@@ -20,6 +35,22 @@ class ConstantValues:
     page_size: int = 0x010
 
 
+@dataclass(frozen=True)
+class PageLayout:
+    """Starting codepoint and allocated pages of a node, and of its children."""
+
+    start: int
+    pages: int
+    children: Tuple["PageLayout", ...] = ()
+
+    @property
+    def codepoints_allocated(self) -> Range:
+        """The allocated range, as used by the code data classes."""
+        return Range.mk_range(
+            range(self.start, self.start + self.pages * ConstantValues.page_size - 1)
+        )
+
+
 @dataclass
 class CommonValues:
     """Attributes that are common all generation data classes."""
@@ -28,13 +59,135 @@ class CommonValues:
     description: Optional[str]
 
 
-class CommonMethods(ABC):  # pylint: disable=too-few-public-methods
-    """Methods that are common to all generation data classes."""
+class _TrackedList(list):
+    """A list that drops the cached allocations of its owners when changed."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.owners: Dict[int, "weakref.ref[CommonMethods]"] = {}
+
+    def changed(self) -> None:
+        """Drop the cached allocations of the nodes holding this list."""
+
+        owner: "weakref.ref[CommonMethods]"
+        for owner in list(self.owners.values()):
+            node: Optional[CommonMethods] = owner()
+            if node is not None:
+                node.clear_allocations()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The owners register again when the copy is assigned to them.
+        return (type(self), (list(self),))
+
+
+def _tracked(name: str) -> Callable[..., Any]:
+    method: Callable[..., Any] = getattr(list, name)
+
+    def tracked(self: _TrackedList, *args: Any, **kwargs: Any) -> Any:
+        result: Any = method(self, *args, **kwargs)
+        self.changed()
+        return result
+
+    return tracked
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_TrackedList, _name, _tracked(_name))
+
+
+class CommonMethods(ABC):
+    """Methods that are common to all generation data classes.
+
+    The allocations of a node are cached until one of their inputs changes:
+    the lists of values, sections and blocks are held as (copied) lists
+    that tell the nodes holding them when they are changed in place, and a
+    node tells its parents when it changes, so a cached allocation is found
+    in O(1). A list is changed through the attribute of its node, not the
+    list first given to the node."""
+
+    # The attributes that the allocations are computed from.
+    _allocation_attributes: ClassVar[FrozenSet[str]] = frozenset()
+
+    # The attribute holding the child nodes, if any.
+    _children_attribute: ClassVar[Optional[str]] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._allocation_attributes:
+            if isinstance(value, list):
+                if not isinstance(value, _TrackedList):
+                    value = _TrackedList(value)
+                value.owners[id(self)] = weakref.ref(self)
+            super().__setattr__(name, value)
+            self.clear_allocations()
+        else:
+            super().__setattr__(name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and pickles start without cached allocations, or parents.
+        state: Dict[str, Any] = dict(self.__dict__)
+        state.pop("_allocations", None)
+        state.pop("_parents", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        name: str
+        value: Any
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def clear_allocations(self) -> None:
+        """Drop the cached allocations of the node, and of its parents."""
+
+        self.__dict__.pop("_allocations", None)
+
+        parent: "weakref.ref[CommonMethods]"
+        for parent in list(self.__dict__.get("_parents", {}).values()):
+            node: Optional[CommonMethods] = parent()
+            if node is not None:
+                node.clear_allocations()
+
+    def _cached(self, key: Hashable, compute: Callable[[], CachedT]) -> CachedT:
+        """Compute a value once, until the allocations of the node change."""
+
+        cache: Optional[Dict[Hashable, Any]] = self.__dict__.get("_allocations")
+        if cache is None:
+            cache = {}
+            self.__dict__["_allocations"] = cache
+
+            # The children (as of now) tell this node when they change.
+            if self._children_attribute is not None:
+                child: CommonMethods
+                for child in getattr(self, self._children_attribute):
+                    child.__dict__.setdefault("_parents", {})[id(self)] = weakref.ref(
+                        self
+                    )
+
+        if key not in cache:
+            cache[key] = compute()
+        value: CachedT = cache[key]
+        return value
 
     @abstractmethod
     def get_pages_allocated(self) -> int:
         """Return the number of allocated pages."""
 
+    @abstractmethod
+    def get_layout(self, starting_codepoint: int, /) -> PageLayout:
+        """Return the layout of the node, and all of its children, in one pass."""
+
 
 @dataclass
 class Section(CommonValues, CommonMethods):
@@ -43,6 +196,8 @@ class Section(CommonValues, CommonMethods):
     values: list[str]
     name_value_format: str = "({name}) {value}"
 
+    _allocation_attributes: ClassVar[FrozenSet[str]] = frozenset({"values"})
+
     def get_pages_allocated(self) -> int:
         _number_of_items: int = len(self.values)
 
@@ -56,6 +211,9 @@ class Section(CommonValues, CommonMethods):
 
         return _pages_allocated
 
+    def get_layout(self, starting_codepoint: int, /) -> PageLayout:
+        return PageLayout(starting_codepoint, self.get_pages_allocated())
+
     def get_section_codes(self, starting_codepoint: int, /) -> SectionCodes:
         """Generate codes and return the filled SectionsCode Data Class"""
 
@@ -66,16 +224,11 @@ class Section(CommonValues, CommonMethods):
             - 1,
         )
 
-        _used_codepoints: range = range(
-            starting_codepoint, starting_codepoint + len(self.values)
+        _values_formated: Tuple[str, ...] = name_cache.get_names(
+            self.name_value_format, self.name, self.values
         )
 
-        _values_formated: list[str] = [
-            self.name_value_format.format(name=self.name, value=value)
-            for value in self.values
-        ]
-
-        _codes: dict[int, str] = dict(zip(_used_codepoints, _values_formated))
+        _codes: CodeTable = CodeTable.from_names(starting_codepoint, _values_formated)
 
         return SectionCodes(
             name=self.name,
@@ -104,48 +257,67 @@ class Block(CommonValues, CommonMethods):
     sections: Iterable[Section]
     pages_minimum: InitVar[int] = 0
 
+    _allocation_attributes: ClassVar[FrozenSet[str]] = frozenset(
+        {"sections", "_Block__pages_minimum"}
+    )
+    _children_attribute: ClassVar[Optional[str]] = "sections"
+
     def __post_init__(self, pages_minimum: int) -> None:
         self.__pages_minimum = pages_minimum
 
     def get_page_allocations(self) -> list[int]:
         """Get the number of allocated pages per Section"""
 
-        return [section.get_pages_allocated() for section in self.sections]
+        return list(
+            self._cached(
+                "page_allocations",
+                lambda: tuple(
+                    section.get_pages_allocated() for section in self.sections
+                ),
+            )
+        )
 
     def get_pages_allocated(self) -> int:
-        _pages_used: int = sum(self.get_page_allocations())
-        _pages_min: int = self.__pages_minimum
-        return (_pages_used, _pages_min)[_pages_used < _pages_min]
+        def pages_allocated() -> int:
+            _pages_used: int = sum(self.get_page_allocations())
+            _pages_min: int = self.__pages_minimum
+            return (_pages_used, _pages_min)[_pages_used < _pages_min]
+
+        return self._cached("pages_allocated", pages_allocated)
+
+    def get_layout(self, starting_codepoint: int, /) -> PageLayout:
+        def layout() -> PageLayout:
+            _sections: list[PageLayout] = []
+            _offset: int = starting_codepoint
+
+            section: Section
+            for section in self.sections:
+                _sections.append(section.get_layout(_offset))
+                _offset += _sections[-1].pages * ConstantValues.page_size
+
+            return PageLayout(
+                starting_codepoint, self.get_pages_allocated(), tuple(_sections)
+            )
+
+        return self._cached(("layout", starting_codepoint), layout)
 
     def get_block_codes(self, starting_codepoint: int, /) -> BlockCodes:
         """Generate codes and return the filled BlockCodes Data Class"""
 
-        _section_offsets: list[int] = list(
-            accumulate([0] + self.get_page_allocations())
-        )
+        return self.get_block_codes_from_layout(self.get_layout(starting_codepoint))
 
-        _sections_and_offsets: list[tuple[Section, int]] = list(
-            zip(self.sections, _section_offsets)
-        )
+    def get_block_codes_from_layout(self, layout: PageLayout, /) -> BlockCodes:
+        """Generate codes at a layout given by get_layout()"""
 
         _section_codes: list[SectionCodes] = [
-            section_and_offset[0].get_section_codes(
-                starting_codepoint + section_and_offset[1] * ConstantValues.page_size
-            )
-            for section_and_offset in _sections_and_offsets
+            section.get_section_codes(section_layout.start)
+            for section, section_layout in zip(self.sections, layout.children)
         ]
 
-        _codepoints_allocated = range(
-            starting_codepoint,
-            starting_codepoint
-            + self.get_pages_allocated() * ConstantValues.page_size
-            - 1,
-        )
-
         _block_codes: BlockCodes = BlockCodes(  # pylint: disable=no-value-for-parameter
             name=self.name,
             description=self.description,
-            codepoints_allocated=Range.mk_range(_codepoints_allocated),
+            codepoints_allocated=layout.codepoints_allocated,
             sections=_section_codes,
         )
 
@@ -158,51 +330,64 @@ class Plane(CommonValues, CommonMethods):
 
     blocks: list[Block]
 
+    _allocation_attributes: ClassVar[FrozenSet[str]] = frozenset({"blocks"})
+    _children_attribute: ClassVar[Optional[str]] = "blocks"
+
     def get_block_page_allocations(self) -> list[int]:
         """Get the number of allocated pages per Block"""
 
-        block: Block
-        allocations: list[int] = []
+        return list(
+            self._cached(
+                "block_page_allocations",
+                lambda: tuple(block.get_pages_allocated() for block in self.blocks),
+            )
+        )
+
+    def get_pages_allocated(self) -> int:
+        return self._cached(
+            "pages_allocated", lambda: sum(self.get_block_page_allocations())
+        )
 
-        for block in self.blocks:
-            allocations.append(block.get_pages_allocated())
+    def get_layout(self, starting_codepoint: int, /) -> PageLayout:
+        def layout() -> PageLayout:
+            _blocks: list[PageLayout] = []
+            _offset: int = starting_codepoint
 
-        return allocations
+            block: Block
+            for block in self.blocks:
+                _blocks.append(block.get_layout(_offset))
+                _offset += _blocks[-1].pages * ConstantValues.page_size
 
-    def get_pages_allocated(self) -> int:
-        return sum(self.get_block_page_allocations())
+            return PageLayout(
+                starting_codepoint,
+                sum(_block.pages for _block in _blocks),
+                tuple(_blocks),
+            )
+
+        return self._cached(("layout", starting_codepoint), layout)
 
     def get_plane_codes(self, starting_codepoint: int, /) -> PlaneCodes:
         """Generate codes and return the filled PlaneCodes Data Class"""
 
-        _block_offsets: list[int] = list(
-            accumulate([0] + self.get_block_page_allocations())
-        )
-        # print(_section_starting_pages)
-
-        _blocks_and_offsets: list[tuple[Block, int]] = list(
-            zip(self.blocks, _block_offsets)
-        )
+        _layout: PageLayout = self.get_layout(starting_codepoint)
 
         _block_codes: list[BlockCodes] = [
-            block_and_offset[0].get_block_codes(
-                starting_codepoint + block_and_offset[1] * ConstantValues.page_size
-            )
-            for block_and_offset in _blocks_and_offsets
+            block.get_block_codes_from_layout(block_layout)
+            for block, block_layout in zip(self.blocks, _layout.children)
         ]
 
-        _codepoints_allocated = range(
-            starting_codepoint,
-            starting_codepoint
-            + self.get_pages_allocated() * ConstantValues.page_size
-            - 1,
-        )
+        return self.get_plane_codes_from_blocks(_layout, _block_codes)
+
+    def get_plane_codes_from_blocks(
+        self, layout: PageLayout, block_codes: list[BlockCodes], /
+    ) -> PlaneCodes:
+        """Return the PlaneCodes of blocks generated at a layout given by get_layout()"""
 
         _plane_codes: PlaneCodes = PlaneCodes(  # pylint: disable=no-value-for-parameter
             name=self.name,
             description=self.description,
-            codepoints_allocated=Range.mk_range(_codepoints_allocated),
-            blocks=_block_codes,
+            codepoints_allocated=layout.codepoints_allocated,
+            blocks=block_codes,
         )
 
         return _plane_codes
@@ -0,0 +1,82 @@
+"""Generate the Planes of a Scheme in a Process Pool
+
+The layout of every plane is computed first, then every block is
+independent: the blocks of all the planes are generated in a pool and
+put back together, in order, into their planes. The codes are the same
+as those of Plane.get_plane_codes(), whatever the number of workers."""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from nautilus_namecodes.builder.namecode_builder_dataclasses import (
+    Block,
+    PageLayout,
+    Plane,
+)
+from nautilus_namecodes.namecodes_dataclasses import BlockCodes, PlaneCodes
+
+
+def _block_codes(block: Block, layout: PageLayout) -> BlockCodes:
+    """Generate a block in a worker (a module function, so it can be pickled)."""
+    return block.get_block_codes_from_layout(layout)
+
+
+def _chunksize(tasks: int, workers: int) -> int:
+    """Send the blocks in a few chunks per worker, to amortize the pickling."""
+    return max(1, tasks // (workers * 4))
+
+
+def build_planes_parallel(
+    planes: Iterable[Tuple[int, Plane]],
+    /,
+    *,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[PlaneCodes]:
+    """Generate the PlaneCodes of each (starting codepoint, plane).
+
+    The blocks are generated by the given executor, or else by a process
+    pool of max_workers (by default, one per cpu)."""
+
+    _planes: List[Tuple[Plane, PageLayout]] = [
+        (plane, plane.get_layout(start)) for start, plane in planes
+    ]
+
+    blocks: List[Block] = []
+    layouts: List[PageLayout] = []
+
+    plane: Plane
+    layout: PageLayout
+    for plane, layout in _planes:
+        blocks.extend(plane.blocks)
+        layouts.extend(layout.children)
+
+    block_codes: List[BlockCodes]
+    if executor is not None:
+        block_codes = list(executor.map(_block_codes, blocks, layouts))
+    else:
+        workers: int = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            block_codes = list(
+                pool.map(
+                    _block_codes,
+                    blocks,
+                    layouts,
+                    chunksize=_chunksize(len(blocks), workers),
+                )
+            )
+
+    plane_codes: List[PlaneCodes] = []
+    offset: int = 0
+
+    for plane, layout in _planes:
+        count: int = len(layout.children)
+        plane_codes.append(
+            plane.get_plane_codes_from_blocks(
+                layout, block_codes[offset : offset + count]
+            )
+        )
+        offset += count
+
+    return plane_codes
@@ -0,0 +1,139 @@
+"""Synthetic Schemes of Configurable Size, for Scale Testing
+
+The planes, blocks and sections are built with the same builder
+dataclasses as the real scheme, so allocation, merging and rendering can
+be measured at any size. A synthetic scheme can be registered as any
+other scheme version:
+
+    namecodes_registry.register(
+        shape.scheme_version, partial(build_synthetic_scheme, shape)
+    )
+"""
+
+from dataclasses import Field, dataclass, fields
+from typing import List
+
+from nautilus_namecodes.builder.namecode_builder_dataclasses import (
+    Block,
+    ConstantValues,
+    Plane,
+    Section,
+)
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, PlaneCodes, Range
+
+
+@dataclass(frozen=True)
+class SyntheticShape:
+    """The size of a synthetic scheme.
+
+    Each of the counts must be at least one. With 'ragged' the sections
+    hold from one value up to 'values_per_section' values (in a repeating
+    pattern), so the pages allocated vary between sections, blocks and
+    planes."""
+
+    planes: int = 4
+    blocks_per_plane: int = 16
+    sections_per_block: int = 4
+    values_per_section: int = 100
+    ragged: bool = False
+    scheme_version: str = "synthetic"
+
+    def __post_init__(self) -> None:
+        count: Field
+        for count in fields(self):
+            if count.type is int and getattr(self, count.name) < 1:
+                raise ValueError(
+                    f"synthetic shape needs at least one of {count.name}: "
+                    f"{getattr(self, count.name)!r}"
+                )
+
+    def section_size(self, index: int, /) -> int:
+        """The number of values of the index'th section of the scheme."""
+
+        if not self.ragged:
+            return self.values_per_section
+        return 1 + (index * 7919) % self.values_per_section
+
+    @property
+    def codes(self) -> int:
+        """The number of codes of the scheme."""
+
+        sections: int = self.planes * self.blocks_per_plane * self.sections_per_block
+        return sum(self.section_size(index) for index in range(sections))
+
+
+def synthetic_planes(shape: SyntheticShape) -> List[Plane]:
+    """The builder planes of a synthetic scheme."""
+
+    planes: List[Plane] = []
+    section_index: int = 0
+
+    plane: int
+    for plane in range(shape.planes):
+        blocks: List[Block] = []
+
+        block: int
+        for block in range(shape.blocks_per_plane):
+            sections: List[Section] = []
+
+            section: int
+            for section in range(shape.sections_per_block):
+                sections.append(
+                    Section(
+                        name=f"section{plane:X}_{block:X}_{section:X}",
+                        description=None,
+                        values=[
+                            f"value{value:05d}"
+                            for value in range(shape.section_size(section_index))
+                        ],
+                    )
+                )
+                section_index += 1
+
+            blocks.append(
+                Block(
+                    name=f"Block{plane:X}_{block:X}",
+                    description=f"Synthetic Block {block} of Plane {plane}",
+                    sections=sections,
+                )
+            )
+
+        planes.append(
+            Plane(
+                name=f"PLANE{plane:X}",
+                description=f"Synthetic Plane {plane}",
+                blocks=blocks,
+            )
+        )
+
+    return planes
+
+
+def build_synthetic_scheme(shape: SyntheticShape) -> AllCodes:
+    """Build the codes of a synthetic scheme, the planes one after another."""
+
+    planecodes: List[PlaneCodes] = []
+    start: int = 0
+
+    plane: Plane
+    for plane in synthetic_planes(shape):
+        planecodes.append(plane.get_plane_codes(start))
+        start += plane.get_pages_allocated() * ConstantValues.page_size
+
+    return AllCodes(  # pylint: disable=no-value-for-parameter
+        name="Synthetic Namecodes",
+        description=f"Synthetic Scheme of {shape.codes} Codes",
+        codepoints_allocated=Range.mk_range(
+            range(
+                planecodes[0].codepoints_allocated.start,
+                planecodes[-1].codepoints_allocated.stop,
+            )
+        ),
+        planes=planecodes,
+        scheme_version=shape.scheme_version,
+    )
+
+
+if __name__ == "__main__":
+    all_codes: AllCodes = build_synthetic_scheme(SyntheticShape())
+    print(all_codes.description, all_codes.gen_output_range())
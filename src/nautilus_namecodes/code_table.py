@@ -0,0 +1,214 @@
+"""Compact Array Backed Table of Codes"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+
+def _typecode(stop: int) -> str:
+    """Smallest array typecode that can hold codepoints up to stop."""
+    return "H" if stop <= 0xFFFF else "L"
+
+
+class _CodeTableItems(ItemsView):
+    """Items of a CodeTable, iterated without a lookup per item."""
+
+    _mapping: "CodeTable"
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        table: "CodeTable" = self._mapping
+        return zip(table.codepoints[table.low : table.high], table.slice_names())
+
+
+class _CodeTableValues(ValuesView):  # pylint: disable=too-few-public-methods
+    """Values of a CodeTable, iterated without a lookup per value."""
+
+    _mapping: "CodeTable"
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mapping.slice_names())
+
+
+class CodeTable(Mapping):
+    """Read-only mapping of codepoints to names.
+
+    The codepoints are held sorted in a single array, with the names in a
+    matching tuple of interned strings. Views returned by view() share the
+    same array and tuple and only hold their bounds, so finding a range of
+    codes is a bisect. Looking up a code is an index into the positions of
+    the codepoints, made on the first lookup and shared with the views."""
+
+    __slots__ = ("codepoints", "names", "low", "high", "_positions")
+
+    codepoints: array
+    names: Tuple[str, ...]
+    low: int
+    high: int
+    _positions: Dict[int, int]
+
+    def __init__(
+        self,
+        codepoints: array,
+        names: Tuple[str, ...],
+        low: int = 0,
+        high: Optional[int] = None,
+    ) -> None:
+        self.codepoints = codepoints
+        self.names = names
+        self.low = low
+        self.high = len(codepoints) if high is None else high
+        # The index of each codepoint in the arrays, filled on the first
+        # lookup, and shared by the table and its views.
+        self._positions = {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[int, str]], /) -> "CodeTable":
+        """Make a table from (codepoint, name) pairs in any order."""
+
+        _items: list[Tuple[int, str]] = sorted(items)
+        _stop: int = _items[-1][0] if _items else 0
+
+        return cls(
+            array(_typecode(_stop), [item[0] for item in _items]),
+            tuple(sys.intern(item[1]) for item in _items),
+        )
+
+    @classmethod
+    def from_names(cls, start: int, names: Tuple[str, ...], /) -> "CodeTable":
+        """Make a table of consecutive codepoints from start, sharing the
+        tuple of (already interned) names."""
+
+        return cls(
+            array(_typecode(start + len(names)), range(start, start + len(names))),
+            names,
+        )
+
+    @classmethod
+    def concat(cls, tables: Iterable[Mapping], /) -> "CodeTable":
+        """Join tables (or any mappings of codes) into a new table.
+
+        Tables with ascending, non-overlapping codepoints are joined by
+        copying their arrays, anything else falls back to sorting."""
+
+        _tables: list[Mapping] = [table for table in tables if table]
+        _code_tables: list[CodeTable] = [
+            table for table in _tables if isinstance(table, CodeTable)
+        ]
+
+        if len(_code_tables) != len(_tables):
+            return cls.from_items(item for table in _tables for item in table.items())
+
+        _stop: int = max((table.last for table in _code_tables), default=0)
+        codepoints: array = array(_typecode(_stop))
+        names: list[str] = []
+
+        table: CodeTable
+        for table in sorted(_code_tables, key=lambda table: table.first):
+            if codepoints and table.first <= codepoints[-1]:
+                return cls.from_items(
+                    item for table in _tables for item in table.items()
+                )
+            if table.codepoints.typecode == codepoints.typecode:
+                codepoints.extend(table.codepoints[table.low : table.high])
+            else:
+                codepoints.extend(iter(table))
+            names.extend(table.names[table.low : table.high])
+
+        return cls(codepoints, tuple(names))
+
+    @property
+    def first(self) -> int:
+        """The lowest codepoint of a non-empty table."""
+        return self.codepoints[self.low]
+
+    @property
+    def last(self) -> int:
+        """The highest codepoint of a non-empty table."""
+        return self.codepoints[self.high - 1]
+
+    def view(self, start: int, stop: int, /) -> "CodeTable":
+        """View of the codes from start to stop (inclusive), sharing this table."""
+
+        _view: CodeTable = CodeTable(
+            self.codepoints,
+            self.names,
+            bisect_left(self.codepoints, start, self.low, self.high),
+            bisect_right(self.codepoints, stop, self.low, self.high),
+        )
+        _view._positions = self._positions  # pylint: disable=protected-access
+        return _view
+
+    def shifted(self, delta: int, /) -> "CodeTable":
+        """Copy of the codes, with every codepoint moved by delta."""
+
+        _codepoints: array = self.codepoints[self.low : self.high]
+        _stop: int = _codepoints[-1] + delta if _codepoints else 0
+
+        return CodeTable(
+            array(_typecode(_stop), [codepoint + delta for codepoint in _codepoints]),
+            self.names[self.low : self.high],
+        )
+
+    def _fill_positions(self) -> bool:
+        """Fill the positions on the first lookup, False if already filled."""
+
+        if self._positions or not self.codepoints:
+            return False
+        # Made whole, then added in one update, so other threads never see
+        # some of the positions.
+        positions: Dict[int, int] = {
+            codepoint: index for index, codepoint in enumerate(self.codepoints)
+        }
+        self._positions.update(positions)
+        return True
+
+    def slice_names(self) -> Tuple[str, ...]:
+        """The names of this table, in order."""
+
+        if self.low == 0 and self.high == len(self.names):
+            return self.names
+        return self.names[self.low : self.high]
+
+    def __getitem__(self, codepoint: int) -> str:
+        try:
+            index: int = self._positions[codepoint]
+        except KeyError:
+            if self._fill_positions():
+                return self[codepoint]
+            raise
+        if self.low <= index < self.high:
+            return self.names[index]
+        raise KeyError(codepoint)
+
+    def __contains__(self, codepoint: object) -> bool:
+        if not isinstance(codepoint, int):
+            return False
+        self._fill_positions()
+        return self.low <= self._positions.get(codepoint, -1) < self.high
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.codepoints[self.low : self.high])
+
+    def __len__(self) -> int:
+        return self.high - self.low
+
+    def items(self) -> ItemsView:
+        return _CodeTableItems(self)
+
+    def values(self) -> ValuesView:
+        return _CodeTableValues(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Without the positions, that are made again on the first lookup.
+        return (type(self), (self.codepoints, self.names, self.low, self.high))
+
+    def __copy__(self) -> "CodeTable":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "CodeTable":
+        return self
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
@@ -0,0 +1,162 @@
+"""Decode Batches of Namecode Filenames into Columnar Results"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+from nautilus_namecodes.codec.filename_codec import FilenameCodec, NamecodeCodecError
+from nautilus_namecodes.scheme.registry import (
+    DEFAULT_SCHEME_VERSION,
+    namecodes_registry,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+PADDING: int = -1
+
+
+@dataclass(frozen=True)
+class BatchDecodeResult:
+    """Columnar result of decoding a batch of filenames.
+
+    The codepoints are a two dimensional array, one row per filename, with
+    the unused cells (and every cell of an invalid row) set to PADDING.
+    With NumPy these are an int32 and a bool ndarray, otherwise lists."""
+
+    codepoints: Any
+    valid: Any
+
+    @property
+    def rows(self) -> int:
+        """The number of decoded filenames."""
+        return len(self.valid)
+
+
+def _decode_python(stems: List[str], codec: FilenameCodec) -> BatchDecodeResult:
+    """Decode each filename stem in turn with the codec."""
+
+    decoded: List[Tuple[int, ...]] = []
+    valid: List[bool] = []
+
+    stem: str
+    for stem in stems:
+        try:
+            decoded.append(codec.decode(stem))
+            valid.append(True)
+        except NamecodeCodecError:
+            decoded.append(())
+            valid.append(False)
+
+    columns: int = max((len(codes) for codes in decoded), default=0)
+    codepoints: List[List[int]] = [
+        list(codes) + [PADDING] * (columns - len(codes)) for codes in decoded
+    ]
+
+    return BatchDecodeResult(codepoints=codepoints, valid=valid)
+
+
+def _hex_digits(stems: Any, width: int, columns: int) -> Any:
+    """Value of each hex digit of the stems, -1 for any other character."""
+
+    rows: int = len(stems)
+
+    # Each character as a unicode codepoint, NUL padded to the widest stem.
+    chars = numpy.zeros((rows, max(columns, 1) * width), dtype=numpy.uint32)
+    stem_chars = stems.view(numpy.uint32).reshape((rows, -1))
+    used: int = min(stem_chars.shape[1], chars.shape[1])
+    chars[:, :used] = stem_chars[:, :used]
+
+    table = numpy.full(0x80, -1, dtype=numpy.int32)
+    for digit in "0123456789ABCDEFabcdef":
+        table[ord(digit)] = int(digit, 16)
+
+    digits = table[numpy.minimum(chars[:, : columns * width], 0x7F)]
+    digits[chars[:, : columns * width] >= 0x80] = -1
+
+    return digits
+
+
+def _is_allocated(codepoints: Any, codec: FilenameCodec) -> Any:
+    """Range comparisons against the contiguous allocated ranges."""
+
+    ranges = numpy.array(codec.allocated_ranges, dtype=numpy.int32).reshape((-1, 2))
+    index = numpy.searchsorted(ranges[:, 0], codepoints, side="right") - 1
+
+    return (index >= 0) & (codepoints <= ranges[numpy.maximum(index, 0), 1])
+
+
+def _decode_numpy(stems: Any, codec: FilenameCodec) -> BatchDecodeResult:
+    """Decode all the filename stems at once with array operations."""
+
+    width: int = codec.width
+    rows: int = len(stems)
+
+    lengths = numpy.char.str_len(stems)
+    columns: int = int(lengths.max()) // width
+
+    digits = _hex_digits(stems, width, columns)
+
+    cells_used = numpy.arange(columns) < (lengths // width)[:, numpy.newaxis]
+
+    wellformed = (lengths % width == 0) & (lengths <= columns * width)
+    wellformed &= ~numpy.any(
+        (digits < 0) & numpy.repeat(cells_used, width, axis=1), axis=1
+    )
+
+    weights = 16 ** numpy.arange(width - 1, -1, -1, dtype=numpy.int32)
+    codepoints = (
+        numpy.maximum(digits, 0).reshape((rows, columns, width)) @ weights
+    ).astype(numpy.int32)
+
+    valid = wellformed & numpy.all(
+        _is_allocated(codepoints, codec) | ~cells_used, axis=1
+    )
+    valid &= numpy.all(
+        (codepoints[:, 1:] > codepoints[:, :-1]) | ~cells_used[:, 1:], axis=1
+    )
+
+    codepoints[~(cells_used & valid[:, numpy.newaxis])] = PADDING
+
+    return BatchDecodeResult(codepoints=codepoints, valid=valid)
+
+
+def batch_decode(
+    filenames: Iterable[str],
+    /,
+    codec: Optional[FilenameCodec] = None,
+    *,
+    use_numpy: Optional[bool] = None,
+) -> BatchDecodeResult:
+    """Decode many filenames, ignoring any directory and extension.
+
+    NumPy is used when it is installed, unless use_numpy is False. A
+    NumPy array of strings is accepted as well as any iterable of str."""
+
+    if codec is None:
+        codec = namecodes_registry.get_derived(FilenameCodec, DEFAULT_SCHEME_VERSION)
+
+    if use_numpy is None:
+        use_numpy = numpy is not None
+
+    if use_numpy:
+        if numpy is None:
+            raise ImportError("numpy is required for use_numpy=True")
+
+        _names = numpy.asarray(
+            filenames if isinstance(filenames, numpy.ndarray) else list(filenames),
+            dtype=numpy.str_,
+        ).reshape(-1)
+        if not _names.size:
+            return BatchDecodeResult(
+                codepoints=numpy.zeros((0, 0), dtype=numpy.int32),
+                valid=numpy.zeros(0, dtype=bool),
+            )
+        _stems = numpy.char.partition(numpy.char.rpartition(_names, "/")[:, 2], ".")
+        return _decode_numpy(numpy.ascontiguousarray(_stems[:, 0]), codec)
+
+    return _decode_python(
+        [filename.rpartition("/")[2].partition(".")[0] for filename in filenames],
+        codec,
+    )
@@ -0,0 +1,130 @@
+"""Encode and Decode Namecodes as Filename Tokens"""
+
+import re
+from typing import Iterable, List, Pattern, Tuple
+
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, SectionCodes
+from nautilus_namecodes.scheme.registry import (
+    DEFAULT_SCHEME_VERSION,
+    namecodes_registry,
+)
+
+_HEX_TOKEN: Pattern[str] = re.compile(r"[0-9A-Fa-f]*")
+
+
+class NamecodeCodecError(ValueError):
+    """Raised when codes cannot be encoded, or a token cannot be decoded."""
+
+
+class FilenameCodec:
+    """Fixed-width hexadecimal encoding of a set of namecodes.
+
+    Each codepoint is written as upper-case hexadecimal, padded to the
+    width of the highest allocated codepoint (at least three digits), and
+    the codepoints are concatenated in ascending order, e.g. the codes
+    0x001, 0x030 and 0x891 encode to "001030891".
+
+    Only codepoints that lie within the allocated range of a section may
+    be encoded or decoded."""
+
+    def __init__(self, all_codes: AllCodes) -> None:
+        _stop: int = all_codes.codepoints_allocated.stop
+
+        self._width: int = max(3, len(f"{_stop:X}"))
+        self._format: str = f"0{self._width}X"
+
+        # The allocated ranges include their stop codepoint.
+        self._allocated: bytearray = bytearray(_stop + 1)
+
+        self._ranges: List[Tuple[int, int]] = []
+
+        section: SectionCodes
+        for _, _, section in all_codes.walk_sections():
+            _start: int = section.codepoints_allocated.start
+            _end: int = section.codepoints_allocated.stop + 1
+            self._allocated[_start:_end] = b"\x01" * (_end - _start)
+            self._ranges.append((_start, _end - 1))
+
+        # Merge the sections into contiguous ranges.
+        self._ranges.sort()
+        _merged: List[Tuple[int, int]] = []
+        _range: Tuple[int, int]
+        for _range in self._ranges:
+            if _merged and _merged[-1][1] >= _range[0] - 1:
+                _merged[-1] = (_merged[-1][0], max(_merged[-1][1], _range[1]))
+            else:
+                _merged.append(_range)
+        self._ranges = _merged
+
+    @property
+    def allocated_ranges(self) -> List[Tuple[int, int]]:
+        """The contiguous allocated ranges, as inclusive (start, stop) pairs."""
+        return list(self._ranges)
+
+    @property
+    def width(self) -> int:
+        """The number of hexadecimal digits of each encoded codepoint."""
+        return self._width
+
+    def is_allocated(self, codepoint: int, /) -> bool:
+        """Test if the codepoint lies within the allocated range of a section."""
+        return 0 <= codepoint < len(self._allocated) and bool(
+            self._allocated[codepoint]
+        )
+
+    def encode(self, codes: Iterable[int], /) -> str:
+        """Encode a set of codepoints as a filename token."""
+
+        _codes: list[int] = sorted(set(codes))
+
+        codepoint: int
+        for codepoint in _codes:
+            if not self.is_allocated(codepoint):
+                raise NamecodeCodecError(f"codepoint not allocated: {codepoint!r}")
+
+        _format: str = self._format
+        return "".join([format(codepoint, _format) for codepoint in _codes])
+
+    def decode(self, token: str, /) -> Tuple[int, ...]:
+        """Decode a filename token back to its codepoints."""
+
+        _width: int = self._width
+
+        if len(token) % _width or not _HEX_TOKEN.fullmatch(token):
+            raise NamecodeCodecError(f"malformed namecode token: {token!r}")
+
+        _codes: Tuple[int, ...] = tuple(
+            int(token[index : index + _width], 16)
+            for index in range(0, len(token), _width)
+        )
+
+        _allocated: bytearray = self._allocated
+        codepoint: int
+        for codepoint in _codes:
+            if codepoint >= len(_allocated) or not _allocated[codepoint]:
+                raise NamecodeCodecError(f"codepoint not allocated: {codepoint:#X}")
+
+        # Only tokens that encode() gives, with no repeated or unsorted codes.
+        if any(after <= before for before, after in zip(_codes, _codes[1:])):
+            raise NamecodeCodecError(f"codepoints not ascending: {token!r}")
+
+        return _codes
+
+    def decode_filename(self, filename: str, /) -> Tuple[int, ...]:
+        """Decode a filename, ignoring any directory and extension."""
+
+        return self.decode(filename.rpartition("/")[2].partition(".")[0])
+
+
+def encode(
+    codes: Iterable[int], /, scheme_version: str = DEFAULT_SCHEME_VERSION
+) -> str:
+    """Encode a set of codepoints with the shared codec of a scheme version."""
+    return namecodes_registry.get_derived(FilenameCodec, scheme_version).encode(codes)
+
+
+def decode(
+    token: str, /, scheme_version: str = DEFAULT_SCHEME_VERSION
+) -> Tuple[int, ...]:
+    """Decode a filename token with the shared codec of a scheme version."""
+    return namecodes_registry.get_derived(FilenameCodec, scheme_version).decode(token)
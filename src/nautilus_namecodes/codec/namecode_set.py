@@ -0,0 +1,173 @@
+"""Bitset Sets of Namecodes"""
+
+from typing import Dict, Iterable, Iterator, Tuple
+
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, Range, SectionStub
+
+
+class NamecodeSpace:
+    """The codepoint space of a scheme, that namecode sets are drawn from.
+
+    Each set is a fixed-size bitset over AllCodes.codepoints_allocated,
+    bit 0 being the first allocated codepoint. Masks of the allocated
+    range of every plane, block and section are derived once."""
+
+    def __init__(self, all_codes: AllCodes) -> None:
+        self._start: int = all_codes.codepoints_allocated.start
+        self._size: int = all_codes.codepoints_allocated.stop - self._start + 1
+
+        self._plane_masks: Dict[str, int] = {}
+        self._block_masks: Dict[Tuple[str, str], int] = {}
+        self._section_masks: Dict[Tuple[str, str, str], int] = {}
+
+        for plane, block, section in all_codes.walk_sections():
+            self._plane_masks[plane.name] = self._mask(plane)
+            self._block_masks[(plane.name, block.name)] = self._mask(block)
+            self._section_masks[(plane.name, block.name, section.name)] = self._mask(
+                section
+            )
+
+    def _mask(self, stub: SectionStub) -> int:
+        """Mask of the allocated range (inclusive of its stop) of a stub."""
+
+        _range: Range = stub.codepoints_allocated
+        return ((1 << (_range.stop - _range.start + 1)) - 1) << (
+            _range.start - self._start
+        )
+
+    @property
+    def start(self) -> int:
+        """The codepoint of bit 0."""
+        return self._start
+
+    @property
+    def size(self) -> int:
+        """The number of bits in each set."""
+        return self._size
+
+    def empty(self) -> "NamecodeSet":
+        """The empty set."""
+        return NamecodeSet(self, 0)
+
+    def from_codes(self, codes: Iterable[int], /) -> "NamecodeSet":
+        """Make a set from codepoints, which must lie within the space."""
+
+        bits: int = 0
+        codepoint: int
+        for codepoint in codes:
+            offset: int = codepoint - self._start
+            if not 0 <= offset < self._size:
+                raise ValueError(f"codepoint outside of namecode space: {codepoint!r}")
+            bits |= 1 << offset
+
+        return NamecodeSet(self, bits)
+
+    def from_bytes(self, data: bytes, /) -> "NamecodeSet":
+        """Make a set from the output of NamecodeSet.to_bytes()."""
+
+        if len(data) != (self._size + 7) // 8:
+            raise ValueError(f"expected {(self._size + 7) // 8} bytes")
+        return NamecodeSet(self, int.from_bytes(data, "little"))
+
+    def plane(self, plane: str, /) -> "NamecodeSet":
+        """The set of every allocated codepoint of a plane."""
+        return NamecodeSet(self, self._plane_masks[plane])
+
+    def block(self, plane: str, block: str, /) -> "NamecodeSet":
+        """The set of every allocated codepoint of a block."""
+        return NamecodeSet(self, self._block_masks[(plane, block)])
+
+    def section(self, plane: str, block: str, section: str, /) -> "NamecodeSet":
+        """The set of every allocated codepoint of a section."""
+        return NamecodeSet(self, self._section_masks[(plane, block, section)])
+
+
+class NamecodeSet:
+    """Immutable set of namecodes, held as an integer bitset.
+
+    Union, intersection, difference and subset tests are single integer
+    operations, independent of how many codes the sets hold."""
+
+    __slots__ = ("_space", "_bits")
+
+    def __init__(self, space: NamecodeSpace, bits: int) -> None:
+        self._space: NamecodeSpace = space
+        self._bits: int = bits
+
+    @property
+    def space(self) -> NamecodeSpace:
+        """The namecode space of this set."""
+        return self._space
+
+    @property
+    def bits(self) -> int:
+        """The bitset as an integer, bit 0 being the first codepoint."""
+        return self._bits
+
+    def _other_bits(self, other: "NamecodeSet") -> int:
+        if other.space is not self._space:
+            raise ValueError("namecode sets are from different spaces")
+        return other.bits
+
+    def __or__(self, other: "NamecodeSet") -> "NamecodeSet":
+        return NamecodeSet(self._space, self._bits | self._other_bits(other))
+
+    def __and__(self, other: "NamecodeSet") -> "NamecodeSet":
+        return NamecodeSet(self._space, self._bits & self._other_bits(other))
+
+    def __sub__(self, other: "NamecodeSet") -> "NamecodeSet":
+        return NamecodeSet(self._space, self._bits & ~self._other_bits(other))
+
+    def __xor__(self, other: "NamecodeSet") -> "NamecodeSet":
+        return NamecodeSet(self._space, self._bits ^ self._other_bits(other))
+
+    def __le__(self, other: "NamecodeSet") -> bool:
+        return not self._bits & ~self._other_bits(other)
+
+    def __ge__(self, other: "NamecodeSet") -> bool:
+        return not self._other_bits(other) & ~self._bits
+
+    def __lt__(self, other: "NamecodeSet") -> bool:
+        return self <= other and self._bits != other.bits
+
+    def __gt__(self, other: "NamecodeSet") -> bool:
+        return self >= other and self._bits != other.bits
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NamecodeSet):
+            return NotImplemented
+        return other.space is self._space and other.bits == self._bits
+
+    def __hash__(self) -> int:
+        return hash(self._bits)
+
+    def __bool__(self) -> bool:
+        return bool(self._bits)
+
+    def __len__(self) -> int:
+        return bin(self._bits).count("1")
+
+    def __contains__(self, codepoint: object) -> bool:
+        if not isinstance(codepoint, int):
+            return False
+        offset: int = codepoint - self._space.start
+        return 0 <= offset < self._space.size and bool(self._bits >> offset & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        start: int = self._space.start
+        bits: int = self._bits
+        while bits:
+            lowest: int = bits & -bits
+            yield start + lowest.bit_length() - 1
+            bits ^= lowest
+
+    def isdisjoint(self, other: "NamecodeSet") -> bool:
+        """Test if the sets have no codes in common."""
+        return not self._bits & self._other_bits(other)
+
+    def to_bytes(self) -> bytes:
+        """The bitset as fixed-size little-endian bytes."""
+        return self._bits.to_bytes((self._space.size + 7) // 8, "little")
+
+    def __repr__(self) -> str:
+        return f"NamecodeSet({{{', '.join(f'0x{code:03X}' for code in self)}}})"
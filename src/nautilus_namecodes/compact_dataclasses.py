@@ -0,0 +1,245 @@
+"""Compact Data Classes for Constructed Namecodes
+
+Slotted and frozen variants of the generated codes, for keeping many
+schemes resident: a node has no instance '__dict__', and its codes are
+the views of the single CodeTable of its scheme.
+
+The pydantic model and the outputs keep using the data classes of
+'namecodes_dataclasses', to and from which the compact codes convert:
+
+    compact: CompactAllCodes = compact_all_codes(all_codes)
+    all_codes = compact.to_all_codes()
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Iterator, Optional, Tuple, TypeVar
+
+from nautilus_namecodes.code_table import CodeTable
+from nautilus_namecodes.namecodes_dataclasses import (
+    AllCodes,
+    BlockCodes,
+    PlaneCodes,
+    Range,
+    SectionCodes,
+)
+
+_ClassT = TypeVar("_ClassT", bound=type)
+
+
+def _slotted(cls: _ClassT) -> _ClassT:
+    """Recreate a dataclass with '__slots__' for its own fields.
+
+    The same as 'dataclass(slots=True)', that needs python 3.10."""
+
+    own_fields: Tuple[str, ...] = tuple(
+        name
+        for name in cls.__dict__.get("__annotations__", {})
+        if name in {_field.name for _field in fields(cls)}
+    )
+
+    cls_dict: dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = own_fields
+    for name in own_fields:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_slotted
+@dataclass(frozen=True)
+class CompactRange:
+    """Frozen Range of Codepoints, the stop is the last codepoint."""
+
+    stop: int
+    start: int
+    step: int = 1
+
+    @classmethod
+    def from_range(cls, _range: Range, /) -> "CompactRange":
+        """Make a CompactRange from a (pydantic) Range."""
+        return cls(_range.stop, _range.start, _range.step)
+
+    @property
+    def range(self) -> range:
+        """Property to get the standard range type."""
+        return range(self.start, self.stop, self.step)
+
+    def to_range(self) -> Range:
+        """Make a (pydantic) Range of this range."""
+        return Range(self.stop, self.start, self.step)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self.stop, self.start, self.step))
+
+
+@_slotted
+@dataclass(frozen=True)
+class CompactSectionStub:
+    """Base Compact Data Class for Sections"""
+
+    name: str
+    description: Optional[str]
+    codepoints_allocated: CompactRange
+
+    def gen_output_range(self) -> str:
+        """Generate Pretty Output For Codepoints Allocated Range"""
+        return (
+            f"0x{self.codepoints_allocated.start:=03X}"
+            f" - "
+            f"0x{self.codepoints_allocated.stop:=03X}"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The default pickling of slots would assign to the frozen fields.
+        return (
+            type(self),
+            tuple(getattr(self, _field.name) for _field in fields(self)),
+        )
+
+
+@_slotted
+@dataclass(frozen=True)
+class CompactSectionCodes(CompactSectionStub):
+    """Compact Data Class for Generated Section Codes"""
+
+    codes: CodeTable
+
+
+@_slotted
+@dataclass(frozen=True)
+class CompactBlockCodes(CompactSectionStub):
+    """Compact Data Class for Generated Block Codes"""
+
+    sections: Tuple[CompactSectionCodes, ...]
+    codes: CodeTable
+
+
+@_slotted
+@dataclass(frozen=True)
+class CompactPlaneCodes(CompactSectionStub):
+    """Compact Data Class for Generated Plane Codes"""
+
+    blocks: Tuple[CompactBlockCodes, ...]
+    codes: CodeTable
+
+
+@_slotted
+@dataclass(frozen=True)
+class CompactAllCodes(CompactSectionStub):
+    """Compact Data Class for all the Generated Namecodes"""
+
+    planes: Tuple[CompactPlaneCodes, ...]
+    codes: CodeTable
+    scheme_version: str
+
+    def walk_nodes(self) -> Iterator[CompactSectionStub]:
+        """Iterate over every plane, block and section, depth first."""
+
+        plane: CompactPlaneCodes
+        for plane in self.planes:
+            yield plane
+            block: CompactBlockCodes
+            for block in plane.blocks:
+                yield block
+                yield from block.sections
+
+    def walk_sections(
+        self,
+    ) -> Iterator[Tuple[CompactPlaneCodes, CompactBlockCodes, CompactSectionCodes]]:
+        """Iterate over every section, with its plane and block, in order."""
+
+        plane: CompactPlaneCodes
+        for plane in self.planes:
+            block: CompactBlockCodes
+            for block in plane.blocks:
+                section: CompactSectionCodes
+                for section in block.sections:
+                    yield plane, block, section
+
+    def to_all_codes(self) -> AllCodes:
+        """Make the (pydantic) data classes of these codes."""
+
+        return AllCodes(  # pylint: disable=no-value-for-parameter
+            name=self.name,
+            description=self.description,
+            codepoints_allocated=self.codepoints_allocated.to_range(),
+            planes=[
+                PlaneCodes(  # pylint: disable=no-value-for-parameter
+                    name=plane.name,
+                    description=plane.description,
+                    codepoints_allocated=plane.codepoints_allocated.to_range(),
+                    blocks=[
+                        BlockCodes(  # pylint: disable=no-value-for-parameter
+                            name=block.name,
+                            description=block.description,
+                            codepoints_allocated=block.codepoints_allocated.to_range(),
+                            sections=[
+                                SectionCodes(
+                                    name=section.name,
+                                    description=section.description,
+                                    codepoints_allocated=(
+                                        section.codepoints_allocated.to_range()
+                                    ),
+                                    codes=section.codes,
+                                )
+                                for section in block.sections
+                            ],
+                        )
+                        for block in plane.blocks
+                    ],
+                )
+                for plane in self.planes
+            ],
+            scheme_version=self.scheme_version,
+        )
+
+
+_CompactT = TypeVar("_CompactT", bound=CompactSectionStub)
+
+
+def _codes(node: Any) -> CodeTable:
+    """The codes of a node, as a CodeTable (a view, if they are already one)."""
+
+    if isinstance(node.codes, CodeTable):
+        return node.codes
+    return CodeTable.concat([node.codes])
+
+
+def _compact(cls: Callable[..., _CompactT], node: Any, **children: Any) -> _CompactT:
+    return cls(
+        name=node.name,
+        description=node.description,
+        codepoints_allocated=CompactRange.from_range(node.codepoints_allocated),
+        codes=_codes(node),
+        **children,
+    )
+
+
+def compact_all_codes(all_codes: AllCodes) -> CompactAllCodes:
+    """Make the compact data classes of some codes, sharing their CodeTable."""
+
+    return _compact(
+        CompactAllCodes,
+        all_codes,
+        planes=tuple(
+            _compact(
+                CompactPlaneCodes,
+                plane,
+                blocks=tuple(
+                    _compact(
+                        CompactBlockCodes,
+                        block,
+                        sections=tuple(
+                            _compact(CompactSectionCodes, section)
+                            for section in block.sections
+                        ),
+                    )
+                    for block in plane.blocks
+                ),
+            )
+            for plane in all_codes.planes
+        ),
+        scheme_version=all_codes.scheme_version,
+    )
@@ -0,0 +1,254 @@
+"""Export the Generated Namecodes as Columns
+
+A row per code, in codepoint order, with the names of its plane, block and
+section and the allocated range of its section, held as columns:
+
+    codepoint, name, plane, block, section, section_start, section_stop
+
+so an analytics job loads typed arrays, instead of parsing the Json code
+list with its string keys. The columns are written as:
+
+- 'arrow': an Arrow IPC file (Feather v2), with pyarrow. The names of the
+  nodes are dictionary encoded, and the scheme version is in the metadata.
+- 'npz': a NumPy .npz archive, with numpy. The strings are fixed width
+  unicode arrays, so they load without pickle.
+- 'csv': a CSV file with a header, with no dependency.
+
+By default the first of these that is installed is used. The file is
+written beside the path and then moved over it, so readers never see a
+partial export."""
+
+import csv
+import os
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from nautilus_namecodes.namecodes_dataclasses import AllCodes
+from nautilus_namecodes.scheme.registry import namecodes_registry
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # pragma: no cover
+    pyarrow = None  # type: ignore
+
+# The formats, in order of preference, each written with the suffix
+# f".{format}" when the path has no suffix.
+COLUMNAR_FORMATS: Tuple[str, ...] = ("arrow", "npz", "csv")
+
+SUFFIXES: Dict[str, str] = {
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".npz": "npz",
+    ".csv": "csv",
+}
+
+
+@dataclass(frozen=True)
+class CodeColumns:  # pylint: disable=too-many-instance-attributes
+    """The codes of a scheme as columns, a row per code."""
+
+    scheme_version: str
+    codepoint: array
+    name: Tuple[str, ...]
+    plane: List[str]
+    block: List[str]
+    section: List[str]
+    section_start: array
+    section_stop: array
+
+    def __len__(self) -> int:
+        return len(self.codepoint)
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        """The names of the columns, in order."""
+        return (
+            "codepoint",
+            "name",
+            "plane",
+            "block",
+            "section",
+            "section_start",
+            "section_stop",
+        )
+
+
+def code_columns(all_codes: Optional[AllCodes] = None, /) -> CodeColumns:
+    """The codes (of the default scheme) as columns."""
+
+    if all_codes is None:
+        all_codes = namecodes_registry.get_all_codes()
+
+    codepoint: array = array("I")
+    name: List[str] = []
+    plane_names: List[str] = []
+    block_names: List[str] = []
+    section_names: List[str] = []
+    section_start: array = array("I")
+    section_stop: array = array("I")
+
+    for plane, block, section in all_codes.walk_sections():
+        count: int = len(section.codes)
+        codepoint.extend(section.codes.keys())
+        name.extend(section.codes.values())
+        plane_names.extend([plane.name] * count)
+        block_names.extend([block.name] * count)
+        section_names.extend([section.name] * count)
+        section_start.extend([section.codepoints_allocated.start] * count)
+        section_stop.extend([section.codepoints_allocated.stop] * count)
+
+    return CodeColumns(
+        scheme_version=all_codes.scheme_version,
+        codepoint=codepoint,
+        name=tuple(name),
+        plane=plane_names,
+        block=block_names,
+        section=section_names,
+        section_start=section_start,
+        section_stop=section_stop,
+    )
+
+
+def default_columnar_format() -> str:
+    """The preferred format of those whose dependency is installed."""
+
+    if pyarrow is not None:
+        return "arrow"
+    if numpy is not None:
+        return "npz"
+    return "csv"
+
+
+def write_arrow(path: Union[str, Path], columns: CodeColumns, /) -> None:
+    """Write the columns to an Arrow IPC file, with pyarrow."""
+
+    if pyarrow is None:
+        raise ImportError("pyarrow is required for the 'arrow' format")
+
+    table = pyarrow.table(
+        {
+            "codepoint": pyarrow.array(columns.codepoint, type=pyarrow.uint32()),
+            "name": pyarrow.array(columns.name, type=pyarrow.string()),
+            "plane": pyarrow.array(columns.plane).dictionary_encode(),
+            "block": pyarrow.array(columns.block).dictionary_encode(),
+            "section": pyarrow.array(columns.section).dictionary_encode(),
+            "section_start": pyarrow.array(
+                columns.section_start, type=pyarrow.uint32()
+            ),
+            "section_stop": pyarrow.array(columns.section_stop, type=pyarrow.uint32()),
+        }
+    ).replace_schema_metadata({"scheme_version": columns.scheme_version})
+
+    with pyarrow.OSFile(str(path), "wb") as sink:
+        with pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _uint32(values: array) -> Any:
+    """A uint32 ndarray of an array of unsigned integers, without a copy if
+    its items are already 32 bit."""
+    return numpy.frombuffer(values, dtype=f"=u{values.itemsize}").astype(
+        numpy.uint32, copy=False
+    )
+
+
+def write_npz(path: Union[str, Path], columns: CodeColumns, /) -> None:
+    """Write the columns to a NumPy .npz archive, with numpy."""
+
+    if numpy is None:
+        raise ImportError("numpy is required for the 'npz' format")
+
+    # An open file, as numpy.savez() would add '.npz' to any other path.
+    with Path(path).open("wb") as file:
+        numpy.savez(
+            file,
+            codepoint=_uint32(columns.codepoint),
+            name=numpy.array(columns.name, dtype=numpy.str_),
+            plane=numpy.array(columns.plane, dtype=numpy.str_),
+            block=numpy.array(columns.block, dtype=numpy.str_),
+            section=numpy.array(columns.section, dtype=numpy.str_),
+            section_start=_uint32(columns.section_start),
+            section_stop=_uint32(columns.section_stop),
+            scheme_version=numpy.array(columns.scheme_version, dtype=numpy.str_),
+        )
+
+
+def write_csv(path: Union[str, Path], columns: CodeColumns, /) -> None:
+    """Write the columns to a CSV file, with a header."""
+
+    with Path(path).open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(columns.column_names)
+        writer.writerows(
+            zip(
+                columns.codepoint,
+                columns.name,
+                columns.plane,
+                columns.block,
+                columns.section,
+                columns.section_start,
+                columns.section_stop,
+            )
+        )
+
+
+def write_columns(
+    path: Union[str, Path],
+    all_codes: Optional[AllCodes] = None,
+    /,
+    *,
+    columnar_format: Optional[str] = None,
+) -> Path:
+    """Write the codes (of the default scheme) as columns, returning the
+    path written, replacing any file at the path.
+
+    Without a format, it is given by the suffix of the path, if one of
+    SUFFIXES, or else is the default format. A path without a suffix is
+    given the suffix of the format. Any other suffix, or a suffix of
+    another format, raises ValueError."""
+
+    path = Path(path)
+
+    if columnar_format is not None and columnar_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"unknown columnar format: {columnar_format!r}")
+
+    suffix_format: Optional[str] = SUFFIXES.get(path.suffix.lower())
+
+    if path.suffix and suffix_format is None:
+        raise ValueError(f"unknown columnar suffix: {path.suffix!r}")
+    if columnar_format is None:
+        columnar_format = suffix_format or default_columnar_format()
+    elif suffix_format not in (None, columnar_format):
+        raise ValueError(
+            f"the suffix {path.suffix!r} is not of the format {columnar_format!r}"
+        )
+    if not path.suffix:
+        path = path.with_name(f"{path.name}.{columnar_format}")
+
+    columns: CodeColumns = code_columns(all_codes)
+
+    temporary: Path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temporary.unlink(missing_ok=True)
+
+    try:
+        if columnar_format == "arrow":
+            write_arrow(temporary, columns)
+        elif columnar_format == "npz":
+            write_npz(temporary, columns)
+        else:
+            write_csv(temporary, columns)
+
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+    return path
@@ -1,13 +1,13 @@
 """Format the Generated Namecodes for Console Presentation"""
 
-from nautilus_namecodes.format.generate_markdown import MarkdownOutput
-from nautilus_namecodes.scheme.v_0_1_0.namecode_model import (
-    AllNameCodes,
-    NautilusNamecodesListModel,
-    NautilusNamecodesModel,
-    NautilusNamecodesTreeModel,
-    TreeStubGen,
-)
+# The Markdown (snakemd) and Json (pydantic) outputs are imported on use,
+# so that each output only pays for the import of its own dependencies.
+
+# pylint: disable=import-outside-toplevel
+
+from typing import TextIO
+
+from nautilus_namecodes.scheme.registry import namecodes_registry
 
 
 class ConsoleOutput:
@@ -17,6 +17,8 @@ class ConsoleOutput:
     def generate_tree_output() -> str:
         """Generate a Full Output for the Console"""
 
+        from nautilus_namecodes.format.generate_markdown import MarkdownOutput
+
         markdown_output: MarkdownOutput = MarkdownOutput()
         markdown_output.append_docuemnt(elements=markdown_output.build_tree())
 
@@ -26,6 +28,8 @@ class ConsoleOutput:
     def generate_blocks_output() -> str:
         """Generate a Full Output for the Console"""
 
+        from nautilus_namecodes.format.generate_markdown import MarkdownOutput
+
         markdown_output: MarkdownOutput = MarkdownOutput()
         markdown_output.append_docuemnt(elements=markdown_output.generate_blocks_list())
 
@@ -35,70 +39,121 @@ class ConsoleOutput:
     def generate_codes_output() -> str:
         """Generate a Full Output for the Console"""
 
+        from nautilus_namecodes.format.generate_markdown import MarkdownOutput
+
         markdown_output: MarkdownOutput = MarkdownOutput()
         markdown_output.append_docuemnt(elements=markdown_output.build_codes())
 
         return markdown_output.document.render()
 
+    @staticmethod
+    def write_tree_output(stream: TextIO) -> None:
+        """Write the Tree Output to a Stream"""
+
+        from nautilus_namecodes.format.markdown_stream import MarkdownStream
+
+        markdown_stream: MarkdownStream = MarkdownStream()
+        markdown_stream.write(markdown_stream.stream_tree(), stream)
+
+    @staticmethod
+    def write_blocks_output(stream: TextIO) -> None:
+        """Write the Blocks Output to a Stream"""
+
+        from nautilus_namecodes.format.markdown_stream import MarkdownStream
+
+        markdown_stream: MarkdownStream = MarkdownStream()
+        markdown_stream.write(markdown_stream.stream_blocks_list(), stream)
+
+    @staticmethod
+    def write_codes_output(stream: TextIO) -> None:
+        """Write the Codes Output to a Stream"""
+
+        from nautilus_namecodes.format.markdown_stream import MarkdownStream
+
+        markdown_stream: MarkdownStream = MarkdownStream()
+        markdown_stream.write(markdown_stream.stream_codes(), stream)
+
     @staticmethod
     def generate_json_schema() -> str:
         """Generate Dataclass Json Schema"""
 
-        nautilus_namecodes_model = NautilusNamecodesModel(
-            data=AllNameCodes().get_all_codes
+        from nautilus_namecodes.format.json_schema import (
+            SCHEMA_ALL_CODES,
+            get_json_schema,
         )
 
-        return nautilus_namecodes_model.schema_json()
+        return get_json_schema(SCHEMA_ALL_CODES)
 
     @staticmethod
     def generate_json() -> str:
         """Generate Dataclass as Json"""
 
-        nautilus_namecodes_model = NautilusNamecodesModel(
-            data=AllNameCodes().get_all_codes
-        )
+        from nautilus_namecodes.format.json_stream import JsonStream
+
+        return "".join(JsonStream().stream_all_codes())
+
+    @staticmethod
+    def write_json(stream: TextIO) -> None:
+        """Write Dataclass as Json to a Stream"""
+
+        from nautilus_namecodes.format.json_stream import JsonStream
 
-        return nautilus_namecodes_model.json()
+        json_stream: JsonStream = JsonStream()
+        json_stream.write(json_stream.stream_all_codes(), stream)
 
     @staticmethod
     def generate_json_schema_tree() -> str:
         """Generate Stub Tree Json Schema"""
 
-        nautilus_namecodes_tree_model = NautilusNamecodesTreeModel(
-            data=TreeStubGen().tree_stub
-        )
+        from nautilus_namecodes.format.json_schema import SCHEMA_TREE, get_json_schema
 
-        return nautilus_namecodes_tree_model.schema_json()
+        return get_json_schema(SCHEMA_TREE)
 
     @staticmethod
     def generate_json_tree() -> str:
         """Generate Stub Tree as Json"""
 
-        nautilus_namecodes_tree_model = NautilusNamecodesTreeModel(
-            data=TreeStubGen().tree_stub
-        )
+        from nautilus_namecodes.format.json_stream import JsonStream
 
-        return nautilus_namecodes_tree_model.json()
+        return "".join(JsonStream.stream_tree(namecodes_registry.get_tree_stub()))
+
+    @staticmethod
+    def write_json_tree(stream: TextIO) -> None:
+        """Write Stub Tree as Json to a Stream"""
+
+        from nautilus_namecodes.format.json_stream import JsonStream
+
+        JsonStream.write(
+            JsonStream.stream_tree(namecodes_registry.get_tree_stub()), stream
+        )
 
     @staticmethod
     def generate_json_schema_codelist() -> str:
         """Generate Full Code List Json Schema"""
 
-        nautilus_namecodes_model = NautilusNamecodesListModel(
-            namecodes=AllNameCodes().get_all_codes.codes
+        from nautilus_namecodes.format.json_schema import (
+            SCHEMA_CODELIST,
+            get_json_schema,
         )
 
-        return nautilus_namecodes_model.schema_json()
+        return get_json_schema(SCHEMA_CODELIST)
 
     @staticmethod
     def generate_json_codelist() -> str:
         """Generate Full Code List as Json"""
 
-        nautilus_namecodes_model = NautilusNamecodesListModel(
-            namecodes=AllNameCodes().get_all_codes.codes
-        )
+        from nautilus_namecodes.format.json_stream import JsonStream
+
+        return "".join(JsonStream().stream_codelist())
+
+    @staticmethod
+    def write_json_codelist(stream: TextIO) -> None:
+        """Write Full Code List as Json to a Stream"""
+
+        from nautilus_namecodes.format.json_stream import JsonStream
 
-        return nautilus_namecodes_model.json()
+        json_stream: JsonStream = JsonStream()
+        json_stream.write(json_stream.stream_codelist(), stream)
 
 
 if __name__ == "__main__2":
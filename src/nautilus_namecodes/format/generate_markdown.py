@@ -5,20 +5,21 @@ from typing import Iterable, List, Tuple
 from snakemd import Document
 from snakemd.generator import Element, Header, InlineText, Paragraph, Table
 
+from nautilus_namecodes.format.markdown_stream import generate_tree_text
 from nautilus_namecodes.namecodes_dataclasses import (
     AllCodes,
     BlockCodes,
     PlaneCodes,
     SectionCodes,
 )
-from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+from nautilus_namecodes.scheme.registry import namecodes_registry
 
 
 class MarkdownOutput:
     """Generate Markdown Formatted Codes."""
 
     def __init__(self) -> None:
-        self.all_name_codes: AllCodes = AllNameCodes().get_all_codes
+        self.all_name_codes: AllCodes = namecodes_registry.get_all_codes()
 
         self.doc = Document(f"Nautilus_Namecodes_{self.all_name_codes.scheme_version}")
 
@@ -76,53 +77,7 @@ class MarkdownOutput:
     def build_tree(self) -> Iterable[Element]:
         """Generate a Tree Output for the Console"""
 
-        output: str = ""
-
-        output += f"\nScheme Version: {self.all_name_codes.scheme_version}\n"
-
-        output += f"\n.{self.all_name_codes.name:29}"
-        output += f" ((({self.all_name_codes.gen_output_range()})))\n"
-
-        plane: PlaneCodes
-        plane_last: PlaneCodes = self.all_name_codes.planes[-1]
-
-        for plane in self.all_name_codes.planes:
-
-            plane_joiner: str = ("├──", "└──")[plane == plane_last]
-            block_spacer: str = ("│   ", "    ")[plane == plane_last]
-
-            output += f"│   \n{plane_joiner} {plane.name:27}"
-            output += f" (({plane.gen_output_range()}))\n"
-
-            block: BlockCodes
-            block_last: BlockCodes = plane.blocks[-1]
-
-            for block in plane.blocks:
-
-                block_joiner: str = (f"{block_spacer}├──", f"{block_spacer}└──")[
-                    block == block_last
-                ]
-                section_spacer: str = (f"{block_spacer}│   ", f"{block_spacer}    ")[
-                    block == block_last
-                ]
-
-                output += f"{block_joiner} {block.name:24}"
-                output += f" ({block.gen_output_range()})\n"
-
-                section: SectionCodes
-                section_last: SectionCodes = block.sections[-1]
-
-                for section in block.sections:
-
-                    section_joiner: str = (
-                        f"{section_spacer}├──",
-                        f"{section_spacer}└──",
-                    )[section == section_last]
-
-                    output += f"{section_joiner} {section.name:21}"
-                    output += f" {section.gen_output_range()}\n"
-
-                    output += ("", f"{section_spacer}\n")[section == section_last]
+        output: str = generate_tree_text(self.all_name_codes)
 
         return [Paragraph([InlineText(output)], code=True)]
 
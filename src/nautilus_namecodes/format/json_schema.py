@@ -0,0 +1,114 @@
+"""Cached Json Schemas of the Namecodes Models
+
+The schemas only depend on the pydantic model classes of a scheme, so
+they are generated from the classes (without building any codes), kept
+for the life of the process, and cached on disk keyed by the package
+version and scheme version.
+
+The disk cache is under '$XDG_CACHE_HOME/nautilus-namecodes' (by default
+'~/.cache/nautilus-namecodes'), and is not used by an unversioned
+(development) package, whose models may change without a new version."""
+
+import importlib
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+from nautilus_namecodes._version import UNVERSIONED, resolve_version
+from nautilus_namecodes.scheme.registry import (
+    DEFAULT_SCHEME_VERSION,
+    UnknownSchemeError,
+)
+
+SCHEMA_ALL_CODES: str = "all_codes"
+SCHEMA_TREE: str = "tree"
+SCHEMA_CODELIST: str = "codelist"
+
+# The pydantic model of each schema, and the module of models of each scheme.
+_SCHEMA_MODELS: Dict[str, str] = {
+    SCHEMA_ALL_CODES: "NautilusNamecodesModel",
+    SCHEMA_TREE: "NautilusNamecodesTreeModel",
+    SCHEMA_CODELIST: "NautilusNamecodesListModel",
+}
+_SCHEME_MODEL_MODULES: Dict[str, str] = {
+    DEFAULT_SCHEME_VERSION: "nautilus_namecodes.scheme.v_0_1_0.namecode_model",
+}
+
+
+def cache_directory() -> Path:
+    """The directory of the on disk schema cache."""
+
+    xdg_cache_home: str = os.environ.get("XDG_CACHE_HOME", "")
+    if xdg_cache_home:
+        return Path(xdg_cache_home).joinpath("nautilus-namecodes")
+    return Path.home().joinpath(".cache", "nautilus-namecodes")
+
+
+def schema_cache_path(
+    schema: str, scheme_version: str = DEFAULT_SCHEME_VERSION
+) -> Optional[Path]:
+    """The cache file of a schema, or None if it is not cached on disk."""
+
+    package_version: str = resolve_version()
+    if package_version == UNVERSIONED:
+        return None
+
+    return cache_directory().joinpath(
+        f"schema-{package_version}-{scheme_version}-{schema}.json"
+    )
+
+
+def generate_json_schema(
+    schema: str, scheme_version: str = DEFAULT_SCHEME_VERSION
+) -> str:
+    """Generate a schema from its model class."""
+
+    if schema not in _SCHEMA_MODELS:
+        raise ValueError(f"unknown json schema: {schema!r}")
+    if scheme_version not in _SCHEME_MODEL_MODULES:
+        raise UnknownSchemeError(scheme_version)
+
+    models = importlib.import_module(_SCHEME_MODEL_MODULES[scheme_version])
+    json_schema: str = getattr(models, _SCHEMA_MODELS[schema]).schema_json()
+
+    return json_schema
+
+
+def _write_cache(path: Path, json_schema: str) -> None:
+    """Write the cache file atomically, a failure only skips the cache."""
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf8", dir=path.parent, delete=False
+        ) as temporary_file:
+            temporary_file.write(json_schema)
+        os.replace(temporary_file.name, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def get_json_schema(schema: str, scheme_version: str = DEFAULT_SCHEME_VERSION) -> str:
+    """Get a schema, from the disk cache when it is there."""
+
+    path: Optional[Path] = schema_cache_path(schema, scheme_version)
+
+    if path is not None:
+        try:
+            return path.read_text(encoding="utf8")
+        except OSError:
+            pass
+
+    json_schema: str = generate_json_schema(schema, scheme_version)
+
+    if path is not None:
+        _write_cache(path, json_schema)
+
+    return json_schema
+
+
+if __name__ == "__main__":
+    print(get_json_schema(SCHEMA_ALL_CODES))
@@ -0,0 +1,108 @@
+"""Stream the Generated Namecodes as Json, without Pydantic
+
+Walks the dataclasses directly, writing the same Json as the models of
+'namecode_model' (the field order of the dataclasses, integer keys as
+strings, ascii only) a piece at a time, with no validation or copying
+of the codes."""
+
+import dataclasses
+from collections.abc import Mapping
+from itertools import islice
+from json.encoder import encode_basestring_ascii  # type: ignore[attr-defined]
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple
+
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, Codes, Range, TreeStub
+from nautilus_namecodes.scheme.registry import namecodes_registry
+
+# The number of codes joined into each piece of a codes mapping.
+CODES_CHUNK_SIZE: int = 256
+
+
+def _iter_codes(codes: Codes) -> Iterator[str]:
+    """A mapping of codes, as a piece per chunk of CODES_CHUNK_SIZE codes."""
+
+    items: Iterator[Tuple[int, str]] = iter(codes.items())
+    separator: str = "{"
+    while True:
+        chunk: str = ", ".join(
+            f'"{codepoint}": {encode_basestring_ascii(name)}'
+            for codepoint, name in islice(items, CODES_CHUNK_SIZE)
+        )
+        if not chunk:
+            break
+        yield separator + chunk
+        separator = ", "
+    yield "{}" if separator == "{" else "}"
+
+
+def iter_json(value: Any) -> Iterator[str]:
+    """Pieces of Json of a value of the namecodes dataclasses."""
+
+    if isinstance(value, str):
+        yield encode_basestring_ascii(value)
+    elif value is None:
+        yield "null"
+    elif isinstance(value, int):
+        yield str(int(value))
+    elif isinstance(value, Range):
+        yield f'{{"stop": {value.stop}, "start": {value.start}, "step": {value.step}}}'
+    elif isinstance(value, Mapping):
+        yield from _iter_codes(value)
+    elif isinstance(value, list):
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ", "
+            yield from iter_json(item)
+        yield "]"
+    elif dataclasses.is_dataclass(value):
+        yield "{"
+        for index, _field in enumerate(dataclasses.fields(value)):
+            yield f'{", " if index else ""}"{_field.name}": '
+            yield from iter_json(getattr(value, _field.name))
+        yield "}"
+    else:
+        raise TypeError(f"cannot serialize {type(value).__name__!r} as namecodes json")
+
+
+class JsonStream:
+    """Generate Json Formatted Codes, a Piece at a Time."""
+
+    def __init__(self, all_codes: Optional[AllCodes] = None) -> None:
+        self.all_name_codes: AllCodes = (
+            namecodes_registry.get_all_codes() if all_codes is None else all_codes
+        )
+
+    @staticmethod
+    def write(pieces: Iterable[str], stream: TextIO) -> None:
+        """Write the pieces of Json to a text stream."""
+        stream.writelines(pieces)
+
+    def stream_all_codes(self) -> Iterator[str]:
+        """Json of AllCodes, as of NautilusNamecodesModel."""
+
+        yield '{"data": '
+        yield from iter_json(self.all_name_codes)
+        yield "}"
+
+    @staticmethod
+    def stream_tree(tree_stub: TreeStub) -> Iterator[str]:
+        """Json of a TreeStub, as of NautilusNamecodesTreeModel."""
+
+        yield '{"data": '
+        yield from iter_json(tree_stub)
+        yield "}"
+
+    def stream_codelist(self) -> Iterator[str]:
+        """Json of the Codes, as of NautilusNamecodesListModel."""
+
+        yield '{"namecodes": '
+        yield from _iter_codes(self.all_name_codes.codes)
+        yield "}"
+
+
+if __name__ == "__main__":
+    import sys
+
+    json_stream: JsonStream = JsonStream()
+    json_stream.write(json_stream.stream_all_codes(), sys.stdout)
@@ -0,0 +1,240 @@
+"""Stream the Generated Namecodes as Markdown, Line by Line
+
+Renders the same Markdown as MarkdownOutput without building a document:
+the column widths of each table are taken from its codes up front, then
+every line is yielded (or written to a stream) as it is rendered."""
+
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from nautilus_namecodes.namecodes_dataclasses import (
+    AllCodes,
+    BlockCodes,
+    Codes,
+    PlaneCodes,
+    SectionCodes,
+)
+from nautilus_namecodes.scheme.registry import namecodes_registry
+
+Row = Tuple[str, str]
+
+_TABLE_HEADER: Row = ("Code", "Name")
+_EMPTY_ROW: Row = ("", "")
+
+
+def generate_tree_text(all_codes: AllCodes) -> str:
+    """Generate the Tree of Planes, Blocks and Sections as Text"""
+
+    output: str = ""
+
+    output += f"\nScheme Version: {all_codes.scheme_version}\n"
+
+    output += f"\n.{all_codes.name:29}"
+    output += f" ((({all_codes.gen_output_range()})))\n"
+
+    plane: PlaneCodes
+    plane_last: PlaneCodes = all_codes.planes[-1]
+
+    for plane in all_codes.planes:
+
+        plane_joiner: str = ("├──", "└──")[plane == plane_last]
+        block_spacer: str = ("│   ", "    ")[plane == plane_last]
+
+        output += f"│   \n{plane_joiner} {plane.name:27}"
+        output += f" (({plane.gen_output_range()}))\n"
+
+        block: BlockCodes
+        block_last: BlockCodes = plane.blocks[-1]
+
+        for block in plane.blocks:
+
+            block_joiner: str = (f"{block_spacer}├──", f"{block_spacer}└──")[
+                block == block_last
+            ]
+            section_spacer: str = (f"{block_spacer}│   ", f"{block_spacer}    ")[
+                block == block_last
+            ]
+
+            output += f"{block_joiner} {block.name:24}"
+            output += f" ({block.gen_output_range()})\n"
+
+            section: SectionCodes
+            section_last: SectionCodes = block.sections[-1]
+
+            for section in block.sections:
+
+                section_joiner: str = (
+                    f"{section_spacer}├──",
+                    f"{section_spacer}└──",
+                )[section == section_last]
+
+                output += f"{section_joiner} {section.name:21}"
+                output += f" {section.gen_output_range()}\n"
+
+                output += ("", f"{section_spacer}\n")[section == section_last]
+
+    return output
+
+
+def _code(codepoint: int) -> str:
+    return f"0x{codepoint:=04X}"
+
+
+def _paragraph(text: str) -> str:
+    """A paragraph (and so a table cell) is rendered with its whitespace collapsed."""
+    return " ".join(text.split())
+
+
+def _code_rows(codes: Codes) -> Iterator[Row]:
+    codepoint: int
+    name: str
+    for codepoint, name in codes.items():
+        yield _code(codepoint), name
+
+
+def _table_widths(codes: Iterable[Codes], labels: Iterable[str]) -> Tuple[int, int]:
+    """Column widths of a table of codes, with labels in the name column.
+
+    As for the document tables, the widths are measured before any
+    whitespace of the cells is collapsed."""
+
+    code_width: int = len(_TABLE_HEADER[0])
+    name_width: int = max([len(_TABLE_HEADER[1]), *map(len, labels)])
+
+    table: Codes
+    for table in codes:
+        if table:
+            code_width = max(code_width, len(_code(max(table))))
+            name_width = max(name_width, *map(len, table.values()))
+
+    return code_width, name_width
+
+
+def _table_lines(widths: Tuple[int, int], rows: Iterable[Row]) -> Iterator[str]:
+    code_width, name_width = widths
+
+    yield f"| {_TABLE_HEADER[0]:{code_width}} | {_TABLE_HEADER[1]:{name_width}} |"
+    yield f"| {'-' * code_width} | {'-' * name_width} |"
+
+    code: str
+    name: str
+    for code, name in rows:
+        yield f"| {_paragraph(code):{code_width}} | {_paragraph(name):{name_width}} |"
+
+
+class MarkdownStream:
+    """Generate Markdown Formatted Codes, a Line at a Time."""
+
+    def __init__(self, all_codes: Optional[AllCodes] = None) -> None:
+        self.all_name_codes: AllCodes = (
+            namecodes_registry.get_all_codes() if all_codes is None else all_codes
+        )
+
+    @staticmethod
+    def write(lines: Iterable[str], stream: TextIO) -> None:
+        """Write each line, and its newline, to a text stream."""
+        stream.writelines(f"{line}\n" for line in lines)
+
+    @staticmethod
+    def _join_elements(elements: Iterable[Iterable[str]]) -> Iterator[str]:
+        """Separate the lines of each element with a blank line."""
+
+        first: bool = True
+        element: Iterable[str]
+        for element in elements:
+            if not first:
+                yield ""
+            first = False
+            yield from element
+
+    def stream_tree(self) -> Iterator[str]:
+        """Lines of the Tree Output"""
+
+        yield "```generic"
+        yield from generate_tree_text(self.all_name_codes).split("\n")
+        yield "```"
+
+    def stream_blocks_list(self) -> Iterator[str]:
+        """Lines of the List of Blocks, and their Sections and Codes."""
+
+        return self._join_elements(
+            element
+            for plane in self.all_name_codes.planes
+            for block in plane.blocks
+            for element in self.build_block(block)
+        )
+
+    def stream_sections_list(self) -> Iterator[str]:
+        """Lines of the List of All Sections, with their Codes."""
+
+        return self._join_elements(
+            element
+            for _, _, section in self.all_name_codes.walk_sections()
+            for element in self.build_section(section)
+        )
+
+    def stream_codes(self) -> Iterator[str]:
+        """Lines of the List of All the Codes."""
+
+        return self._join_elements(self.build_codes())
+
+    @staticmethod
+    def build_block(block: BlockCodes) -> List[Iterable[str]]:
+        """Given a Block, List it's sections and Codes."""
+
+        labels: List[str] = [
+            f"*{section.gen_output_range()}*" for section in block.sections
+        ]
+
+        def rows() -> Iterator[Row]:
+            section: SectionCodes
+            label: str
+            for section, label in zip(block.sections, labels):
+                if section is not block.sections[0]:
+                    yield _EMPTY_ROW
+                yield "", label
+                yield from _code_rows(section.codes)
+
+        widths: Tuple[int, int] = _table_widths(
+            (section.codes for section in block.sections), labels
+        )
+
+        return [
+            [f"## {block.name}"],
+            [_paragraph(f"*{block.description}*")],
+            [_paragraph(block.gen_output_range())],
+            _table_lines(widths, rows()),
+        ]
+
+    @staticmethod
+    def build_section(section: SectionCodes) -> List[Iterable[str]]:
+        """Given a Sections, List it's codes."""
+
+        label: str = f"*{section.gen_output_range()}*"
+
+        def rows() -> Iterator[Row]:
+            yield "", label
+            yield from _code_rows(section.codes)
+
+        return [
+            [f"### {section.name}"],
+            [_paragraph(str(section.description))],
+            _table_lines(_table_widths([section.codes], [label]), rows()),
+        ]
+
+    def build_codes(self) -> List[Iterable[str]]:
+        """List All the Codes."""
+
+        codes: Codes = self.all_name_codes.codes
+
+        return [
+            [f"# {self.all_name_codes.name}"],
+            [_paragraph(str(self.all_name_codes.description))],
+            _table_lines(_table_widths([codes], []), _code_rows(codes)),
+        ]
+
+
+if __name__ == "__main__":
+    import sys
+
+    markdown_stream: MarkdownStream = MarkdownStream()
+    markdown_stream.write(markdown_stream.stream_codes(), sys.stdout)
@@ -0,0 +1,288 @@
+"""Precompiled Binary Snapshot of the Namecodes, loaded with mmap
+
+The snapshot is a little-endian file of:
+
+* a header: magic, format version, counts and the blob size;
+* a range table: one record per plane, block and section;
+* an offset table: the sorted codepoints, then the offsets of their
+  names in the string blob (with a final end offset);
+* a string blob of UTF-8 names, descriptions and the scheme version.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, SectionStub
+
+MAGIC: bytes = b"NNCS"
+FORMAT_VERSION: int = 1
+
+# magic, format version, flags, node count, code count, blob size,
+# scheme version offset, scheme version length, name offset, name length
+_HEADER: struct.Struct = struct.Struct("<4sHHIIIIIII")
+_HEADER_SIZE: int = 40
+
+# level, parent, start, stop, name offset, name length,
+# description offset, description length
+_NODE: struct.Struct = struct.Struct("<IIIIIIII")
+
+_NO_PARENT: int = 0xFFFFFFFF
+_NO_DESCRIPTION: int = 0xFFFFFFFF
+
+LEVEL_PLANE: int = 1
+LEVEL_BLOCK: int = 2
+LEVEL_SECTION: int = 3
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a snapshot this version can load."""
+
+
+@dataclass(frozen=True)
+class SnapshotNode:
+    """A plane, block or section record of a snapshot."""
+
+    level: int
+    parent: Optional[int]
+    start: int
+    stop: int
+    name: str
+    description: Optional[str]
+
+
+class _Blob:  # pylint: disable=too-few-public-methods
+    """Collect UTF-8 strings into a blob, sharing repeated strings."""
+
+    def __init__(self) -> None:
+        self.data: bytearray = bytearray()
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, string: Optional[str]) -> Tuple[int, int]:
+        """Add a string, returning its offset and length."""
+
+        if string is None:
+            return 0, _NO_DESCRIPTION
+
+        if string not in self._offsets:
+            encoded: bytes = string.encode("utf8")
+            self._offsets[string] = (len(self.data), len(encoded))
+            self.data += encoded
+
+        return self._offsets[string]
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _pack_nodes(all_codes: AllCodes, blob: _Blob) -> bytearray:
+    """Pack the range table of the planes, blocks and sections."""
+
+    nodes: bytearray = bytearray()
+
+    def add_node(level: int, parent: int, stub: SectionStub) -> int:
+        nodes.extend(
+            _NODE.pack(
+                level,
+                parent,
+                stub.codepoints_allocated.start,
+                stub.codepoints_allocated.stop,
+                *blob.add(stub.name),
+                *blob.add(stub.description),
+            )
+        )
+        return len(nodes) // _NODE.size - 1
+
+    for plane in all_codes.planes:
+        plane_index: int = add_node(LEVEL_PLANE, _NO_PARENT, plane)
+        for block in plane.blocks:
+            block_index: int = add_node(LEVEL_BLOCK, plane_index, block)
+            for section in block.sections:
+                add_node(LEVEL_SECTION, block_index, section)
+
+    return nodes
+
+
+def write_snapshot(all_codes: AllCodes, file: BinaryIO, /) -> None:
+    """Serialize AllCodes to a snapshot file."""
+
+    blob: _Blob = _Blob()
+    scheme_version: Tuple[int, int] = blob.add(all_codes.scheme_version)
+    name: Tuple[int, int] = blob.add(all_codes.name)
+
+    nodes: bytearray = _pack_nodes(all_codes, blob)
+
+    codepoints: array = array("I")
+    name_offsets: array = array("I")
+
+    codepoint: int
+    code_name: str
+    for codepoint, code_name in sorted(all_codes.codes.items()):
+        codepoints.append(codepoint)
+        name_offsets.append(len(blob.data))
+        blob.data += code_name.encode("utf8")
+    name_offsets.append(len(blob.data))
+
+    header: bytes = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        len(nodes) // _NODE.size,
+        len(codepoints),
+        len(blob.data),
+        *scheme_version,
+        *name,
+    )
+
+    file.write(header.ljust(_HEADER_SIZE, b"\x00"))
+    file.write(nodes)
+    file.write(_to_little_endian(codepoints))
+    file.write(_to_little_endian(name_offsets))
+    file.write(blob.data)
+
+
+class NamecodeSnapshot(Mapping):  # pylint: disable=too-many-instance-attributes
+    """Read-only mapping of codepoints to names, served from a snapshot.
+
+    The file is memory mapped, so processes loading the same snapshot
+    share one page cached copy. The codepoint and offset tables are used
+    in place, only the names that are looked up are decoded."""
+
+    def __init__(self, path: Union[str, Path], /) -> None:
+        with open(path, "rb") as file:
+            # mmap cannot map an empty file.
+            if os.fstat(file.fileno()).st_size < _HEADER_SIZE:
+                raise SnapshotFormatError("truncated snapshot header")
+            self._mmap: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._buffer: memoryview = memoryview(self._mmap)
+
+        try:
+            self._load()
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self) -> None:
+        """Check the header, and make the views of the tables and blob."""
+
+        (
+            magic,
+            format_version,
+            _,
+            self._node_count,
+            self._code_count,
+            blob_size,
+            *strings,
+        ) = _HEADER.unpack_from(self._buffer)
+
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise SnapshotFormatError(f"not a version {FORMAT_VERSION} snapshot")
+
+        _nodes_end: int = _HEADER_SIZE + self._node_count * _NODE.size
+        _codes_end: int = _nodes_end + self._code_count * 4
+        _offsets_end: int = _codes_end + (self._code_count + 1) * 4
+
+        if len(self._buffer) != _offsets_end + blob_size:
+            raise SnapshotFormatError("snapshot size does not match its header")
+
+        self._nodes: memoryview = self._buffer[_HEADER_SIZE:_nodes_end]
+        self._codepoints = self._table(self._buffer[_nodes_end:_codes_end])
+        self._offsets = self._table(self._buffer[_codes_end:_offsets_end])
+        self._blob: memoryview = self._buffer[_offsets_end:]
+
+        self.scheme_version: str = self._string(strings[0], strings[1])
+        self.name: str = self._string(strings[2], strings[3])
+
+    @staticmethod
+    def _table(buffer: memoryview) -> Union[memoryview, array]:
+        """Unsigned int table, used in place on little-endian machines."""
+
+        if sys.byteorder == "little":
+            return buffer.cast("I")
+
+        values: array = array("I")
+        values.frombytes(buffer)
+        values.byteswap()
+        return values
+
+    def _string(self, offset: int, length: int) -> str:
+        return str(self._blob[offset : offset + length], "utf8")
+
+    def name_bytes(self, codepoint: int, /) -> memoryview:
+        """The UTF-8 name of a codepoint, as a view of the mapped file."""
+
+        index: int = bisect_left(self._codepoints, codepoint)
+        if index == self._code_count or self._codepoints[index] != codepoint:
+            raise KeyError(codepoint)
+
+        return self._blob[self._offsets[index] : self._offsets[index + 1]]
+
+    def __getitem__(self, codepoint: int) -> str:
+        return str(self.name_bytes(codepoint), "utf8")
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._codepoints)
+
+    def __len__(self) -> int:
+        return self._code_count
+
+    @property
+    def nodes(self) -> List[SnapshotNode]:
+        """The plane, block and section records, in depth first order."""
+
+        _nodes: List[SnapshotNode] = []
+
+        record: Tuple[int, ...]
+        for record in _NODE.iter_unpack(self._nodes):
+            _nodes.append(
+                SnapshotNode(
+                    level=record[0],
+                    parent=None if record[1] == _NO_PARENT else record[1],
+                    start=record[2],
+                    stop=record[3],
+                    name=self._string(record[4], record[5]),
+                    description=(
+                        None
+                        if record[7] == _NO_DESCRIPTION
+                        else self._string(record[6], record[7])
+                    ),
+                )
+            )
+
+        return _nodes
+
+    def close(self) -> None:
+        """Release the views of the mapped file, and close it."""
+
+        # Not all of the views are made when loading the file fails.
+        for name in ("_codepoints", "_offsets", "_nodes", "_blob"):
+            view: object = getattr(self, name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "NamecodeSnapshot":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    from nautilus_namecodes.scheme.registry import namecodes_registry
+
+    with open(sys.argv[1], "wb") as snapshot_file:
+        write_snapshot(namecodes_registry.get_all_codes(), snapshot_file)
@@ -0,0 +1,189 @@
+"""Export the Generated Namecodes to a SQLite Database
+
+The planes, blocks, sections and codes are written to normalized tables,
+each node with the start, stop and step of its allocated range, so other
+services can join the codes against their own tables, without loading
+and indexing the Json in every process:
+
+    SELECT codes.codepoint, codes.name, sections.name
+    FROM codes JOIN sections ON sections.id = codes.section_id
+    WHERE sections.start <= ? AND ? <= sections.stop;
+
+The database is written to a temporary file beside the path, with bulk
+inserts in a single transaction and the indexes made after the rows,
+then moved over the path, so readers never see a partial export."""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from nautilus_namecodes.namecodes_dataclasses import (
+    AllCodes,
+    BlockCodes,
+    PlaneCodes,
+    SectionCodes,
+    SectionStub,
+)
+from nautilus_namecodes.scheme.registry import namecodes_registry
+
+SCHEMA_VERSION: int = 1
+
+_TABLES: str = """
+CREATE TABLE scheme (
+    version TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    start INTEGER NOT NULL,
+    stop INTEGER NOT NULL,
+    step INTEGER NOT NULL
+);
+CREATE TABLE planes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    start INTEGER NOT NULL,
+    stop INTEGER NOT NULL,
+    step INTEGER NOT NULL
+);
+CREATE TABLE blocks (
+    id INTEGER PRIMARY KEY,
+    plane_id INTEGER NOT NULL REFERENCES planes (id),
+    name TEXT NOT NULL,
+    description TEXT,
+    start INTEGER NOT NULL,
+    stop INTEGER NOT NULL,
+    step INTEGER NOT NULL
+);
+CREATE TABLE sections (
+    id INTEGER PRIMARY KEY,
+    block_id INTEGER NOT NULL REFERENCES blocks (id),
+    name TEXT NOT NULL,
+    description TEXT,
+    start INTEGER NOT NULL,
+    stop INTEGER NOT NULL,
+    step INTEGER NOT NULL
+);
+CREATE TABLE codes (
+    codepoint INTEGER PRIMARY KEY,
+    section_id INTEGER NOT NULL REFERENCES sections (id),
+    name TEXT NOT NULL
+);
+"""
+
+_INDEXES: str = """
+CREATE INDEX blocks_plane ON blocks (plane_id);
+CREATE INDEX sections_block ON sections (block_id);
+CREATE UNIQUE INDEX sections_range ON sections (start, stop);
+CREATE INDEX codes_section ON codes (section_id, codepoint);
+CREATE INDEX codes_name ON codes (name);
+CREATE VIEW code_paths AS
+SELECT codes.codepoint AS codepoint, codes.name AS name,
+    sections.name AS section, blocks.name AS block, planes.name AS plane
+FROM codes
+JOIN sections ON sections.id = codes.section_id
+JOIN blocks ON blocks.id = sections.block_id
+JOIN planes ON planes.id = blocks.plane_id;
+"""
+
+_Node = Tuple[int, str, Optional[str], int, int, int]
+
+
+def _node(node_id: int, stub: SectionStub) -> _Node:
+    """The id, name, description and range of a node, as a row."""
+
+    return (
+        node_id,
+        stub.name,
+        stub.description,
+        stub.codepoints_allocated.start,
+        stub.codepoints_allocated.stop,
+        stub.codepoints_allocated.step,
+    )
+
+
+def insert_codes(connection: sqlite3.Connection, all_codes: AllCodes, /) -> None:
+    """Create the tables, and insert the codes, in the current transaction."""
+
+    planes: List[_Node] = []
+    blocks: List[Tuple[object, ...]] = []
+    sections: List[Tuple[object, ...]] = []
+    codes: List[Tuple[int, int, str]] = []
+
+    plane: PlaneCodes
+    for plane in all_codes.planes:
+        plane_id: int = len(planes) + 1
+        planes.append(_node(plane_id, plane))
+
+        block: BlockCodes
+        for block in plane.blocks:
+            block_id: int = len(blocks) + 1
+            blocks.append((plane_id, *_node(block_id, block)))
+
+            section: SectionCodes
+            for section in block.sections:
+                section_id: int = len(sections) + 1
+                sections.append((block_id, *_node(section_id, section)))
+                codes.extend(
+                    (codepoint, section_id, name)
+                    for codepoint, name in section.codes.items()
+                )
+
+    # Not executescript(), that would commit the transaction.
+    for statement in _TABLES.split(";"):
+        if statement.strip():
+            connection.execute(statement)
+
+    connection.execute(
+        "INSERT INTO scheme VALUES (?, ?, ?, ?, ?, ?)",
+        (all_codes.scheme_version, *_node(0, all_codes)[1:]),
+    )
+    connection.executemany("INSERT INTO planes VALUES (?, ?, ?, ?, ?, ?)", planes)
+    connection.executemany(
+        "INSERT INTO blocks (plane_id, id, name, description, start, stop, step)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        blocks,
+    )
+    connection.executemany(
+        "INSERT INTO sections (block_id, id, name, description, start, stop, step)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        sections,
+    )
+    connection.executemany("INSERT INTO codes VALUES (?, ?, ?)", codes)
+
+    for statement in _INDEXES.split(";"):
+        if statement.strip():
+            connection.execute(statement)
+
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION:d}")
+
+
+def write_sqlite(
+    path: Union[str, Path], all_codes: Optional[AllCodes] = None, /
+) -> None:
+    """Write the codes (of the default scheme) to a new SQLite database,
+    replacing any file at the path."""
+
+    if all_codes is None:
+        all_codes = namecodes_registry.get_all_codes()
+
+    path = Path(path)
+    temporary: Path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temporary.unlink(missing_ok=True)
+
+    try:
+        connection: sqlite3.Connection = sqlite3.connect(str(temporary))
+        try:
+            # The file is only moved to the path once complete.
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            with connection:
+                connection.execute("BEGIN")
+                insert_codes(connection, all_codes)
+        finally:
+            connection.close()
+
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
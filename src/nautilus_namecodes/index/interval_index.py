@@ -0,0 +1,126 @@
+"""Interval Index from Codepoints to their Sections
+
+The sections of a scheme are allocated in ascending, non-overlapping
+ranges of codepoints, so their starts are held in a sorted array and the
+section owning a codepoint, the sections and codes within an interval,
+and the next free codepoint of a section, are each found by a bisect."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import List, Optional
+
+from nautilus_namecodes.code_table import CodeTable
+from nautilus_namecodes.namecodes_dataclasses import (
+    AllCodes,
+    BlockCodes,
+    PlaneCodes,
+    SectionCodes,
+)
+
+
+class CodepointLookupError(KeyError):
+    """Raised when a codepoint is not allocated to any section."""
+
+
+@dataclass(frozen=True)
+class CodepointOwner:
+    """The section allocated a codepoint, with its block and plane."""
+
+    plane: PlaneCodes
+    block: BlockCodes
+    section: SectionCodes
+
+    @property
+    def path(self) -> str:
+        """The names of the plane, block and section, e.g. for display."""
+        return f"{self.plane.name}/{self.block.name}/{self.section.name}"
+
+
+class IntervalIndex:
+    """Immutable index of the allocated ranges of the sections of a scheme."""
+
+    def __init__(self, all_codes: AllCodes) -> None:
+        self._codes: CodeTable = (
+            all_codes.codes
+            if isinstance(all_codes.codes, CodeTable)
+            else CodeTable.concat([all_codes.codes])
+        )
+
+        self._owners: List[CodepointOwner] = []
+        starts: List[int] = []
+        stops: List[int] = []
+
+        plane: PlaneCodes
+        block: BlockCodes
+        section: SectionCodes
+        for plane, block, section in all_codes.walk_sections():
+            self._owners.append(CodepointOwner(plane, block, section))
+            starts.append(section.codepoints_allocated.start)
+            stops.append(section.codepoints_allocated.stop)
+
+        self._starts: array = array("L", starts)
+        self._stops: array = array("L", stops)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def _find(self, codepoint: int) -> Optional[int]:
+        """Index of the section allocated the codepoint, if any."""
+
+        index: int = bisect_right(self._starts, codepoint) - 1
+        if index < 0 or codepoint > self._stops[index]:
+            return None
+        return index
+
+    def owner(self, codepoint: int, /) -> CodepointOwner:
+        """Get the section, block and plane allocated a codepoint."""
+
+        index: Optional[int] = self._find(codepoint)
+        if index is None:
+            raise CodepointLookupError(codepoint)
+        return self._owners[index]
+
+    def __contains__(self, codepoint: object) -> bool:
+        return isinstance(codepoint, int) and self._find(codepoint) is not None
+
+    def sections_within(self, start: int, stop: int, /) -> List[CodepointOwner]:
+        """The sections allocated any codepoint from start to stop (inclusive)."""
+
+        first: int = bisect_left(self._stops, start)
+        last: int = bisect_right(self._starts, stop)
+        return self._owners[first:last]
+
+    def codes_within(self, start: int, stop: int, /) -> CodeTable:
+        """The codes from start to stop (inclusive), a view of the scheme codes."""
+        return self._codes.view(start, stop)
+
+    def section_codes(self, codepoint: int, /) -> CodeTable:
+        """The codes of the section allocated a codepoint."""
+
+        section: SectionCodes = self.owner(codepoint).section
+        return self.codes_within(
+            section.codepoints_allocated.start, section.codepoints_allocated.stop
+        )
+
+    def next_free(self, codepoint: int, /) -> Optional[int]:
+        """The first codepoint without a code, from the given codepoint to
+        the end of its section, or None if they are all used."""
+
+        section: SectionCodes = self.owner(codepoint).section
+        stop: int = section.codepoints_allocated.stop
+        codes: CodeTable = self.codes_within(codepoint, stop)
+
+        # The used codepoints are ascending, so the first gap is the first
+        # i where codes.codepoints[codes.low + i] != codepoint + i.
+        low: int = 0
+        high: int = len(codes)
+        while low < high:
+            middle: int = (low + high) // 2
+            if codes.codepoints[codes.low + middle] == codepoint + middle:
+                low = middle + 1
+            else:
+                high = middle
+
+        free: int = codepoint + low
+        return free if free <= stop else None
@@ -0,0 +1,71 @@
+"""Reverse Index from Namecode Names to Codepoints"""
+
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, SectionCodes
+
+
+class NamecodeLookupError(KeyError):
+    """Raised when a name, or section and value, is not a known namecode."""
+
+
+class ReverseIndex:
+    """Immutable mapping of namecode names back to their codepoints.
+
+    Names are indexed both as the exact formatted string, e.g.
+    "(colour) greyscale", and as a (section, value) tuple, e.g.
+    ("colour", "greyscale"). Where a name is repeated the lowest
+    codepoint is kept."""
+
+    def __init__(self, all_codes: AllCodes) -> None:
+        names: Dict[str, int] = {}
+        section_values: Dict[Tuple[str, str], int] = {}
+
+        section: SectionCodes
+        for _, _, section in all_codes.walk_sections():
+            prefix: str = f"({section.name}) "
+
+            codepoint: int
+            name: str
+            for codepoint, name in section.codes.items():
+                value: str = name[len(prefix) :] if name.startswith(prefix) else name
+                names.setdefault(name, codepoint)
+                section_values.setdefault((section.name, value), codepoint)
+
+        self._names: Mapping[str, int] = MappingProxyType(names)
+        self._section_values: Mapping[Tuple[str, str], int] = MappingProxyType(
+            section_values
+        )
+
+    @property
+    def names(self) -> Mapping[str, int]:
+        """Read-only mapping of formatted names to codepoints."""
+        return self._names
+
+    @property
+    def section_values(self) -> Mapping[Tuple[str, str], int]:
+        """Read-only mapping of (section, value) tuples to codepoints."""
+        return self._section_values
+
+    def lookup(self, name: str, /) -> int:
+        """Get the codepoint of a formatted name."""
+
+        try:
+            return self._names[name]
+        except KeyError:
+            raise NamecodeLookupError(name) from None
+
+    def lookup_value(self, section: str, value: str, /) -> int:
+        """Get the codepoint of a value within a named section."""
+
+        try:
+            return self._section_values[(section, value)]
+        except KeyError:
+            raise NamecodeLookupError((section, value)) from None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names or name in self._section_values
+
+    def __len__(self) -> int:
+        return len(self._names)
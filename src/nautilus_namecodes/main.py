@@ -1,12 +1,15 @@
 """Main Module for Command Line App"""
 
-from typing import Optional
+from pathlib import Path
+from typing import Optional, TextIO
 
 import typer
 from typer.main import Typer
 
-from nautilus_namecodes._version import __version__
-from nautilus_namecodes.format.generate_console import ConsoleOutput
+# The version and output formats are imported on use, so that each path
+# only imports what it needs (e.g. no pydantic for Markdown or --version).
+
+# pylint: disable=import-outside-toplevel
 
 app: Typer = typer.Typer()
 
@@ -33,7 +36,9 @@ def version_callback(value: bool) -> None:
     """Simple Callback Function to return the Version Number of the Program"""
 
     if value:
-        typer.echo(f"Namecodes Version: {__version__}")
+        from nautilus_namecodes._version import resolve_version
+
+        typer.echo(f"Namecodes Version: {resolve_version()}")
         raise typer.Exit()
 
 
@@ -79,37 +84,71 @@ def codes(  # pylint: disable="too-many-arguments,too-many-branches"
         help="Format Output as Json",
         callback=format_exclusivity_callback,
     ),
+    sqlite: Optional[Path] = typer.Option(
+        None,
+        "--sqlite",
+        help="Write Planes, Blocks, Sections and Codes to a SQLite Database.",
+        dir_okay=False,
+        metavar="PATH",
+    ),
+    columns: Optional[Path] = typer.Option(
+        None,
+        "--columns",
+        help="Write the Codes as Columns: Arrow, NumPy or CSV, by the Suffix.",
+        dir_okay=False,
+        metavar="PATH",
+    ),
 ) -> None:
     """Command for the Management of Name Codes"""
 
+    if sqlite is not None:
+        from nautilus_namecodes.format.sqlite_export import write_sqlite
+
+        write_sqlite(sqlite)
+
+    if columns is not None:
+        from nautilus_namecodes.format.columnar_export import write_columns
+
+        typer.echo(f"Wrote columns to: {write_columns(columns)}", err=True)
+
     if not any([show_tree, show_blocks, show_codes]):
+        if sqlite is not None or columns is not None:
+            return
         raise typer.BadParameter(
-            "Required to specify either: --show-tree, --show-blocks, --show-codes, ."
+            "Required to specify either: --show-tree, --show-blocks, --show-codes,"
+            " --sqlite, --columns."
         )
 
     if not any([markdown, json_schema, json]):
         typer.echo("Defaulting to Markdown output.")
         markdown = True
 
+    from nautilus_namecodes.format.generate_console import ConsoleOutput
+
+    stdout: TextIO = typer.get_text_stream("stdout")
+
     if markdown:
         if show_tree:
-            typer.echo(ConsoleOutput.generate_tree_output())
+            ConsoleOutput.write_tree_output(stdout)
 
         if show_blocks:
-            typer.echo(ConsoleOutput.generate_blocks_output())
+            ConsoleOutput.write_blocks_output(stdout)
 
         if show_codes:
-            typer.echo(ConsoleOutput.generate_codes_output())
+            ConsoleOutput.write_codes_output(stdout)
 
     if json:
         if show_tree:
-            typer.echo(ConsoleOutput.generate_json_tree())
+            ConsoleOutput.write_json_tree(stdout)
+            stdout.write("\n")
 
         if show_blocks:
-            typer.echo(ConsoleOutput.generate_json())
+            ConsoleOutput.write_json(stdout)
+            stdout.write("\n")
 
         if show_codes:
-            typer.echo(ConsoleOutput.generate_json_codelist())
+            ConsoleOutput.write_json_codelist(stdout)
+            stdout.write("\n")
 
     if json_schema:
         if show_tree:
@@ -1,11 +1,28 @@
 """Data Classes for Constructed Namecodes"""
 
-from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from nautilus_namecodes.code_table import CodeTable
 
 RangeTypeT = TypeVar("RangeTypeT", bound="Range")
 
+if TYPE_CHECKING:
+    Codes = Mapping[int, str]
+else:
+    # Pydantic validates, and serializes, the codes as a plain dict.
+    Codes = Dict[int, str]
+
 
 class Range:
     """Placeholder Range Class to help Pydantic."""
@@ -73,7 +90,7 @@ class TreeStub(SectionStub):
 class SectionCodes(SectionStub):
     """Data Class for Generated Section Codes"""
 
-    codes: Dict[int, str]
+    codes: Codes
 
 
 @dataclass
@@ -81,17 +98,14 @@ class BlockCodes(SectionStub):
     """Data Class for Generated Block Codes"""
 
     sections: List[SectionCodes]
-    codes: Dict[int, str] = field(init=False)
+    codes: Codes = field(init=False)
 
     def __post_init__(self) -> None:
-        self.codes = {}
-        for section in self.sections:
-
+        self.codes = CodeTable.concat(
             # hack for pydantic
-            if isinstance(section, Mapping):
-                self.codes |= section["codes"]
-            else:
-                self.codes |= section.codes
+            section["codes"] if isinstance(section, Mapping) else section.codes
+            for section in self.sections
+        )
 
 
 @dataclass
@@ -99,33 +113,62 @@ class PlaneCodes(SectionStub):
     """Data Class for Generated Plane Codes"""
 
     blocks: List[BlockCodes]
-    codes: Dict[int, str] = field(init=False)
+    codes: Codes = field(init=False)
 
     def __post_init__(self) -> None:
-        self.codes = {}
-        for block in self.blocks:
-
+        self.codes = CodeTable.concat(
             # hack for pydantic
-            if isinstance(block, Mapping):
-                self.codes |= block["codes"]
-            else:
-                self.codes |= block.codes
+            block["codes"] if isinstance(block, Mapping) else block.codes
+            for block in self.blocks
+        )
 
 
 @dataclass
 class AllCodes(SectionStub):
-    """Data Class for all the Generated Namecodes"""
+    """Data Class for all the Generated Namecodes
+
+    All the codes are held in a single CodeTable, the codes of each plane,
+    block and section are views of it."""
 
     planes: List[PlaneCodes]
-    codes: Dict[int, str] = field(init=False)
+    codes: Codes = field(init=False)
     scheme_version: str
 
     def __post_init__(self) -> None:
-        self.codes = {}
+        _codes: CodeTable = CodeTable.concat(
+            # hack for pydantic
+            plane["codes"] if isinstance(plane, Mapping) else plane.codes
+            for plane in self.planes
+        )
+        self.codes = _codes
+
+        if any(isinstance(plane, Mapping) for plane in self.planes):
+            return
+
+        _node: SectionStub
+        for _node in self.walk_nodes():
+            _node.codes = _codes.view(  # type: ignore
+                _node.codepoints_allocated.start, _node.codepoints_allocated.stop
+            )
+
+    def walk_nodes(self) -> Iterator[SectionStub]:
+        """Iterate over every plane, block and section, depth first."""
+
+        plane: PlaneCodes
         for plane in self.planes:
+            yield plane
+            block: BlockCodes
+            for block in plane.blocks:
+                yield block
+                yield from block.sections
 
-            # hack for pydantic
-            if isinstance(plane, Mapping):
-                self.codes |= plane["codes"]
-            else:
-                self.codes |= plane.codes
+    def walk_sections(self) -> Iterator[Tuple[PlaneCodes, BlockCodes, SectionCodes]]:
+        """Iterate over every section, with its plane and block, in order."""
+
+        plane: PlaneCodes
+        for plane in self.planes:
+            block: BlockCodes
+            for block in plane.blocks:
+                section: SectionCodes
+                for section in block.sections:
+                    yield plane, block, section
@@ -0,0 +1,466 @@
+"""On Disk Index of the Namecodes of a Media Tree
+
+The files of a media tree whose names decode as namecodes are held in a
+SQLite database, by their directory and name relative to the root of the
+tree, with a row per (file, codepoint). Both the files of a code and the
+codes of a file are read from an index, so the tree is only scanned once
+and then queried, by any process, without scanning it again.
+
+The modification time and inode of each directory, and the inode of each
+file, are kept so a rescan only lists the directories that changed, and
+can tell a renamed file from a removed and an added one.
+
+Only one writer (e.g. a TreeScanner) may change an index at a time."""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+SCHEMA_VERSION: int = 2
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS directories (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    parent_id INTEGER REFERENCES directories (id),
+    mtime_ns INTEGER,
+    inode INTEGER
+);
+CREATE INDEX IF NOT EXISTS directories_parent ON directories (parent_id);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    directory_id INTEGER NOT NULL REFERENCES directories (id),
+    name TEXT NOT NULL,
+    inode INTEGER,
+    UNIQUE (directory_id, name)
+);
+CREATE INDEX IF NOT EXISTS files_inode ON files (inode);
+CREATE TABLE IF NOT EXISTS file_codes (
+    file_id INTEGER NOT NULL REFERENCES files (id),
+    codepoint INTEGER NOT NULL,
+    PRIMARY KEY (file_id, codepoint)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS file_codes_codepoint ON file_codes (codepoint, file_id);
+CREATE VIEW IF NOT EXISTS file_paths AS
+SELECT files.id AS file_id, directories.path AS directory, files.name AS name,
+    CASE directories.path WHEN '' THEN files.name
+        ELSE directories.path || '/' || files.name END AS path
+FROM files JOIN directories ON directories.id = files.directory_id;
+"""
+
+# The statements to upgrade an index from each older schema version.
+_MIGRATIONS: Dict[int, str] = {
+    1: """
+ALTER TABLE directories ADD COLUMN parent_id INTEGER REFERENCES directories (id);
+ALTER TABLE directories ADD COLUMN mtime_ns INTEGER;
+ALTER TABLE directories ADD COLUMN inode INTEGER;
+ALTER TABLE files ADD COLUMN inode INTEGER;
+""",
+}
+
+
+class IndexedFile(NamedTuple):
+    """The name, codepoints and (if known) inode of a file of a directory."""
+
+    name: str
+    codes: Tuple[int, ...]
+    inode: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class DirectoryState:
+    """The modification time and inode of a directory, when it was listed."""
+
+    mtime_ns: int
+    inode: int
+
+
+class MediaIndexError(ValueError):
+    """Raised when a database is not a media index this version can read."""
+
+
+class MediaIndexLookupError(KeyError):
+    """Raised when a file is not in the index."""
+
+
+def split_path(path: str, /) -> Tuple[str, str]:
+    """The directory and name of a path relative to the root of the tree."""
+
+    directory, _, name = path.rpartition("/")
+    return directory, name
+
+
+class MediaIndex:  # pylint: disable=too-many-public-methods
+    """Index of the files of a media tree by their namecodes."""
+
+    def __init__(self, database: Union[str, Path]) -> None:
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            str(database), check_same_thread=False
+        )
+        self._directory_ids: Dict[str, int] = {}
+
+        version: int = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        tables: int = self._connection.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'table'"
+        ).fetchone()[0]
+
+        if tables and version != SCHEMA_VERSION and version not in _MIGRATIONS:
+            self._connection.close()
+            raise MediaIndexError(
+                f"media index schema version {version}, expected {SCHEMA_VERSION}:"
+                f" {database}"
+            )
+
+        with self._connection:
+            if tables:
+                migrated: bool = version in _MIGRATIONS
+                while version in _MIGRATIONS:
+                    self._connection.executescript(_MIGRATIONS[version])
+                    version += 1
+            self._connection.executescript(_SCHEMA)
+            if tables and migrated:
+                self._link_directories()
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION:d}")
+
+    def _link_directories(self) -> None:
+        """Set the parent of every directory without one, adding the parents
+        that are missing, as an index older than version 2 has no parents."""
+
+        directory: str
+        for (directory,) in self._connection.execute(
+            "SELECT path FROM directories WHERE parent_id IS NULL AND path != ''"
+        ).fetchall():
+            self._connection.execute(
+                "UPDATE directories SET parent_id = ? WHERE path = ?",
+                (self.directory_id(split_path(directory)[0]), directory),
+            )
+
+    def __enter__(self) -> "MediaIndex":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Commit any change, and close the database."""
+
+        self._connection.commit()
+        self._connection.close()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The SQLite connection, e.g. to make other queries."""
+        return self._connection
+
+    def get_meta(self, key: str, /) -> Optional[str]:
+        """A value stored with the index, e.g. the 'root' of the tree."""
+
+        row: Optional[Tuple[str]] = self._connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def set_meta(self, key: str, value: str, /) -> None:
+        """Store a value with the index."""
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def directory_id(self, directory: str, /) -> int:
+        """The id of a directory, adding it (and its parents) if it is new."""
+
+        directory_id: Optional[int] = self._directory_ids.get(directory)
+        if directory_id is not None:
+            return directory_id
+
+        row: Optional[Tuple[int]] = self._connection.execute(
+            "SELECT id FROM directories WHERE path = ?", (directory,)
+        ).fetchone()
+        if row is not None:
+            directory_id = row[0]
+        else:
+            parent_id: Optional[int] = (
+                self.directory_id(split_path(directory)[0]) if directory else None
+            )
+            directory_id = cast(
+                int,
+                self._connection.execute(
+                    "INSERT INTO directories (path, parent_id) VALUES (?, ?)",
+                    (directory, parent_id),
+                ).lastrowid,
+            )
+
+        self._directory_ids[directory] = directory_id
+        return directory_id
+
+    def directory_state(self, directory: str, /) -> Optional[DirectoryState]:
+        """The state of a directory when it was last listed, if it was."""
+
+        row: Optional[Tuple[Optional[int], Optional[int]]] = self._connection.execute(
+            "SELECT mtime_ns, inode FROM directories WHERE path = ?", (directory,)
+        ).fetchone()
+        if row is None or row[0] is None or row[1] is None:
+            return None
+        return DirectoryState(row[0], row[1])
+
+    def set_directory_state(
+        self, directory: str, state: Optional[DirectoryState], /
+    ) -> None:
+        """Record the state of a directory, as it was listed, or None to
+        have it listed again by the next rescan."""
+
+        self._connection.execute(
+            "UPDATE directories SET mtime_ns = ?, inode = ? WHERE id = ?",
+            (
+                None if state is None else state.mtime_ns,
+                None if state is None else state.inode,
+                self.directory_id(directory),
+            ),
+        )
+
+    def subdirectories(
+        self, directory: str, /
+    ) -> List[Tuple[str, Optional[DirectoryState]]]:
+        """The paths and states of the subdirectories of a directory."""
+
+        return [
+            (path, None if mtime_ns is None else DirectoryState(mtime_ns, inode))
+            for path, mtime_ns, inode in self._connection.execute(
+                "SELECT path, mtime_ns, inode FROM directories WHERE parent_id ="
+                " (SELECT id FROM directories WHERE path = ?) ORDER BY path",
+                (directory,),
+            )
+        ]
+
+    def subtree_directory_ids(self, directory: str, /) -> List[int]:
+        """The ids of a directory and of all the directories below it."""
+
+        # The paths below 'a/b' are from 'a/b/' up to 'a/b0', as '0' follows '/'.
+        return [
+            row[0]
+            for row in self._connection.execute(
+                "SELECT id FROM directories WHERE path = ?"
+                " OR (path >= ? || '/' AND path < ? || '0')",
+                (directory, directory, directory),
+            )
+        ]
+
+    def remove_directories(self, directory_ids: Iterable[int], /) -> int:
+        """Remove directories, and their files, returning the files removed."""
+
+        _ids: str = json.dumps(list(directory_ids))
+        removed: int = self.remove_file_ids(
+            row[0]
+            for row in self._connection.execute(
+                "SELECT id FROM files"
+                " WHERE directory_id IN (SELECT value FROM json_each(?))",
+                (_ids,),
+            ).fetchall()
+        )
+        self._connection.execute(
+            "DELETE FROM directories WHERE id IN (SELECT value FROM json_each(?))",
+            (_ids,),
+        )
+        self._directory_ids.clear()
+        return removed
+
+    def directory_files(
+        self, directory: str, /
+    ) -> Dict[str, Tuple[int, Optional[int]]]:
+        """The (file id, inode) of each file of a directory, by name."""
+
+        return {
+            name: (file_id, inode)
+            for file_id, name, inode in self._connection.execute(
+                "SELECT files.id, files.name, files.inode FROM files"
+                " JOIN directories ON directories.id = files.directory_id"
+                " WHERE directories.path = ?",
+                (directory,),
+            )
+        }
+
+    def files_with_inode(self, inode: int, /) -> List[Tuple[int, str]]:
+        """The (file id, path) of the files with an inode (more than one if
+        they are hard links)."""
+
+        return self._connection.execute(
+            "SELECT files.id, file_paths.path FROM files"
+            " JOIN file_paths ON file_paths.file_id = files.id WHERE files.inode = ?",
+            (inode,),
+        ).fetchall()
+
+    def move_file(self, file_id: int, directory: str, file: IndexedFile, /) -> None:
+        """Move a file of the index to a new directory and name, with the
+        codes and inode of its new name, replacing any other file of the
+        new name."""
+
+        self.remove_file_ids(
+            row[0]
+            for row in self._connection.execute(
+                "SELECT file_id FROM file_paths"
+                " WHERE directory = ? AND name = ? AND file_id != ?",
+                (directory, file.name, file_id),
+            ).fetchall()
+        )
+        self._connection.execute(
+            "UPDATE files SET directory_id = ?, name = ?, inode = ? WHERE id = ?",
+            (self.directory_id(directory), file.name, file.inode, file_id),
+        )
+        self._connection.execute("DELETE FROM file_codes WHERE file_id = ?", (file_id,))
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO file_codes (file_id, codepoint) VALUES (?, ?)",
+            [(file_id, codepoint) for codepoint in file.codes],
+        )
+
+    def add_files(self, directory: str, files: Iterable[IndexedFile], /) -> int:
+        """Add (or replace) files of a directory.
+
+        The changes are part of the current transaction, see commit()."""
+
+        directory_id: int = self.directory_id(directory)
+        _files: List[IndexedFile] = list(files)
+
+        self.remove_files(directory, (file.name for file in _files))
+
+        cursor: sqlite3.Cursor = self._connection.execute(
+            "SELECT coalesce(max(id), 0) FROM files"
+        )
+        next_id: int = cursor.fetchone()[0] + 1
+        ids: range = range(next_id, next_id + len(_files))
+
+        self._connection.executemany(
+            "INSERT INTO files (id, directory_id, name, inode) VALUES (?, ?, ?, ?)",
+            [
+                (file_id, directory_id, file.name, file.inode)
+                for file_id, file in zip(ids, _files)
+            ],
+        )
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO file_codes (file_id, codepoint) VALUES (?, ?)",
+            [
+                (file_id, codepoint)
+                for file_id, file in zip(ids, _files)
+                for codepoint in file.codes
+            ],
+        )
+
+        return len(_files)
+
+    def remove_files(self, directory: str, names: Iterable[str], /) -> int:
+        """Remove files of a directory, returning how many were in the index."""
+
+        return self.remove_file_ids(
+            row[0]
+            for row in self._connection.execute(
+                "SELECT file_id FROM file_paths WHERE directory = ?"
+                " AND name IN (SELECT value FROM json_each(?))",
+                (directory, json.dumps(list(names))),
+            ).fetchall()
+        )
+
+    def remove_file_ids(self, file_ids: Iterable[int], /) -> int:
+        """Remove files by their ids, returning how many were removed."""
+
+        _ids: List[Tuple[int]] = [(file_id,) for file_id in file_ids]
+        self._connection.executemany("DELETE FROM file_codes WHERE file_id = ?", _ids)
+        return self._connection.executemany(
+            "DELETE FROM files WHERE id = ?", _ids
+        ).rowcount
+
+    def clear(self) -> None:
+        """Remove every file and directory from the index."""
+
+        self._connection.execute("DELETE FROM file_codes")
+        self._connection.execute("DELETE FROM files")
+        self._connection.execute("DELETE FROM directories")
+        self._directory_ids.clear()
+
+    def commit(self) -> None:
+        """Commit the changes, making them visible to other connections."""
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        """Drop the changes since the last commit."""
+
+        self._connection.rollback()
+        self._directory_ids.clear()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT count(*) FROM files").fetchone()[0]
+
+    def _file_id(self, path: str) -> Optional[int]:
+        row: Optional[Tuple[int]] = self._connection.execute(
+            "SELECT file_id FROM file_paths WHERE directory = ? AND name = ?",
+            split_path(path),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self._file_id(path) is not None
+
+    def codes_of(self, path: str, /) -> Tuple[int, ...]:
+        """The codepoints of a file, by its path relative to the root."""
+
+        file_id: Optional[int] = self._file_id(path)
+        if file_id is None:
+            raise MediaIndexLookupError(path)
+
+        return tuple(
+            row[0]
+            for row in self._connection.execute(
+                "SELECT codepoint FROM file_codes WHERE file_id = ?"
+                " ORDER BY codepoint",
+                (file_id,),
+            )
+        )
+
+    def files_with_code(self, codepoint: int, /) -> Iterator[str]:
+        """The paths of the files with a codepoint, streamed in path order."""
+
+        cursor: sqlite3.Cursor = self._connection.execute(
+            "SELECT path FROM file_paths"
+            " JOIN file_codes ON file_codes.file_id = file_paths.file_id"
+            " WHERE codepoint = ? ORDER BY directory, name",
+            (codepoint,),
+        )
+        return (row[0] for row in cursor)
+
+    def files_with_codes(self, codes: Iterable[int], /) -> Iterator[str]:
+        """The paths of the files with every one of the codepoints."""
+
+        _codes: List[int] = sorted(set(codes))
+
+        cursor: sqlite3.Cursor = self._connection.execute(
+            "SELECT path FROM file_paths WHERE file_id IN ("
+            " SELECT file_id FROM file_codes"
+            " WHERE codepoint IN (SELECT value FROM json_each(?))"
+            " GROUP BY file_id HAVING count(*) = ?)"
+            " ORDER BY directory, name",
+            (json.dumps(_codes), len(_codes)),
+        )
+        return (row[0] for row in cursor)
+
+    def files(self) -> Iterator[str]:
+        """The paths of every file of the index, streamed in path order."""
+
+        cursor: sqlite3.Cursor = self._connection.execute(
+            "SELECT path FROM file_paths ORDER BY directory, name"
+        )
+        return (row[0] for row in cursor)
@@ -0,0 +1,433 @@
+"""Scan a Media Tree into a Namecode Index
+
+The directories of the tree are listed with os.scandir() by a pool of
+threads, each listing one directory at a time, so the subtrees are walked
+in parallel. The files whose names decode as namecodes are passed, in
+batches, through a bounded queue to the one thread writing the index. So
+the memory used depends on the number of workers and the batch size, not
+on the size of the tree.
+
+    with MediaIndex("media.sqlite") as index:
+        stats: ScanStats = TreeScanner("/srv/media", index).scan()
+
+A rescan() only lists the directories whose modification time or inode
+changed since they were last listed, the others are only stat()ed, and
+applies the added, removed and renamed files to the index. A new name
+with the inode of a file of the index is a rename, unless the old file
+is still there (a hard link).
+
+A directory modified within _RACY_NS of being listed may be modified
+again without its modification time changing (the clock of the file
+system is coarse), so its state is not recorded and it is listed again
+by the next rescan."""
+
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import Field, dataclass, field, fields
+from pathlib import Path
+from queue import Queue
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from nautilus_namecodes.codec.filename_codec import FilenameCodec, NamecodeCodecError
+from nautilus_namecodes.scanner.media_index import (
+    DirectoryState,
+    IndexedFile,
+    MediaIndex,
+    MediaIndexError,
+)
+from nautilus_namecodes.scheme.registry import (
+    DEFAULT_SCHEME_VERSION,
+    namecodes_registry,
+)
+
+# The coarsest modification time of the common file systems (FAT), in ns.
+_RACY_NS: int = 2_000_000_000
+
+
+@dataclass
+class ScanStats:  # pylint: disable=too-many-instance-attributes
+    """Counts of a scan, the 'errors' are the directories that could not
+    be listed, by their path relative to the root.
+
+    A full scan adds every indexed file, a rescan only the new files, and
+    counts the files 'removed' and 'renamed', and the directories that
+    were 'unchanged' and not listed again."""
+
+    directories: int = 0
+    unchanged: int = 0
+    files: int = 0
+    undecoded: int = 0
+    indexed: int = 0
+    added: int = 0
+    removed: int = 0
+    renamed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def merge(self, other: "ScanStats", /) -> None:
+        """Add the counts, and errors, of another scan to these."""
+
+        _field: Field
+        for _field in fields(self):
+            if _field.name == "errors":
+                self.errors.extend(other.errors)
+            else:
+                setattr(
+                    self,
+                    _field.name,
+                    getattr(self, _field.name) + getattr(other, _field.name),
+                )
+
+
+@dataclass(frozen=True)
+class _Batch:
+    """Decoded files of a directory, written by the index thread."""
+
+    directory: str
+    files: List[IndexedFile]
+    undecoded: int
+
+
+@dataclass(frozen=True)
+class _Listed:
+    """The end of the visit of a directory, with its subdirectories if it
+    was listed, or None if it is unchanged (or could not be listed). The
+    state of a listed directory is None if it was modified too recently."""
+
+    directory: str
+    state: Optional[DirectoryState]
+    subdirectories: Optional[List[str]]
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class _Changes:
+    """The changes of a rescan, applied to the index at its end."""
+
+    # The files of the directories being listed, that are not seen yet.
+    unseen: Dict[str, Dict[str, Tuple[int, Optional[int]]]] = field(
+        default_factory=dict
+    )
+    moved: Set[int] = field(default_factory=set)
+    removed: Set[int] = field(default_factory=set)
+    vanished: List[int] = field(default_factory=list)
+
+
+def join_path(directory: str, name: str, /) -> str:
+    """The path of an entry of a directory, relative to the root."""
+    return f"{directory}/{name}" if directory else name
+
+
+class TreeScanner:
+    """Scan the files of a tree, by their namecodes, into a MediaIndex.
+
+    Symbolic links are not followed, and files whose names do not decode
+    (ignoring any extension) are not indexed."""
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        index: MediaIndex,
+        codec: Optional[FilenameCodec] = None,
+        *,
+        workers: int = 4,
+        batch_size: int = 1000,
+    ) -> None:
+        self.root: Path = Path(root)
+        self.index: MediaIndex = index
+        self.codec: FilenameCodec = (
+            namecodes_registry.get_derived(FilenameCodec, DEFAULT_SCHEME_VERSION)
+            if codec is None
+            else codec
+        )
+        self.workers: int = max(1, workers)
+        self.batch_size: int = max(1, batch_size)
+
+    def decode(self, name: str, /) -> Optional[Tuple[int, ...]]:
+        """The codepoints of a filename, or None if it is not a namecode."""
+
+        try:
+            codes: Tuple[int, ...] = self.codec.decode_filename(name)
+        except NamecodeCodecError:
+            return None
+        return codes or None
+
+    def _visit_directory(
+        self,
+        directory: str,
+        stored: Optional[DirectoryState],
+        results: "Queue[object]",
+    ) -> None:
+        """Visit a directory, in a worker thread. Unless it is unchanged since
+        its stored state, put its batches of files and then its
+        subdirectories on the results queue."""
+
+        try:
+            now: int = time.time_ns()
+            path: Path = self.root.joinpath(directory)
+            stat_result: os.stat_result = os.stat(path, follow_symlinks=False)
+            state: DirectoryState = DirectoryState(
+                stat_result.st_mtime_ns, stat_result.st_ino
+            )
+
+            if state == stored:
+                results.put(_Listed(directory, state, None))
+                return
+
+            subdirectories: List[str] = []
+            files: List[IndexedFile] = []
+            undecoded: int = 0
+
+            with os.scandir(path) as entries:
+                entry: os.DirEntry
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(join_path(directory, entry.name))
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    codes: Optional[Tuple[int, ...]] = self.decode(entry.name)
+                    if codes is None:
+                        undecoded += 1
+                        continue
+
+                    files.append(IndexedFile(entry.name, codes, entry.inode()))
+                    if len(files) >= self.batch_size:
+                        results.put(_Batch(directory, files, undecoded))
+                        files, undecoded = [], 0
+
+            results.put(_Batch(directory, files, undecoded))
+            results.put(
+                _Listed(
+                    directory,
+                    state if now - state.mtime_ns >= _RACY_NS else None,
+                    subdirectories,
+                )
+            )
+
+        except BaseException as error:  # pylint: disable=broad-except
+            results.put(_Listed(directory, None, None, error))
+
+    def _walk(
+        self,
+        directories: List[Tuple[str, Optional[DirectoryState]]],
+        stats: ScanStats,
+        changes: Optional[_Changes] = None,
+    ) -> None:
+        """Visit the (directory, stored state)s, and all of their subdirectories,
+        into the index. Without changes, every file is added as new. The
+        caller commits (or rolls back) the changes."""
+
+        results: "Queue[object]" = Queue(maxsize=self.workers * 4)
+        pending: List[Tuple[str, Optional[DirectoryState]]] = list(directories)
+        visiting: int = 0
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="tree-scanner"
+        ) as pool:
+            while pending or visiting:
+                while pending and visiting < self.workers:
+                    pool.submit(self._visit_directory, *pending.pop(), results)
+                    visiting += 1
+
+                result: object = results.get()
+
+                if isinstance(result, _Batch):
+                    self._write_batch(result, stats, changes)
+                    continue
+
+                if not isinstance(result, _Listed):
+                    raise TypeError(f"unexpected scan result: {result!r}")
+
+                visiting -= 1
+                stats.directories += 1
+
+                if isinstance(result.error, OSError):
+                    stats.errors.append(result.directory)
+                elif result.error is not None:
+                    # Stop visiting, and wait for the visits in progress.
+                    pending.clear()
+                    while visiting:
+                        if isinstance(results.get(), _Listed):
+                            visiting -= 1
+                    raise result.error
+                else:
+                    pending.extend(self._write_listed(result, stats, changes))
+
+    def _write_batch(
+        self, batch: _Batch, stats: ScanStats, changes: Optional[_Changes]
+    ) -> None:
+        stats.files += len(batch.files) + batch.undecoded
+        stats.undecoded += batch.undecoded
+
+        if changes is None:
+            if batch.files:
+                added: int = self.index.add_files(batch.directory, batch.files)
+                stats.added += added
+                stats.indexed += added
+            return
+
+        if batch.directory not in changes.unseen:
+            changes.unseen[batch.directory] = self.index.directory_files(
+                batch.directory
+            )
+        unseen: Dict[str, Tuple[int, Optional[int]]] = changes.unseen[batch.directory]
+
+        new: List[IndexedFile] = []
+
+        file: IndexedFile
+        for file in batch.files:
+            known: Optional[Tuple[int, Optional[int]]] = unseen.pop(file.name, None)
+
+            if known is not None:
+                if known[1] != file.inode:
+                    # Replaced by another file of the same name.
+                    self.index.move_file(known[0], batch.directory, file)
+                continue
+
+            file_id: Optional[int] = self._renamed_from(file, changes)
+            if file_id is None:
+                new.append(file)
+                continue
+
+            self.index.move_file(file_id, batch.directory, file)
+            changes.moved.add(file_id)
+            changes.removed.discard(file_id)
+            stats.renamed += 1
+            stats.indexed += 1
+
+        if new:
+            stats.added += self.index.add_files(batch.directory, new)
+            stats.indexed += len(new)
+
+    def _renamed_from(self, file: IndexedFile, changes: _Changes) -> Optional[int]:
+        """The id of the file of the index that is now this new file, if any."""
+
+        if file.inode is None:
+            return None
+
+        file_id: int
+        path: str
+        for file_id, path in self.index.files_with_inode(file.inode):
+            if file_id in changes.moved:
+                continue
+            try:
+                if os.lstat(self.root.joinpath(path)).st_ino == file.inode:
+                    continue  # Still there, a hard link.
+            except OSError:
+                pass
+            return file_id
+
+        return None
+
+    def _write_listed(
+        self, listed: _Listed, stats: ScanStats, changes: Optional[_Changes]
+    ) -> List[Tuple[str, Optional[DirectoryState]]]:
+        """Record a visited directory, returning its subdirectories to visit."""
+
+        if listed.subdirectories is None:
+            stats.unchanged += 1
+            return self.index.subdirectories(listed.directory)
+
+        self.index.set_directory_state(listed.directory, listed.state)
+
+        if changes is None:
+            return [(subdirectory, None) for subdirectory in listed.subdirectories]
+
+        file_id: int
+        for file_id, _ in changes.unseen.pop(listed.directory, {}).values():
+            if file_id not in changes.moved:
+                changes.removed.add(file_id)
+
+        stored: Dict[str, Optional[DirectoryState]] = dict(
+            self.index.subdirectories(listed.directory)
+        )
+
+        subdirectory: str
+        for subdirectory in set(stored) - set(listed.subdirectories):
+            changes.vanished.extend(self.index.subtree_directory_ids(subdirectory))
+
+        return [
+            (subdirectory, stored.get(subdirectory))
+            for subdirectory in listed.subdirectories
+        ]
+
+    def _check_root(self) -> str:
+        """The resolved root, which must be the root of any files indexed."""
+
+        root: str = str(self.root.resolve())
+        indexed_root: Optional[str] = self.index.get_meta("root")
+
+        if indexed_root is not None and indexed_root != root and len(self.index):
+            raise MediaIndexError(f"index of another tree: {indexed_root}")
+
+        self.index.set_meta("root", root)
+        return root
+
+    def scan(self) -> ScanStats:
+        """Replace the index with a full scan of the tree."""
+
+        stats: ScanStats = ScanStats()
+
+        try:
+            self.index.clear()
+            self._check_root()
+            self._walk([("", None)], stats)
+        except BaseException:
+            self.index.rollback()
+            raise
+
+        self.index.commit()
+        return stats
+
+    def _is_directory(self, directory: str, /) -> bool:
+        try:
+            return stat.S_ISDIR(os.lstat(self.root.joinpath(directory)).st_mode)
+        except OSError:
+            return False
+
+    def rescan(self, directories: Optional[Iterable[str]] = None) -> ScanStats:
+        """Update the index with the changes to the tree since it was scanned.
+
+        Or only with the changes to the given directories (relative to the
+        root), that are listed again, and to their changed subdirectories.
+        A given directory that is gone is removed, with its subdirectories."""
+
+        stats: ScanStats = ScanStats()
+        changes: _Changes = _Changes()
+        start: List[Tuple[str, Optional[DirectoryState]]] = []
+
+        try:
+            self._check_root()
+
+            if directories is None:
+                start.append(("", self.index.directory_state("")))
+            else:
+                given: Set[str] = set(directories)
+                directory: str
+                for directory in sorted(given):
+                    if any(
+                        directory.startswith(f"{parent}/") or not parent
+                        for parent in given
+                        if parent != directory
+                    ):
+                        continue  # Within another given directory.
+                    if self._is_directory(directory):
+                        start.append((directory, None))
+                    else:
+                        changes.vanished.extend(
+                            self.index.subtree_directory_ids(directory)
+                        )
+
+            self._walk(start, stats, changes)
+
+            stats.removed += self.index.remove_file_ids(changes.removed - changes.moved)
+            stats.removed += self.index.remove_directories(changes.vanished)
+        except BaseException:
+            self.index.rollback()
+            raise
+
+        self.index.commit()
+        return stats
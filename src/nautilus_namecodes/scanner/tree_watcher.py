@@ -0,0 +1,448 @@
+"""Watch a Media Tree to keep its Namecode Index Up to Date
+
+On Linux, every directory of the tree is watched with inotify (through
+ctypes, there is no dependency), and the files created, moved and deleted
+are applied to the index as they happen, in batches: the events are read
+until the tree is quiet for 'latency' seconds (or for at most 'max_delay'
+seconds), then applied and committed together.
+
+    with tree_watcher(TreeScanner("/srv/media", index)) as watcher:
+        watcher.run()  # Until watcher.stop() is called.
+
+A file renamed or moved within the tree keeps its row of the index. The
+directories created, moved or deleted are rescanned by the TreeScanner, as
+is the whole tree when the kernel queue of events overflows.
+
+Elsewhere (or with tree_watcher(..., polling=True)), the tree is rescanned
+every 'interval' seconds, only listing the directories that changed.
+
+An inotify watch is needed for each directory, within the limit of
+/proc/sys/fs/inotify/max_user_watches, else start() raises an OSError."""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import stat
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from nautilus_namecodes.scanner.media_index import IndexedFile, split_path
+from nautilus_namecodes.scanner.tree_scanner import ScanStats, TreeScanner, join_path
+
+# From <sys/inotify.h>
+IN_MOVED_FROM: int = 0x00000040
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_Q_OVERFLOW: int = 0x00004000
+IN_IGNORED: int = 0x00008000
+IN_ONLYDIR: int = 0x01000000
+IN_DONT_FOLLOW: int = 0x02000000
+IN_EXCL_UNLINK: int = 0x04000000
+IN_ISDIR: int = 0x40000000
+
+_WATCH_MASK: int = (
+    IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_ONLYDIR
+    | IN_DONT_FOLLOW
+    | IN_EXCL_UNLINK
+)
+
+# struct inotify_event {int watch; uint32_t mask, cookie, len; char name[];}
+_EVENT: struct.Struct = struct.Struct("iIII")
+_READ_SIZE: int = 64 * 1024
+
+# How long run() waits for changes, before checking if it was stopped.
+_STOP_CHECK: float = 0.5
+
+
+class InotifyEvent(NamedTuple):
+    """An event of a watched directory, about the entry 'name' of it."""
+
+    watch: int
+    mask: int
+    cookie: int
+    name: str
+
+
+def _libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc: ctypes.CDLL = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+        )
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+def inotify_available() -> bool:
+    """If the inotify API of Linux can be used."""
+    return _libc() is not None
+
+
+class Inotify:
+    """Minimal binding of the inotify API of Linux."""
+
+    def __init__(self) -> None:
+        libc: Optional[ctypes.CDLL] = _libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._libc: ctypes.CDLL = libc
+
+        self._fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            self._raise("inotify_init1")
+
+    def _raise(self, function: str, path: Optional[str] = None) -> None:
+        error: int = ctypes.get_errno()
+        raise OSError(error, f"{function}: {os.strerror(error)}", path)
+
+    def fileno(self) -> int:
+        """The file descriptor of the events."""
+        return self._fd
+
+    def add_watch(self, path: str, mask: int, /) -> int:
+        """Watch a path (again), returning its watch descriptor."""
+
+        watch: int = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if watch < 0:
+            self._raise("inotify_add_watch", path)
+        return watch
+
+    def remove_watch(self, watch: int, /) -> None:
+        """Stop watching, if the watch was not already removed."""
+        self._libc.inotify_rm_watch(self._fd, watch)
+
+    def read_events(self, timeout: Optional[float] = None) -> List[InotifyEvent]:
+        """The events queued, after waiting up to 'timeout' seconds for any."""
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        events: List[InotifyEvent] = []
+        while True:
+            try:
+                data: bytes = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return events
+
+            offset: int = 0
+            while offset < len(data):
+                watch, mask, cookie, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name: bytes = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                events.append(InotifyEvent(watch, mask, cookie, os.fsdecode(name)))
+
+    def close(self) -> None:
+        """Close the file descriptor, removing every watch."""
+
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class TreeWatcher(ABC):
+    """Keep the index of a TreeScanner up to date with its tree."""
+
+    def __init__(self, scanner: TreeScanner) -> None:
+        self.scanner: TreeScanner = scanner
+        self._stopping: threading.Event = threading.Event()
+
+    def __enter__(self) -> "TreeWatcher":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @abstractmethod
+    def start(self) -> ScanStats:
+        """Start watching, and bring the index up to date with a rescan."""
+
+    @abstractmethod
+    def step(self, timeout: Optional[float] = None) -> Optional[ScanStats]:
+        """Wait up to 'timeout' seconds for changes and apply them, or
+        return None if there were none."""
+
+    def close(self) -> None:
+        """Stop watching."""
+
+    def stop(self) -> None:
+        """Make run() return, e.g. from another thread or a signal handler."""
+        self._stopping.set()
+
+    def run(self, callback: Optional[Callable[[ScanStats], None]] = None) -> None:
+        """Start watching, and apply the changes until stopped. The callback
+        is given the stats of each batch of changes applied.
+
+        The index must be used from the thread that opened it, run() too."""
+
+        self._stopping.clear()
+        stats: Optional[ScanStats] = self.start()
+
+        while True:
+            if stats is not None and callback is not None:
+                callback(stats)
+            if self._stopping.is_set():
+                return
+            stats = self.step(_STOP_CHECK)
+
+
+class PollingWatcher(TreeWatcher):
+    """Rescan the tree every 'interval' seconds."""
+
+    def __init__(self, scanner: TreeScanner, *, interval: float = 60.0) -> None:
+        super().__init__(scanner)
+        self.interval: float = interval
+        self._next_rescan: float = 0.0
+
+    def start(self) -> ScanStats:
+        return self._rescan()
+
+    def _rescan(self) -> ScanStats:
+        stats: ScanStats = self.scanner.rescan()
+        self._next_rescan = time.monotonic() + self.interval
+        return stats
+
+    def step(self, timeout: Optional[float] = None) -> Optional[ScanStats]:
+        delay: float = max(0.0, self._next_rescan - time.monotonic())
+        if timeout is not None and timeout < delay:
+            self._stopping.wait(timeout)
+            return None
+
+        if self._stopping.wait(delay):
+            return None
+        return self._rescan()
+
+
+class InotifyWatcher(TreeWatcher):
+    """Apply the changes to the tree notified by inotify, in batches."""
+
+    def __init__(
+        self,
+        scanner: TreeScanner,
+        *,
+        latency: float = 0.1,
+        max_delay: float = 1.0,
+    ) -> None:
+        super().__init__(scanner)
+        self.latency: float = latency
+        self.max_delay: float = max_delay
+        self._inotify: Optional[Inotify] = None
+        # The directories watched, by their watch descriptor.
+        self._paths: Dict[int, str] = {}
+
+    def start(self) -> ScanStats:
+        self.close()
+        self._inotify = Inotify()
+        self._watch_tree("")
+        # Changes before the watches were added are found by the rescan.
+        return self.scanner.rescan()
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._paths.clear()
+
+    def _watch_tree(self, directory: str, /) -> None:
+        """Watch a directory and the directories below it (again)."""
+
+        if self._inotify is None:
+            raise RuntimeError("the watcher is not started")
+
+        root: str = str(self.scanner.root)
+        path: str
+        subdirectories: List[str]
+        for path, subdirectories, _ in os.walk(self.scanner.root.joinpath(directory)):
+            try:
+                watch: int = self._inotify.add_watch(path, _WATCH_MASK)
+            except OSError as error:
+                if error.errno == errno.ENOSPC:
+                    raise  # Out of watches.
+                subdirectories.clear()
+                continue
+            relative: str = os.path.relpath(path, root)
+            self._paths[watch] = (
+                "" if relative == "." else relative.replace(os.sep, "/")
+            )
+
+    def _unwatch_tree(self, directory: str, /) -> None:
+        """Stop watching a directory, and the directories below it."""
+
+        watch: int
+        path: str
+        for watch, path in list(self._paths.items()):
+            if path == directory or path.startswith(f"{directory}/"):
+                del self._paths[watch]
+                if self._inotify is not None:
+                    self._inotify.remove_watch(watch)
+
+    def _read_batch(self, timeout: Optional[float]) -> List[InotifyEvent]:
+        """The events until the tree is quiet, waiting up to 'timeout' for any."""
+
+        if self._inotify is None:
+            raise RuntimeError("the watcher is not started")
+
+        events: List[InotifyEvent] = self._inotify.read_events(timeout)
+        deadline: float = time.monotonic() + self.max_delay
+
+        while events:
+            wait: float = min(self.latency, deadline - time.monotonic())
+            if wait <= 0:
+                break
+            more: List[InotifyEvent] = self._inotify.read_events(wait)
+            if not more:
+                break
+            events.extend(more)
+
+        return events
+
+    def step(self, timeout: Optional[float] = None) -> Optional[ScanStats]:
+        events: List[InotifyEvent] = self._read_batch(timeout)
+        if not events:
+            return None
+
+        try:
+            return self._apply(events)
+        except BaseException:
+            self.scanner.index.rollback()
+            raise
+
+    def _apply(  # pylint: disable=too-many-branches
+        self, events: List[InotifyEvent]
+    ) -> ScanStats:
+        """Apply a batch of events to the index, and commit it."""
+
+        stats: ScanStats = ScanStats()
+        rescan: Set[str] = set()
+        overflow: bool = False
+        # A file moved from, until the next event tells if it was moved to.
+        moved_from: Optional[Tuple[int, str]] = None
+
+        event: InotifyEvent
+        for event in events:
+            if moved_from is not None and not (
+                event.mask & IN_MOVED_TO and event.cookie == moved_from[0]
+            ):
+                stats.removed += self._remove_file(moved_from[1])
+                moved_from = None
+
+            if event.mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if event.mask & IN_IGNORED:
+                self._paths.pop(event.watch, None)
+                continue
+
+            directory: Optional[str] = self._paths.get(event.watch)
+            if directory is None or not event.name:
+                continue
+            path: str = join_path(directory, event.name)
+
+            if event.mask & IN_ISDIR:
+                if event.mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+                else:
+                    self._unwatch_tree(path)
+                rescan.add(path)
+            elif event.mask & IN_MOVED_FROM:
+                moved_from = (event.cookie, path)
+            elif event.mask & IN_DELETE:
+                stats.removed += self._remove_file(path)
+            elif event.mask & IN_MOVED_TO and moved_from is not None:
+                self._add_file(path, stats, moved_from[1])
+                moved_from = None
+            elif event.mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_file(path, stats)
+
+        if moved_from is not None:
+            stats.removed += self._remove_file(moved_from[1])
+
+        if overflow:
+            self._watch_tree("")
+            stats.merge(self.scanner.rescan())
+        elif rescan:
+            stats.merge(self.scanner.rescan(rescan))
+        else:
+            self.scanner.index.commit()
+
+        return stats
+
+    def _remove_file(self, path: str, /) -> int:
+        directory, name = split_path(path)
+        return self.scanner.index.remove_files(directory, [name])
+
+    def _add_file(
+        self, path: str, stats: ScanStats, moved_from: Optional[str] = None
+    ) -> None:
+        """Index a new file, or move the file of the index it was moved from."""
+
+        directory, name = split_path(path)
+
+        try:
+            status: os.stat_result = os.lstat(self.scanner.root.joinpath(path))
+            regular: bool = stat.S_ISREG(status.st_mode)
+        except OSError:
+            regular = False  # Gone already.
+
+        codes: Optional[Tuple[int, ...]] = (
+            self.scanner.decode(name) if regular else None
+        )
+        if codes is None:
+            if regular:
+                stats.files += 1
+                stats.undecoded += 1
+            if moved_from is not None:
+                stats.removed += self._remove_file(moved_from)
+            return
+
+        stats.files += 1
+
+        file: IndexedFile = IndexedFile(name, codes, status.st_ino)
+
+        if moved_from is not None:
+            file_id: int
+            indexed_path: str
+            for file_id, indexed_path in self.scanner.index.files_with_inode(
+                status.st_ino
+            ):
+                if indexed_path == moved_from:
+                    self.scanner.index.move_file(file_id, directory, file)
+                    stats.renamed += 1
+                    stats.indexed += 1
+                    return
+            stats.removed += self._remove_file(moved_from)
+
+        stats.added += self.scanner.index.add_files(directory, [file])
+        stats.indexed += 1
+
+
+def tree_watcher(
+    scanner: TreeScanner,
+    *,
+    polling: bool = False,
+    interval: float = 60.0,
+    latency: float = 0.1,
+    max_delay: float = 1.0,
+) -> TreeWatcher:
+    """An InotifyWatcher of the tree of the scanner, if inotify is available
+    (and polling is not asked for), or else a PollingWatcher."""
+
+    if polling or not inotify_available():
+        return PollingWatcher(scanner, interval=interval)
+    return InotifyWatcher(scanner, latency=latency, max_delay=max_delay)
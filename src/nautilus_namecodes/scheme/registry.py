@@ -0,0 +1,159 @@
+"""Process-wide Registry of Built Namecode Schemes"""
+
+from copy import deepcopy
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, TypeVar
+
+from nautilus_namecodes.index.interval_index import IntervalIndex
+from nautilus_namecodes.index.reverse_index import ReverseIndex
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, TreeStub
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import (
+    AllNameCodes,
+    TreeStubGen,
+    __scheme_version__,
+)
+
+DEFAULT_SCHEME_VERSION: str = __scheme_version__
+
+DerivedT = TypeVar("DerivedT")
+
+
+def _build_tree_stub(all_codes: AllCodes) -> TreeStub:
+    return TreeStubGen(all_codes).tree_stub
+
+
+class UnknownSchemeError(KeyError):
+    """Raised when a scheme version has not been registered."""
+
+
+class SchemeRegistry:
+    """Lazily build and share the namecodes of each scheme version.
+
+    The scheme is built on first use and then handed out to every caller:
+    the returned AllCodes, TreeStub and derived values (e.g. the indexes)
+    are shared, and must be treated as read-only. A caller that changes the
+    dataclasses asks for its own copy with 'copy=True', the copies share
+    the read-only CodeTables of the codes."""
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._builders: Dict[str, Callable[[], AllCodes]] = {}
+        self._all_codes: Dict[str, AllCodes] = {}
+        self._derived: Dict[Callable[[AllCodes], Any], Dict[str, Any]] = {}
+
+    def register(self, scheme_version: str, builder: Callable[[], AllCodes]) -> None:
+        """Register (or replace) the builder of a scheme version."""
+
+        with self._lock:
+            self._builders[scheme_version] = builder
+            self._drop(scheme_version)
+
+    @property
+    def scheme_versions(self) -> List[str]:
+        """List the registered scheme versions."""
+        return list(self._builders)
+
+    def _build_all_codes(self, scheme_version: str) -> AllCodes:
+        """The shared AllCodes of a scheme version, the caller must hold the lock."""
+
+        all_codes: Optional[AllCodes] = self._all_codes.get(scheme_version)
+        if all_codes is None:
+            if scheme_version not in self._builders:
+                raise UnknownSchemeError(scheme_version)
+            all_codes = self._builders[scheme_version]()
+            self._all_codes[scheme_version] = all_codes
+
+        return all_codes
+
+    def _shared_all_codes(self, scheme_version: str) -> AllCodes:
+        """The shared AllCodes of a scheme version, building it once."""
+
+        all_codes: Optional[AllCodes] = self._all_codes.get(scheme_version)
+        if all_codes is None:
+            with self._lock:
+                all_codes = self._build_all_codes(scheme_version)
+
+        return all_codes
+
+    def get_all_codes(
+        self, scheme_version: str = DEFAULT_SCHEME_VERSION, *, copy: bool = False
+    ) -> AllCodes:
+        """Get the shared (read-only) AllCodes of a scheme version, building
+        it once, or a copy of it that may be changed."""
+
+        all_codes: AllCodes = self._shared_all_codes(scheme_version)
+        return deepcopy(all_codes) if copy else all_codes
+
+    def get_derived(
+        self,
+        build: Callable[[AllCodes], DerivedT],
+        scheme_version: str = DEFAULT_SCHEME_VERSION,
+    ) -> DerivedT:
+        """Get a value built from the AllCodes of a scheme, building it once.
+
+        The build callable (e.g. an index class) is the cache key, so the
+        same callable must be passed on every call. The scheme is read, and
+        the value stored, under the lock, so a value is never stored for a
+        scheme that has since been invalidated."""
+
+        cache: Dict[str, Any] = self._derived.get(build, {})
+        derived: Optional[DerivedT] = cache.get(scheme_version)
+        if derived is not None:
+            return derived
+
+        with self._lock:
+            cache = self._derived.setdefault(build, {})
+            derived = cache.get(scheme_version)
+            if derived is None:
+                derived = build(self._build_all_codes(scheme_version))
+                cache[scheme_version] = derived
+
+        return derived
+
+    def get_tree_stub(
+        self, scheme_version: str = DEFAULT_SCHEME_VERSION, *, copy: bool = False
+    ) -> TreeStub:
+        """Get the shared (read-only) TreeStub of a scheme version, building
+        it once, or a copy of it that may be changed."""
+
+        tree_stub: TreeStub = self.get_derived(_build_tree_stub, scheme_version)
+        return deepcopy(tree_stub) if copy else tree_stub
+
+    def get_reverse_index(
+        self, scheme_version: str = DEFAULT_SCHEME_VERSION
+    ) -> ReverseIndex:
+        """Get the shared name to codepoint index of a scheme version."""
+        return self.get_derived(ReverseIndex, scheme_version)
+
+    def get_interval_index(
+        self, scheme_version: str = DEFAULT_SCHEME_VERSION
+    ) -> IntervalIndex:
+        """Get the shared codepoint to section index of a scheme version."""
+        return self.get_derived(IntervalIndex, scheme_version)
+
+    def get_codes(
+        self, scheme_version: str = DEFAULT_SCHEME_VERSION
+    ) -> Mapping[int, str]:
+        """Get a read-only view of all the codes of a scheme version."""
+        return MappingProxyType(self._shared_all_codes(scheme_version).codes)
+
+    def _drop(self, scheme_version: Optional[str]) -> None:
+        """Drop cached values, the caller must hold the lock."""
+
+        cache: Dict[str, Any]
+        for cache in [self._all_codes, *self._derived.values()]:
+            if scheme_version is None:
+                cache.clear()
+            else:
+                cache.pop(scheme_version, None)
+
+    def invalidate(self, scheme_version: Optional[str] = None) -> None:
+        """Drop the built schemes (all of them when no version is given)."""
+
+        with self._lock:
+            self._drop(scheme_version)
+
+
+namecodes_registry: SchemeRegistry = SchemeRegistry()
+namecodes_registry.register(__scheme_version__, lambda: AllNameCodes().get_all_codes)
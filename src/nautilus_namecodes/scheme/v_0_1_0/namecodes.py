@@ -1,7 +1,8 @@
 """Generate Namecodes from Values"""
 
-from typing import List
+from typing import List, Optional
 
+from nautilus_namecodes.builder.parallel_builder import build_planes_parallel
 from nautilus_namecodes.namecodes_dataclasses import (
     AllCodes,
     BlockBranch,
@@ -29,11 +30,18 @@ class BaseNameCodes(BasicType):
         super().__init__()
 
         self._start: int = 0x000
-        self._planecodes: PlaneCodes = self.get_plane.get_plane_codes(self._start)
+        self._planecodes: Optional[PlaneCodes] = None
+
+    @property
+    def get_start(self) -> int:
+        """Returns the Starting Codepoint of the Plane"""
+        return self._start
 
     @property
     def get_plane_codes(self) -> PlaneCodes:
-        """Returns the Plane Codes Property"""
+        """Returns the Plane Codes Property, generated on first use"""
+        if self._planecodes is None:
+            self._planecodes = self.get_plane.get_plane_codes(self._start)
         return self._planecodes
 
 
@@ -44,11 +52,18 @@ class PurposeNameCodes(Purpose):
         super().__init__()
 
         self._start: int = 0x030
-        self._planecodes: PlaneCodes = self.get_plane.get_plane_codes(self._start)
+        self._planecodes: Optional[PlaneCodes] = None
+
+    @property
+    def get_start(self) -> int:
+        """Returns the Starting Codepoint of the Plane"""
+        return self._start
 
     @property
     def get_plane_codes(self) -> PlaneCodes:
-        """Returns the Plane Codes Property"""
+        """Returns the Plane Codes Property, generated on first use"""
+        if self._planecodes is None:
+            self._planecodes = self.get_plane.get_plane_codes(self._start)
         return self._planecodes
 
 
@@ -59,27 +74,53 @@ class ModificationsNameCodes(Modifications):
         super().__init__()
 
         self._start: int = 0x600
-        self._planecodes: PlaneCodes = self.get_plane().get_plane_codes(self._start)
+        self._planecodes: Optional[PlaneCodes] = None
+
+    @property
+    def get_start(self) -> int:
+        """Returns the Starting Codepoint of the Plane"""
+        return self._start
 
     @property
     def get_plane_codes(self) -> PlaneCodes:
-        """Returns the Plane Codes Property"""
+        """Returns the Plane Codes Property, generated on first use"""
+        if self._planecodes is None:
+            self._planecodes = self.get_plane().get_plane_codes(self._start)
         return self._planecodes
 
 
 class AllNameCodes:
-    """Group Together All Namecodes"""
+    """Group Together All Namecodes
 
-    def __init__(self) -> None:
+    With 'parallel' the blocks of the planes are generated in a process
+    pool (of 'max_workers'), giving the same codes as the default."""
+
+    def __init__(
+        self, parallel: bool = False, max_workers: Optional[int] = None
+    ) -> None:
         self._name: str = "Nautilus Namecodes"
 
-        self._planecodes: list[PlaneCodes] = list(
-            [
-                BaseNameCodes().get_plane_codes,
-                PurposeNameCodes().get_plane_codes,
-                ModificationsNameCodes().get_plane_codes,
-            ]
-        )
+        base: BaseNameCodes = BaseNameCodes()
+        purpose: PurposeNameCodes = PurposeNameCodes()
+        modifications: ModificationsNameCodes = ModificationsNameCodes()
+
+        if parallel:
+            self._planecodes: list[PlaneCodes] = build_planes_parallel(
+                [
+                    (base.get_start, base.get_plane),
+                    (purpose.get_start, purpose.get_plane),
+                    (modifications.get_start, modifications.get_plane()),
+                ],
+                max_workers=max_workers,
+            )
+        else:
+            self._planecodes = list(
+                [
+                    base.get_plane_codes,
+                    purpose.get_plane_codes,
+                    modifications.get_plane_codes,
+                ]
+            )
 
         self._planecodes.sort(
             key=lambda planecode: planecode.codepoints_allocated.start
@@ -117,8 +158,10 @@ class AllNameCodes:
 class TreeStubGen:  # pylint: disable="too-few-public-methods"
     """Fill the Stub Tree Dataclass"""
 
-    def __init__(self) -> None:
-        _all_name_codes: AllCodes = AllNameCodes().get_all_codes
+    def __init__(self, all_codes: Optional[AllCodes] = None) -> None:
+        _all_name_codes: AllCodes = (
+            AllNameCodes().get_all_codes if all_codes is None else all_codes
+        )
 
         _plane_branches: List[PlaneBranch] = []
 
@@ -207,6 +207,52 @@ class PlaneTestCase(unittest.TestCase):
             },
         )
 
+    def test_layout(self):
+        """Test the single pass layout of the plane"""
+        layout = self.plane.get_layout(0x100)
+        self.assertEqual((layout.start, layout.pages), (0x100, 4))
+        self.assertEqual([block.start for block in layout.children], [0x100, 0x120])
+        self.assertEqual(
+            [section.start for section in layout.children[1].children], [0x120, 0x130]
+        )
+        self.assertEqual(layout.codepoints_allocated.range, range(0x100, 0x13F))
+
+    def test_cached_allocations(self):
+        """Test the cached allocations follow changes to the values"""
+        self.assertEqual(self.plane.get_pages_allocated(), 4)
+
+        self.section.values = [str(value) for value in range(0x20)]
+        self.assertEqual(self.block.get_page_allocations(), [2, 1])
+        self.assertEqual(self.plane.get_block_page_allocations(), [3, 3])
+        self.assertEqual(self.plane.get_pages_allocated(), 6)
+        self.assertEqual(self.plane.get_layout(0x100).children[1].start, 0x130)
+
+        self.block2.sections = [self.section2]
+        self.assertEqual(self.plane.get_pages_allocated(), 4)
+
+    def test_cached_allocations_in_place(self):
+        """Test the cached allocations follow changes made in place"""
+        self.assertEqual(self.plane.get_pages_allocated(), 4)
+
+        self.section.values.extend(["y"] * 40)
+        self.assertEqual(self.block.get_page_allocations(), [3, 1])
+        self.assertEqual(self.plane.get_pages_allocated(), 8)
+
+        planecodes = self.plane.get_plane_codes(0x000)
+        self.assertEqual(planecodes.codepoints_allocated.range, range(0x000, 0x07F))
+        self.assertEqual(
+            planecodes.blocks[0].sections[0].codepoints_allocated.range,
+            range(0x000, 0x02F),
+        )
+
+        self.block2.sections.pop()  # type: ignore
+        self.assertEqual(self.plane.get_block_page_allocations(), [4, 3])
+
+        self.block2.sections.append(self.section)  # type: ignore
+        self.section.values.clear()
+        self.assertEqual(self.plane.get_block_page_allocations(), [2, 2])
+        self.assertEqual(self.plane.get_pages_allocated(), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,145 @@
+"""Testing the Incremental Builder"""
+
+import unittest
+from typing import List, Tuple
+
+from nautilus_namecodes.builder.incremental_builder import (
+    IncrementalBuilder,
+    SchemeOverlapError,
+)
+from nautilus_namecodes.builder.namecode_builder_dataclasses import Plane
+from nautilus_namecodes.format.json_stream import JsonStream
+from nautilus_namecodes.scheme.v_0_1_0 import namecodes
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import (
+    AllNameCodes,
+    BaseNameCodes,
+    ModificationsNameCodes,
+    PurposeNameCodes,
+)
+
+
+def scheme_planes() -> List[Tuple[int, Plane]]:
+    """The planes of the v0.1.0 scheme, with their starting codepoints."""
+    return [
+        (0x000, BaseNameCodes().get_plane),
+        (0x030, PurposeNameCodes().get_plane),
+        (0x600, ModificationsNameCodes().get_plane()),
+    ]
+
+
+def build(planes: List[Tuple[int, Plane]]) -> IncrementalBuilder:
+    """Build the planes as the v0.1.0 scheme."""
+    return IncrementalBuilder(
+        planes,
+        name="Nautilus Namecodes",
+        description=namecodes.__doc__,
+        scheme_version=namecodes.__scheme_version__,
+    )
+
+
+def as_json(builder: IncrementalBuilder) -> str:
+    """The full Json of the built codes, to compare every field."""
+    return "".join(JsonStream(builder.all_codes).stream_all_codes())
+
+
+def rebuild(plane: str, block: str, section: str, values: List[str]) -> str:
+    """The Json of a full build, with the values of one section replaced."""
+    planes = scheme_planes()
+    for _, _plane in planes:
+        for _block in _plane.blocks:
+            for _section in _block.sections:
+                if (_plane.name, _block.name, _section.name) == (plane, block, section):
+                    _section.values = values
+    return as_json(build(planes))
+
+
+class IncrementalBuilderTestCase(unittest.TestCase):
+    """Test Updating a Section Matches a Full Build"""
+
+    def setUp(self) -> None:
+        self.builder: IncrementalBuilder = build(scheme_planes())
+
+    def test_initial_build(self):
+        """Test the first build is that of AllNameCodes."""
+        self.assertEqual(
+            as_json(self.builder),
+            "".join(JsonStream(AllNameCodes().get_all_codes).stream_all_codes()),
+        )
+
+    def test_same_pages(self):
+        """Test changing values within the same pages moves nothing else."""
+        values = ["index", "metadata", "sidecar", "media"]
+        update = self.builder.update_section("PURPOSE", "Purposes", "gold", values)
+
+        self.assertEqual(
+            as_json(self.builder), rebuild("PURPOSE", "Purposes", "gold", values)
+        )
+        self.assertEqual(update.added, {0x032: "(gold) sidecar"})
+        self.assertEqual(update.moved, {0x032: 0x033})
+        self.assertEqual(update.removed, {})
+
+    def test_more_pages(self):
+        """Test growing a section shifts the later sections and blocks."""
+        values = [f"value{value:02d}" for value in range(40)]
+        update = self.builder.update_section(
+            "MODIFICATION", "Adaption", "focus", values
+        )
+
+        self.assertEqual(
+            as_json(self.builder), rebuild("MODIFICATION", "Adaption", "focus", values)
+        )
+        self.assertEqual(len(update.added), 40)
+        self.assertEqual(len(update.removed), 7)
+        self.assertEqual(update.moved[0x820], 0x840)
+        self.assertEqual(update.moved[0x930], 0x950)
+        self.assertIs(update.all_codes, self.builder.all_codes)
+
+    def test_earlier_results(self):
+        """Test an update leaves the earlier results, and other planes, as they were."""
+        before = self.builder.all_codes
+        before_json = as_json(self.builder)
+        before_codes = [node.codes for node in before.walk_nodes()]
+
+        values = [f"value{value:02d}" for value in range(40)]
+        self.builder.update_section("PURPOSE", "Purposes", "gold", values)
+        self.builder.update_section("MODIFICATION", "Edition", "edition", [])
+
+        self.assertEqual("".join(JsonStream(before).stream_all_codes()), before_json)
+        for node, codes in zip(before.walk_nodes(), before_codes):
+            self.assertIs(node.codes, codes)
+        self.assertIs(self.builder.all_codes.planes[0], before.planes[0])
+        self.assertEqual(
+            dict(self.builder.all_codes.codes),
+            {
+                codepoint: name
+                for plane in self.builder.all_codes.planes
+                for codepoint, name in plane.codes.items()
+            },
+        )
+
+    def test_fewer_pages(self):
+        """Test shrinking a section shifts the later codes back."""
+        update = self.builder.update_section("MODIFICATION", "Edition", "edition", [])
+
+        self.assertEqual(
+            as_json(self.builder), rebuild("MODIFICATION", "Edition", "edition", [])
+        )
+        self.assertEqual(update.moved[0x701], 0x611)
+
+    def test_overlap(self):
+        """Test growing a plane into the next plane raises, and changes nothing."""
+        before = as_json(self.builder)
+        with self.assertRaises(SchemeOverlapError):
+            self.builder.update_section(
+                "PURPOSE", "Purposes", "gold", [str(value) for value in range(0x600)]
+            )
+        self.assertEqual(as_json(self.builder), before)
+
+    def test_unknown_section(self):
+        """Test an unknown section raises."""
+        with self.assertRaises(KeyError):
+            self.builder.update_section("PURPOSE", "Purposes", "unknown", [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Testing the Cache of Formatted Code Names"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from nautilus_namecodes.builder.name_cache import (
+    NameCache,
+    format_names,
+    name_cache,
+    name_template,
+)
+from nautilus_namecodes.builder.namecode_builder_dataclasses import Section
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class NameCacheTestCase(unittest.TestCase):
+    """Test the Names are Formatted Once, as str.format() Would"""
+
+    def test_template(self) -> None:
+        """Test splitting the formats, or falling back to str.format()."""
+
+        self.assertEqual(name_template("({name}) {value}", "gold"), ("(gold) ", ""))
+        self.assertEqual(name_template("{value}-{name}", "x"), ("", "-x"))
+        self.assertIsNone(name_template("{name}: #{value:03}", "x"))
+        self.assertIsNone(name_template("{value} {value}", "x"))
+        self.assertIsNone(name_template("{name}", "x"))
+
+        fmt: str
+        for fmt in ["({name}) {value}", "{{{name}}} {value}", "{value!r} {name}"]:
+            self.assertEqual(
+                format_names(fmt, "name", ["a", "b"]),
+                tuple(fmt.format(name="name", value=value) for value in ["a", "b"]),
+            )
+
+    def test_cache(self) -> None:
+        """Test the hits share the names, and the stats count them."""
+
+        cache = NameCache(maxsize=2)
+        values = ["index", "metadata", "media"]
+
+        names = cache.get_names("({name}) {value}", "gold", values)
+        self.assertIs(cache.get_names("({name}) {value}", "gold", list(values)), names)
+        self.assertEqual(names, ("(gold) index", "(gold) metadata", "(gold) media"))
+
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertEqual(cache.stats.names_formatted, 3)
+        self.assertGreater(cache.stats.bytes_saved, len("".join(names)))
+
+        cache.get_names("({name}) {value}", "base", values)
+        cache.get_names("({name}) {value}", "variant", values)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.get_names("({name}) {value}", "gold", values), names)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.stats.hits), (0, 0))
+
+    def test_threads(self) -> None:
+        """Test threads sharing a small cache keep it consistent."""
+
+        cache = NameCache(maxsize=8)
+        keys = [(str(key % 16), [str(key)]) for key in range(64)] * 64
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda key: cache.get_names("{name}{value}", *key), keys)
+            )
+
+        self.assertEqual(results, [(key[0] + key[1][0],) for key in keys])
+        self.assertEqual(len(cache), 8)
+        self.assertEqual(cache.stats.hits + cache.stats.misses, len(keys))
+
+    def test_builds_share_names(self) -> None:
+        """Test a second build of the scheme formats no names."""
+
+        first = AllNameCodes().get_all_codes
+        formatted = name_cache.stats.names_formatted
+        second = AllNameCodes().get_all_codes
+
+        self.assertEqual(name_cache.stats.names_formatted, formatted)
+        self.assertEqual(dict(first.codes), dict(second.codes))
+        for first_name, second_name in zip(first.codes.values(), second.codes.values()):
+            self.assertIs(first_name, second_name)
+
+    def test_section_codes(self) -> None:
+        """Test the section codes with a format that is not split."""
+
+        section = Section(
+            name="count",
+            description=None,
+            values=["1", "2"],
+            name_value_format="{value:>3}",
+        )
+        self.assertEqual(
+            dict(section.get_section_codes(0x10).codes), {0x10: "  1", 0x11: "  2"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Testing the Parallel Plane Builder"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from nautilus_namecodes.builder.namecode_builder_dataclasses import (
+    ConstantValues,
+    Plane,
+)
+from nautilus_namecodes.builder.parallel_builder import build_planes_parallel
+from nautilus_namecodes.builder.synthetic_scheme import SyntheticShape, synthetic_planes
+from nautilus_namecodes.format.json_stream import JsonStream
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+def synthetic_starts(shape: SyntheticShape) -> List[Tuple[int, Plane]]:
+    """The planes of a synthetic scheme, with their starting codepoints."""
+    planes: List[Tuple[int, Plane]] = []
+    start: int = 0
+    for plane in synthetic_planes(shape):
+        planes.append((start, plane))
+        start += plane.get_pages_allocated() * ConstantValues.page_size
+    return planes
+
+
+class ParallelBuilderTestCase(unittest.TestCase):
+    """Test the Parallel Build Matches the Sequential Build"""
+
+    def test_all_name_codes(self) -> None:
+        """Test the v0.1.0 scheme, in a process pool."""
+
+        sequential = JsonStream(AllNameCodes().get_all_codes)
+        parallel = JsonStream(AllNameCodes(parallel=True, max_workers=2).get_all_codes)
+
+        self.assertEqual(
+            "".join(parallel.stream_all_codes()),
+            "".join(sequential.stream_all_codes()),
+        )
+
+    def test_synthetic(self) -> None:
+        """Test a ragged synthetic scheme, with a given executor."""
+
+        planes = synthetic_starts(
+            SyntheticShape(blocks_per_plane=8, values_per_section=40, ragged=True)
+        )
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            parallel = build_planes_parallel(planes, executor=executor)
+
+        sequential = [plane.get_plane_codes(start) for start, plane in planes]
+
+        self.assertEqual(parallel, sequential)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Testing the Synthetic Scheme Generator"""
+
+import unittest
+
+from nautilus_namecodes.builder.synthetic_scheme import (
+    SyntheticShape,
+    build_synthetic_scheme,
+    synthetic_planes,
+)
+
+
+class SyntheticSchemeTestCase(unittest.TestCase):
+    """Test Building Synthetic Schemes"""
+
+    def test_shape(self):
+        """Test the scheme has the planes, blocks, sections and codes asked for."""
+        shape = SyntheticShape(
+            planes=3, blocks_per_plane=5, sections_per_block=2, values_per_section=20
+        )
+        all_codes = build_synthetic_scheme(shape)
+
+        self.assertEqual(len(all_codes.planes), 3)
+        self.assertEqual({len(plane.blocks) for plane in all_codes.planes}, {5})
+        self.assertEqual(len(list(all_codes.walk_sections())), 30)
+        self.assertEqual(len(all_codes.codes), shape.codes)
+        self.assertEqual(shape.codes, 600)
+        self.assertEqual(all_codes.codes[0x000], "(section0_0_0) value00000")
+
+    def test_planes_follow_each_other(self):
+        """Test each plane is allocated directly after the one before."""
+        all_codes = build_synthetic_scheme(SyntheticShape(ragged=True))
+
+        for before, after in zip(all_codes.planes, all_codes.planes[1:]):
+            self.assertEqual(
+                after.codepoints_allocated.start, before.codepoints_allocated.stop + 1
+            )
+        self.assertEqual(
+            all_codes.codepoints_allocated.stop,
+            all_codes.planes[-1].codepoints_allocated.stop,
+        )
+
+    def test_ragged(self):
+        """Test ragged sections vary in size, within bounds."""
+        shape = SyntheticShape(values_per_section=50, ragged=True)
+        sizes = [
+            len(section.values)
+            for plane in synthetic_planes(shape)
+            for block in plane.blocks
+            for section in block.sections
+        ]
+        self.assertGreater(len(set(sizes)), 1)
+        self.assertTrue(all(1 <= size <= 50 for size in sizes))
+        self.assertEqual(sum(sizes), shape.codes)
+
+    def test_beyond_16_bits(self):
+        """Test a scheme allocating codepoints above 0xFFFF."""
+        shape = SyntheticShape(
+            planes=3, blocks_per_plane=64, sections_per_block=8, values_per_section=64
+        )
+        all_codes = build_synthetic_scheme(shape)
+
+        self.assertGreater(all_codes.codepoints_allocated.stop, 0xFFFF)
+        self.assertEqual(len(all_codes.codes), shape.codes)
+        self.assertEqual(list(all_codes.codes), sorted(all_codes.codes))
+
+    def test_unique_names(self):
+        """Test the names stay unique past 255 blocks and sections."""
+        shape = SyntheticShape(
+            planes=1, blocks_per_plane=274, sections_per_block=257, values_per_section=1
+        )
+        blocks = [block for plane in synthetic_planes(shape) for block in plane.blocks]
+        sections = [section for block in blocks for section in block.sections]
+
+        self.assertEqual(len({block.name for block in blocks}), 274)
+        self.assertEqual(len({section.name for section in sections}), 274 * 257)
+
+    def test_invalid_shape(self):
+        """Test shapes without planes, blocks, sections or values are refused."""
+        for field in (
+            "planes",
+            "blocks_per_plane",
+            "sections_per_block",
+            "values_per_section",
+        ):
+            with self.subTest(field=field), self.assertRaises(ValueError):
+                SyntheticShape(**{field: 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
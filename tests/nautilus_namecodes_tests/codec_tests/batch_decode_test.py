@@ -0,0 +1,91 @@
+"""Testing the Batch Decoding of Namecode Filenames"""
+
+import unittest
+
+from nautilus_namecodes.codec.batch_decode import PADDING, batch_decode
+from nautilus_namecodes.codec.filename_codec import FilenameCodec
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+FILENAMES = [
+    "archive/gold/001030891.png",
+    "001",
+    "600700.tif",
+    "93F",
+    "0010",
+    "zzz",
+    "010",
+    "É01",
+    "001001",
+    "700600.tif",
+    "",
+]
+
+EXPECTED_CODEPOINTS = [
+    [0x001, 0x030, 0x891],
+    [0x001, PADDING, PADDING],
+    [0x600, 0x700, PADDING],
+    [0x93F, PADDING, PADDING],
+    [PADDING, PADDING, PADDING],
+    [PADDING, PADDING, PADDING],
+    [PADDING, PADDING, PADDING],
+    [PADDING, PADDING, PADDING],
+    [PADDING, PADDING, PADDING],
+    [PADDING, PADDING, PADDING],
+    [PADDING, PADDING, PADDING],
+]
+
+EXPECTED_VALID = [
+    True,
+    True,
+    True,
+    True,
+    False,
+    False,
+    False,
+    False,
+    False,
+    False,
+    True,
+]
+
+
+class BatchDecodeTestCase(unittest.TestCase):
+    """Test the Columnar Batch Decoder"""
+
+    def setUp(self) -> None:
+        self.codec: FilenameCodec = FilenameCodec(AllNameCodes().get_all_codes)
+
+    def test_python(self):
+        """Test the pure python decoder."""
+        result = batch_decode(FILENAMES, self.codec, use_numpy=False)
+        self.assertEqual(result.codepoints, EXPECTED_CODEPOINTS)
+        self.assertEqual(result.valid, EXPECTED_VALID)
+        self.assertEqual(result.rows, len(FILENAMES))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        """Test the array decoder matches the pure python decoder."""
+        result = batch_decode(numpy.array(FILENAMES), self.codec, use_numpy=True)
+        self.assertEqual(result.codepoints.tolist(), EXPECTED_CODEPOINTS)
+        self.assertEqual(result.valid.tolist(), EXPECTED_VALID)
+
+        result = batch_decode(iter([]), self.codec, use_numpy=True)
+        self.assertEqual(result.codepoints.shape, (0, 0))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_all_codes(self):
+        """Test every code decodes through the array decoder."""
+        codes = list(AllNameCodes().get_all_codes.codes)
+        filenames = [self.codec.encode([code]) + ".png" for code in codes]
+        result = batch_decode(filenames, self.codec)
+        self.assertEqual(result.codepoints[:, 0].tolist(), codes)
+        self.assertTrue(result.valid.all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Testing the Namecode Filename Codec"""
+
+import unittest
+
+from nautilus_namecodes.codec.filename_codec import (
+    FilenameCodec,
+    NamecodeCodecError,
+    decode,
+    encode,
+)
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class FilenameCodecTestCase(unittest.TestCase):
+    """Test Encoding and Decoding of Filename Tokens"""
+
+    def setUp(self) -> None:
+        self.codec: FilenameCodec = FilenameCodec(AllNameCodes().get_all_codes)
+
+    def test_encode(self):
+        """Test codes are sorted, de-duplicated and fixed-width."""
+        self.assertEqual(self.codec.width, 3)
+        self.assertEqual(self.codec.encode([0x891, 0x001, 0x030, 0x001]), "001030891")
+        self.assertEqual(self.codec.encode([]), "")
+
+    def test_decode(self):
+        """Test tokens decode back to their codepoints."""
+        self.assertEqual(self.codec.decode("001030891"), (0x001, 0x030, 0x891))
+        self.assertEqual(self.codec.decode("00103089f"), (0x001, 0x030, 0x89F))
+        self.assertEqual(
+            self.codec.decode_filename("media/gold/001030891.png"),
+            (0x001, 0x030, 0x891),
+        )
+
+    def test_round_trip(self):
+        """Test every code survives a round trip."""
+        codes = list(AllNameCodes().get_all_codes.codes)
+        self.assertEqual(self.codec.decode(self.codec.encode(codes)), tuple(codes))
+        self.assertEqual(decode(encode([0x600, 0x700])), (0x600, 0x700))
+
+    def test_unallocated(self):
+        """Test codepoints outside of the section ranges are rejected."""
+        with self.assertRaises(NamecodeCodecError):
+            self.codec.encode([0x010])
+        with self.assertRaises(NamecodeCodecError):
+            self.codec.decode("010")
+        with self.assertRaises(NamecodeCodecError):
+            self.codec.decode("FFF")
+
+    def test_not_ascending(self):
+        """Test tokens with repeated or unsorted codes are rejected."""
+        for token in ["001001", "030001", "001891030"]:
+            with self.assertRaises(NamecodeCodecError):
+                self.codec.decode(token)
+
+    def test_malformed(self):
+        """Test malformed tokens are rejected."""
+        for token in ["0010", "00G", " 01", "0_1", "+01"]:
+            with self.assertRaises(NamecodeCodecError):
+                self.codec.decode(token)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Testing the Bitset Sets of Namecodes"""
+
+import unittest
+
+from nautilus_namecodes.codec.namecode_set import NamecodeSpace
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class NamecodeSetTestCase(unittest.TestCase):
+    """Test Set Operations over the Namecode Space"""
+
+    def setUp(self) -> None:
+        self.space: NamecodeSpace = NamecodeSpace(AllNameCodes().get_all_codes)
+        self.gold_media = self.space.from_codes([0x002, 0x032, 0x891])
+        self.gold = self.space.from_codes([0x032])
+
+    def test_space(self):
+        """Test the space covers all the allocated codepoints."""
+        self.assertEqual(self.space.start, 0x000)
+        self.assertEqual(self.space.size, 0x940)
+        with self.assertRaises(ValueError):
+            self.space.from_codes([0x940])
+
+    def test_set_operations(self):
+        """Test union, intersection, difference and subset."""
+        other = self.space.from_codes([0x032, 0x600])
+
+        self.assertEqual(list(self.gold_media | other), [0x002, 0x032, 0x600, 0x891])
+        self.assertEqual(list(self.gold_media & other), [0x032])
+        self.assertEqual(list(self.gold_media - other), [0x002, 0x891])
+        self.assertEqual(list(self.gold_media ^ other), [0x002, 0x600, 0x891])
+        self.assertTrue(self.gold <= self.gold_media)
+        self.assertTrue(self.gold < self.gold_media)
+        self.assertFalse(other <= self.gold_media)
+        self.assertTrue(self.gold_media.isdisjoint(self.space.from_codes([0x600])))
+        self.assertEqual(len(self.gold_media), 3)
+        self.assertIn(0x891, self.gold_media)
+        self.assertNotIn(0x890, self.gold_media)
+
+    def test_masks(self):
+        """Test the plane, block and section masks."""
+        purpose = self.space.plane("PURPOSE")
+        self.assertEqual(len(purpose), 0x040)
+        self.assertEqual(list(self.gold_media & purpose), [0x032])
+
+        colour = self.space.section("MODIFICATION", "Transformation", "colour")
+        self.assertEqual(min(colour), 0x890)
+        self.assertEqual(max(colour), 0x89F)
+        self.assertEqual(
+            self.space.block("MODIFICATION", "Transformation") & colour, colour
+        )
+
+    def test_bytes_round_trip(self):
+        """Test the fixed-size byte representation."""
+        data = self.gold_media.to_bytes()
+        self.assertEqual(len(data), 0x128)
+        self.assertEqual(self.space.from_bytes(data), self.gold_media)
+        self.assertEqual(hash(self.space.from_bytes(data)), hash(self.gold_media))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Testing the Array Backed Code Table"""
+
+import copy
+
+# Only the pickles made by the tests are loaded.
+import pickle  # nosec B403
+import unittest
+
+from nautilus_namecodes.code_table import CodeTable
+from nautilus_namecodes.namecodes_dataclasses import AllCodes
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class CodeTableTestCase(unittest.TestCase):
+    """Test the CodeTable Mapping"""
+
+    def setUp(self) -> None:
+        self.table: CodeTable = CodeTable.from_items(
+            [(0x110, "c"), (0x100, "a"), (0x101, "b"), (0x120, "d")]
+        )
+
+    def test_mapping(self):
+        """Test the table behaves as a read-only sorted mapping."""
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(list(self.table), [0x100, 0x101, 0x110, 0x120])
+        self.assertEqual(self.table[0x110], "c")
+        self.assertNotIn(0x102, self.table)
+        self.assertEqual(self.table, {0x100: "a", 0x101: "b", 0x110: "c", 0x120: "d"})
+        with self.assertRaises(KeyError):
+            _ = self.table[0x102]
+        with self.assertRaises(TypeError):
+            self.table[0x102] = "e"  # type: ignore # pylint: disable=unsupported-assignment-operation
+
+    def test_view(self):
+        """Test views share the table and hold only their range."""
+        view = self.table.view(0x101, 0x110)
+        self.assertEqual(dict(view.items()), {0x101: "b", 0x110: "c"})
+        self.assertEqual(list(view.values()), ["b", "c"])
+        self.assertNotIn(0x100, view)
+        self.assertIs(view.codepoints, self.table.codepoints)
+        self.assertEqual(len(self.table.view(0x111, 0x11F)), 0)
+
+    def test_lookup(self):
+        """Test looking up codes of views, and of sparse tables."""
+        view = self.table.view(0x101, 0x110)
+        self.assertEqual(view[0x110], "c")
+        self.assertEqual(self.table[0x100], "a")
+        for codepoint in (0x100, 0x120, 0x102, -1, 0x10000):
+            self.assertNotIn(codepoint, view)
+            with self.assertRaises(KeyError):
+                _ = view[codepoint]
+        self.assertNotIn("0x101", view)
+
+        sparse = CodeTable.from_items([(0x10FFFF, "z"), (0x000, "a")])
+        self.assertEqual((sparse[0x000], sparse[0x10FFFF]), ("a", "z"))
+        with self.assertRaises(KeyError):
+            _ = CodeTable.from_items([])[0]
+
+    def test_concat(self):
+        """Test joining tables, in and out of order."""
+        low = CodeTable.from_names(0x000, ("x", "y"))
+        high = CodeTable.from_names(0x010, ("z",))
+        joined = CodeTable.concat([high, low])
+        self.assertEqual(dict(joined), {0x000: "x", 0x001: "y", 0x010: "z"})
+        self.assertEqual(CodeTable.concat([low, {0x005: "w"}])[0x005], "w")
+        self.assertEqual(len(CodeTable.concat([])), 0)
+
+        wide = CodeTable.from_names(0x10000, ("v",))
+        self.assertEqual(list(CodeTable.concat([low, wide])), [0x000, 0x001, 0x10000])
+
+    def test_shifted(self):
+        """Test shifting a view copies its codes to new codepoints."""
+        shifted = self.table.view(0x101, 0x110).shifted(0x10000)
+        self.assertEqual(list(shifted), [0x10101, 0x10110])
+        self.assertEqual(list(shifted.values()), ["b", "c"])
+
+    def test_copy_and_pickle(self):
+        """Test copies are shared, and pickles round trip."""
+        self.assertIs(copy.deepcopy(self.table), self.table)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.table.view(0, 0x101))),  # nosec B301
+            {
+                0x100: "a",
+                0x101: "b",
+            },
+        )
+
+
+class SharedCodesTestCase(unittest.TestCase):
+    """Test All the Codes Share a Single Table"""
+
+    def setUp(self) -> None:
+        self.all_codes: AllCodes = AllNameCodes().get_all_codes
+
+    def test_single_backing_store(self):
+        """Test every plane, block and section is a view of AllCodes.codes."""
+        assert isinstance(self.all_codes.codes, CodeTable)
+        codepoints = self.all_codes.codes.codepoints
+
+        for plane, block, section in self.all_codes.walk_sections():
+            for node in (plane, block, section):
+                self.assertIsInstance(node.codes, CodeTable)
+                self.assertIs(node.codes.codepoints, codepoints)  # type: ignore
+
+    def test_views_hold_their_codes(self):
+        """Test each section view holds exactly the section's codes."""
+        total = 0
+        for _, _, section in self.all_codes.walk_sections():
+            for codepoint, name in section.codes.items():
+                self.assertEqual(self.all_codes.codes[codepoint], name)
+                self.assertTrue(
+                    section.codepoints_allocated.start
+                    <= codepoint
+                    <= section.codepoints_allocated.stop
+                )
+            total += len(section.codes)
+        self.assertEqual(total, len(self.all_codes.codes))
+
+
+if __name__ == "__main__":
+    unittest.main()
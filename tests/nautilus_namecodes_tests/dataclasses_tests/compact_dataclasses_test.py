@@ -0,0 +1,104 @@
+"""Testing the Compact Data Classes"""
+
+import copy
+import dataclasses
+
+# Only the pickles made by the tests are loaded.
+import pickle  # nosec B403
+import tracemalloc
+import unittest
+from typing import Any, Callable, List
+
+from nautilus_namecodes.compact_dataclasses import (
+    CompactAllCodes,
+    CompactRange,
+    compact_all_codes,
+)
+from nautilus_namecodes.format.json_stream import JsonStream
+from nautilus_namecodes.namecodes_dataclasses import AllCodes
+from nautilus_namecodes.scheme.v_0_1_0.namecode_model import NautilusNamecodesModel
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+def traced_memory(function: Callable[[], Any]) -> int:
+    """The memory still allocated after calling the function."""
+
+    kept: List[Any] = []
+    tracemalloc.start()
+    try:
+        kept.append(function())
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current
+
+
+class CompactDataclassesTestCase(unittest.TestCase):
+    """Test the Compact Codes Match the Data Classes, in Less Memory"""
+
+    def setUp(self) -> None:
+        self.all_codes: AllCodes = AllNameCodes().get_all_codes
+        self.compact: CompactAllCodes = compact_all_codes(self.all_codes)
+
+    def test_slotted(self) -> None:
+        """Test every node is frozen, without an instance dict."""
+
+        for node in [self.compact, *self.compact.walk_nodes()]:
+            self.assertFalse(hasattr(node, "__dict__"))
+            self.assertFalse(hasattr(node.codepoints_allocated, "__dict__"))
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.compact.name = "changed"  # type: ignore[misc]
+
+    def test_codes(self) -> None:
+        """Test the codes of the nodes, and that they share one table."""
+
+        self.assertEqual(dict(self.compact.codes), dict(self.all_codes.codes))
+
+        for compact, node in zip(
+            self.compact.walk_sections(), self.all_codes.walk_sections()
+        ):
+            self.assertEqual(
+                [_compact.name for _compact in compact],
+                [_node.name for _node in node],
+            )
+            self.assertEqual(compact[1].gen_output_range(), node[1].gen_output_range())
+            self.assertEqual(dict(compact[2].codes), dict(node[2].codes))
+            self.assertIs(compact[2].codes.names, self.compact.codes.names)
+
+    def test_to_all_codes(self) -> None:
+        """Test converting back gives the same Json, and validates."""
+
+        all_codes = self.compact.to_all_codes()
+
+        self.assertEqual(
+            "".join(JsonStream(all_codes).stream_all_codes()),
+            "".join(JsonStream(self.all_codes).stream_all_codes()),
+        )
+        self.assertEqual(
+            dict(NautilusNamecodesModel(data=all_codes).dict()["data"].codes),
+            dict(self.all_codes.codes),
+        )
+
+    def test_copy(self) -> None:
+        """Test copying and pickling the frozen nodes."""
+
+        self.assertEqual(copy.copy(self.compact), self.compact)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.compact)), self.compact  # nosec B301
+        )
+        self.assertEqual(CompactRange(0x2F, 0x0).range, range(0x0, 0x2F))
+
+    def test_memory(self) -> None:
+        """Test the compact nodes take less memory than the data classes.
+
+        Both share the same codes, so only the nodes are measured."""
+
+        dataclasses_memory = traced_memory(lambda: copy.deepcopy(self.all_codes))
+        compact_memory = traced_memory(lambda: compact_all_codes(self.all_codes))
+
+        self.assertLess(compact_memory, dataclasses_memory // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
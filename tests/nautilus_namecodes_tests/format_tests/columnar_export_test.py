@@ -0,0 +1,168 @@
+"""Testing the Columnar Export of the Namecodes"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nautilus_namecodes.format import columnar_export
+from nautilus_namecodes.format.columnar_export import (
+    code_columns,
+    default_columnar_format,
+    write_columns,
+)
+from nautilus_namecodes.main import app
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+# The optional dependencies, if installed.
+numpy = columnar_export.numpy
+pyarrow = columnar_export.pyarrow
+
+
+class ColumnarExportTestCase(unittest.TestCase):
+    """Test Exporting the Codes as Columns"""
+
+    def setUp(self) -> None:
+        self.all_codes = AllNameCodes().get_all_codes
+        self.columns = code_columns(self.all_codes)
+
+        self.directory: str = tempfile.mkdtemp()
+        self.path: Path = Path(self.directory).joinpath("codes")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_columns(self):
+        """Test a row per code, in order, with its section."""
+        self.assertEqual(len(self.columns), len(self.all_codes.codes))
+        self.assertEqual(list(self.columns.codepoint), list(self.all_codes.codes))
+        self.assertEqual(self.columns.name, tuple(self.all_codes.codes.values()))
+
+        row = list(self.columns.codepoint).index(0x891)
+        [(plane, block, section)] = [
+            sections
+            for sections in self.all_codes.walk_sections()
+            if 0x891 in sections[2].codes
+        ]
+        self.assertEqual(
+            (
+                self.columns.plane[row],
+                self.columns.block[row],
+                self.columns.section[row],
+                self.columns.section_start[row],
+                self.columns.section_stop[row],
+            ),
+            (
+                plane.name,
+                block.name,
+                section.name,
+                section.codepoints_allocated.start,
+                section.codepoints_allocated.stop,
+            ),
+        )
+
+    def test_csv(self):
+        """Test the CSV columns, with a header."""
+        path = write_columns(self.path.with_suffix(".csv"), self.all_codes)
+
+        with path.open(encoding="utf-8", newline="") as file:
+            rows = list(csv.DictReader(file))
+
+        self.assertEqual(len(rows), len(self.columns))
+        self.assertEqual(list(rows[0]), list(self.columns.column_names))
+        self.assertEqual(
+            {int(row["codepoint"]): row["name"] for row in rows},
+            dict(self.all_codes.codes),
+        )
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_npz(self):
+        """Test the NumPy columns load without pickle."""
+        path = write_columns(self.path, self.all_codes, columnar_format="npz")
+        self.assertEqual(path, self.path.with_name("codes.npz"))
+
+        with numpy.load(path, allow_pickle=False) as arrays:
+            codepoint = arrays["codepoint"]
+            self.assertEqual(numpy.result_type(codepoint), numpy.uint32)
+            self.assertEqual(list(codepoint), list(self.columns.codepoint))
+            self.assertEqual(tuple(arrays["name"]), self.columns.name)
+            self.assertEqual(list(arrays["section"]), self.columns.section)
+            self.assertEqual(
+                list(arrays["section_stop"]), list(self.columns.section_stop)
+            )
+            self.assertEqual(str(arrays["scheme_version"]), self.columns.scheme_version)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow(self):  # pragma: no cover
+        """Test the Arrow IPC columns."""
+        path = write_columns(self.path.with_suffix(".arrow"), self.all_codes)
+
+        with pyarrow.OSFile(str(path), "rb") as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+
+        self.assertEqual(table.num_rows, len(self.columns))
+        self.assertEqual(table.column_names, list(self.columns.column_names))
+        self.assertEqual(
+            table.column("codepoint").to_pylist(), list(self.columns.codepoint)
+        )
+        self.assertEqual(table.column("section").to_pylist(), self.columns.section)
+
+    @unittest.skipIf(pyarrow is not None, "pyarrow is installed")
+    def test_arrow_missing(self):
+        """Test asking for Arrow without pyarrow."""
+        with self.assertRaises(ImportError):
+            write_columns(self.path.with_suffix(".arrow"), self.all_codes)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_default(self):
+        """Test the default format, and its suffix."""
+        path = write_columns(self.path, self.all_codes)
+        self.assertEqual(path.name, f"codes.{default_columnar_format()}")
+        self.assertTrue(path.is_file())
+
+        with self.assertRaises(ValueError):
+            write_columns(self.path, self.all_codes, columnar_format="json")
+
+    def test_suffix(self):
+        """Test a suffix of another format, or of no format, raises."""
+        with self.assertRaisesRegex(ValueError, "not of the format"):
+            write_columns(
+                self.path.with_suffix(".npz"), self.all_codes, columnar_format="csv"
+            )
+        with self.assertRaisesRegex(ValueError, "unknown columnar suffix"):
+            write_columns(self.path.with_suffix(".parquet"), self.all_codes)
+
+        path = write_columns(
+            self.path.with_suffix(".CSV"), self.all_codes, columnar_format="csv"
+        )
+        self.assertEqual(path, self.path.with_suffix(".CSV"))
+        self.assertEqual(os.listdir(self.directory), ["codes.CSV"])
+
+    def test_replace(self):
+        """Test an export replaces the file, and leaves nothing on failure."""
+        path = self.path.with_suffix(".csv")
+        path.write_text("not columns", encoding="utf-8")
+        write_columns(path, self.all_codes)
+        self.assertTrue(path.read_text(encoding="utf-8").startswith("codepoint,"))
+
+        with self.assertRaises(AttributeError):
+            write_columns(path, object())
+        self.assertEqual(os.listdir(self.directory), ["codes.csv"])
+        self.assertTrue(path.read_text(encoding="utf-8").startswith("codepoint,"))
+
+    def test_cli(self):
+        """Test the 'codes --columns' option of the command line."""
+        path = self.path.with_suffix(".csv")
+        result = CliRunner().invoke(app, ["codes", "--columns", str(path)])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        with path.open(encoding="utf-8") as file:
+            self.assertEqual(sum(1 for _ in file), len(self.columns) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
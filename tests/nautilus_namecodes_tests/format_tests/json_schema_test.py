@@ -0,0 +1,84 @@
+"""Testing the Cached Json Schemas"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from nautilus_namecodes.format import json_schema
+from nautilus_namecodes.format.json_schema import (
+    SCHEMA_ALL_CODES,
+    SCHEMA_CODELIST,
+    SCHEMA_TREE,
+    get_json_schema,
+    schema_cache_path,
+)
+from nautilus_namecodes.scheme.registry import UnknownSchemeError
+from nautilus_namecodes.scheme.v_0_1_0.namecode_model import (
+    NautilusNamecodesListModel,
+    NautilusNamecodesModel,
+    NautilusNamecodesTreeModel,
+)
+
+
+class JsonSchemaTestCase(unittest.TestCase):
+    """Test Generating and Caching the Schemas"""
+
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.environ = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.directory})
+        self.environ.start()
+        get_json_schema.cache_clear()
+
+    def tearDown(self) -> None:
+        get_json_schema.cache_clear()
+        self.environ.stop()
+        shutil.rmtree(self.directory)
+
+    def test_schemas(self):
+        """Test the schemas are those of the model classes."""
+        self.assertEqual(
+            get_json_schema(SCHEMA_ALL_CODES), NautilusNamecodesModel.schema_json()
+        )
+        self.assertEqual(
+            get_json_schema(SCHEMA_TREE), NautilusNamecodesTreeModel.schema_json()
+        )
+        self.assertEqual(
+            get_json_schema(SCHEMA_CODELIST), NautilusNamecodesListModel.schema_json()
+        )
+
+    def test_unversioned(self):
+        """Test an unversioned package is not cached on disk."""
+        with mock.patch.object(json_schema, "resolve_version", return_value="0.0.0"):
+            self.assertIsNone(schema_cache_path(SCHEMA_TREE))
+            get_json_schema(SCHEMA_TREE)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_disk_cache(self):
+        """Test the schema is written to, and served from, the disk cache."""
+        with mock.patch.object(json_schema, "resolve_version", return_value="1.2.3"):
+            path = schema_cache_path(SCHEMA_TREE)
+            self.assertEqual(
+                path.parent, Path(self.directory).joinpath("nautilus-namecodes")
+            )
+            self.assertIn("1.2.3", path.name)
+
+            self.assertEqual(get_json_schema(SCHEMA_TREE), path.read_text("utf8"))
+
+            path.write_text("{}", "utf8")
+            self.assertNotEqual(get_json_schema(SCHEMA_TREE), "{}")
+            get_json_schema.cache_clear()
+            self.assertEqual(get_json_schema(SCHEMA_TREE), "{}")
+
+    def test_unknown(self):
+        """Test unknown schemas and scheme versions raise."""
+        with self.assertRaises(ValueError):
+            get_json_schema("unknown")
+        with self.assertRaises(UnknownSchemeError):
+            get_json_schema(SCHEMA_TREE, "v.9.9.9")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Testing the Streaming Json Output"""
+
+import io
+import json
+import unittest
+
+from nautilus_namecodes.format.json_stream import (
+    CODES_CHUNK_SIZE,
+    JsonStream,
+    iter_json,
+)
+from nautilus_namecodes.namecodes_dataclasses import AllCodes, TreeStub
+from nautilus_namecodes.scheme.registry import namecodes_registry
+from nautilus_namecodes.scheme.v_0_1_0.namecode_model import (
+    NautilusNamecodesListModel,
+    NautilusNamecodesModel,
+    NautilusNamecodesTreeModel,
+)
+
+
+class JsonStreamTestCase(unittest.TestCase):
+    """Test the Stream Matches the Pydantic Models"""
+
+    def setUp(self) -> None:
+        self.all_codes: AllCodes = namecodes_registry.get_all_codes()
+        self.tree_stub: TreeStub = namecodes_registry.get_tree_stub()
+        self.json_stream: JsonStream = JsonStream(self.all_codes)
+
+    def test_all_codes(self):
+        """Test streaming all the codes."""
+        self.assertEqual(
+            "".join(self.json_stream.stream_all_codes()),
+            NautilusNamecodesModel(data=self.all_codes).json(),
+        )
+
+    def test_tree(self):
+        """Test streaming the stub tree."""
+        self.assertEqual(
+            "".join(JsonStream.stream_tree(self.tree_stub)),
+            NautilusNamecodesTreeModel(data=self.tree_stub).json(),
+        )
+
+    def test_codelist(self):
+        """Test streaming the code list."""
+        self.assertEqual(
+            "".join(self.json_stream.stream_codelist()),
+            NautilusNamecodesListModel(namecodes=self.all_codes.codes).json(),
+        )
+
+    def test_write(self):
+        """Test writing to a stream."""
+        stream = io.StringIO()
+        self.json_stream.write(self.json_stream.stream_codelist(), stream)
+        self.assertEqual(
+            json.loads(stream.getvalue())["namecodes"]["2193"], "(colour) greyscale"
+        )
+
+    def test_incremental(self):
+        """Test the codes are streamed a chunk of codes at a time."""
+        pieces = list(self.json_stream.stream_codelist())
+        codes = len(self.all_codes.codes)
+        self.assertEqual(len(pieces), 2 + -(-codes // CODES_CHUNK_SIZE) + 1)
+        self.assertLess(max(map(len, pieces)), CODES_CHUNK_SIZE * 64)
+
+        self.assertEqual("".join(iter_json({})), "{}")
+        self.assertEqual("".join(iter_json({1: "a", 2: "b"})), '{"1": "a", "2": "b"}')
+
+    def test_values(self):
+        """Test encoding of the plain values."""
+        self.assertEqual("".join(iter_json(["é", None, 1])), '["\\u00e9", null, 1]')
+        with self.assertRaises(TypeError):
+            list(iter_json(1.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
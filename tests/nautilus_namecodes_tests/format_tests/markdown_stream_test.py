@@ -0,0 +1,71 @@
+"""Testing the Streaming Markdown Output"""
+
+import io
+import unittest
+from typing import Iterable, Iterator
+
+from snakemd.generator import Element
+
+from nautilus_namecodes.format.generate_markdown import MarkdownOutput
+from nautilus_namecodes.format.markdown_stream import MarkdownStream
+
+
+def render(elements: Iterable[Element]) -> str:
+    """Render the elements as a document, with the trailing newline of echo."""
+    markdown_output: MarkdownOutput = MarkdownOutput()
+    markdown_output.append_docuemnt(elements)
+    return markdown_output.document.render() + "\n"
+
+
+def write(lines: Iterator[str]) -> str:
+    """Write the streamed lines to a string."""
+    stream = io.StringIO()
+    MarkdownStream.write(lines, stream)
+    return stream.getvalue()
+
+
+class MarkdownStreamTestCase(unittest.TestCase):
+    """Test the Stream Matches the Rendered Document"""
+
+    def setUp(self) -> None:
+        self.markdown_output: MarkdownOutput = MarkdownOutput()
+        self.markdown_stream: MarkdownStream = MarkdownStream()
+
+    def test_tree(self):
+        """Test streaming the tree."""
+        self.assertEqual(
+            write(self.markdown_stream.stream_tree()),
+            render(self.markdown_output.build_tree()),
+        )
+
+    def test_blocks(self):
+        """Test streaming the blocks list."""
+        self.assertEqual(
+            write(self.markdown_stream.stream_blocks_list()),
+            render(self.markdown_output.generate_blocks_list()),
+        )
+
+    def test_sections(self):
+        """Test streaming the sections list."""
+        self.assertEqual(
+            write(self.markdown_stream.stream_sections_list()),
+            render(self.markdown_output.generate_sections_list()),
+        )
+
+    def test_codes(self):
+        """Test streaming the codes."""
+        self.assertEqual(
+            write(self.markdown_stream.stream_codes()),
+            render(self.markdown_output.build_codes()),
+        )
+
+    def test_lines(self):
+        """Test the lines are yielded one at a time."""
+        lines = self.markdown_stream.stream_codes()
+        self.assertEqual(next(lines), f"# {self.markdown_stream.all_name_codes.name}")
+        self.assertEqual(next(lines), "")
+        self.assertNotIn("\n", next(lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
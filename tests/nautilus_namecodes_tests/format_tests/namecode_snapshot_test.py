@@ -0,0 +1,96 @@
+"""Testing the Binary Snapshot of the Namecodes"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from nautilus_namecodes.format.namecode_snapshot import (
+    LEVEL_PLANE,
+    LEVEL_SECTION,
+    NamecodeSnapshot,
+    SnapshotFormatError,
+    write_snapshot,
+)
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class NamecodeSnapshotTestCase(unittest.TestCase):
+    """Test Writing and Loading a Snapshot"""
+
+    def setUp(self) -> None:
+        self.all_codes = AllNameCodes().get_all_codes
+
+        self.directory: str = tempfile.mkdtemp()
+        self.path: Path = Path(self.directory).joinpath("namecodes.nncs")
+
+        with self.path.open("wb") as snapshot_file:
+            write_snapshot(self.all_codes, snapshot_file)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_codes(self):
+        """Test the snapshot serves the same codes."""
+        with NamecodeSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.scheme_version, self.all_codes.scheme_version)
+            self.assertEqual(snapshot.name, self.all_codes.name)
+            self.assertEqual(len(snapshot), len(self.all_codes.codes))
+            self.assertEqual(dict(snapshot.items()), dict(self.all_codes.codes))
+            self.assertEqual(snapshot[0x891], "(colour) greyscale")
+            self.assertEqual(bytes(snapshot.name_bytes(0x000)), b"(basictype) index")
+            self.assertNotIn(0x010, snapshot)
+
+    def test_nodes(self):
+        """Test the range table holds every plane, block and section."""
+        with NamecodeSnapshot(self.path) as snapshot:
+            nodes = snapshot.nodes
+
+        planes = [node for node in nodes if node.level == LEVEL_PLANE]
+        sections = [node for node in nodes if node.level == LEVEL_SECTION]
+
+        self.assertEqual(
+            [plane.name for plane in planes],
+            [plane.name for plane in self.all_codes.planes],
+        )
+        self.assertEqual(len(sections), len(list(self.all_codes.walk_sections())))
+        self.assertEqual(
+            [(node.start, node.stop) for node in sections],
+            [
+                (
+                    section.codepoints_allocated.start,
+                    section.codepoints_allocated.stop,
+                )
+                for _, _, section in self.all_codes.walk_sections()
+            ],
+        )
+        self.assertEqual(nodes[nodes[-1].parent].name, "Embedded")  # type: ignore
+
+    def test_invalid(self):
+        """Test truncated or foreign files are rejected."""
+        data = self.path.read_bytes()
+
+        self.path.write_bytes(data[:-1])
+        with self.assertRaises(SnapshotFormatError):
+            NamecodeSnapshot(self.path)
+
+        self.path.write_bytes(b"XXXX" + data[4:])
+        with self.assertRaises(SnapshotFormatError):
+            NamecodeSnapshot(self.path)
+
+    def test_empty(self):
+        """Test empty files, and files truncated within the header, are rejected."""
+        data = self.path.read_bytes()
+
+        for size in (0, 1, 39):
+            self.path.write_bytes(data[:size])
+            with self.assertRaisesRegex(SnapshotFormatError, "truncated"):
+                NamecodeSnapshot(self.path)
+
+        self.path.write_bytes(data[:40])
+        with self.assertRaisesRegex(SnapshotFormatError, "size"):
+            NamecodeSnapshot(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
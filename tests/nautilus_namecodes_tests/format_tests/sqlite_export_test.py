@@ -0,0 +1,130 @@
+"""Testing the SQLite Export of the Namecodes"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nautilus_namecodes.format.sqlite_export import SCHEMA_VERSION, write_sqlite
+from nautilus_namecodes.main import app
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class SqliteExportTestCase(unittest.TestCase):
+    """Test Exporting the Codes to SQLite"""
+
+    def setUp(self) -> None:
+        self.all_codes = AllNameCodes().get_all_codes
+
+        self.directory: str = tempfile.mkdtemp()
+        self.path: Path = Path(self.directory).joinpath("namecodes.sqlite")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def query(self, sql: str, *parameters):
+        """All the rows of a query of the export."""
+        connection = sqlite3.connect(str(self.path))
+        try:
+            return connection.execute(sql, parameters).fetchall()
+        finally:
+            connection.close()
+
+    def test_tables(self):
+        """Test the export has every node and code, with their ranges."""
+        write_sqlite(self.path, self.all_codes)
+
+        self.assertEqual(self.query("PRAGMA user_version"), [(SCHEMA_VERSION,)])
+        self.assertEqual(
+            self.query("SELECT version, name, start, stop FROM scheme"),
+            [
+                (
+                    self.all_codes.scheme_version,
+                    self.all_codes.name,
+                    self.all_codes.codepoints_allocated.start,
+                    self.all_codes.codepoints_allocated.stop,
+                )
+            ],
+        )
+        self.assertEqual(
+            self.query("SELECT name, start FROM planes ORDER BY id"),
+            [
+                (plane.name, plane.codepoints_allocated.start)
+                for plane in self.all_codes.planes
+            ],
+        )
+        self.assertEqual(
+            self.query("SELECT count(*) FROM blocks"),
+            [(sum(len(plane.blocks) for plane in self.all_codes.planes),)],
+        )
+        self.assertEqual(self.query("SELECT count(*) FROM sections"), [(25,)])
+        self.assertEqual(
+            dict(self.query("SELECT codepoint, name FROM codes")),
+            dict(self.all_codes.codes),
+        )
+
+    def test_joins(self):
+        """Test the codes are found by joins, and by their sections."""
+        write_sqlite(self.path, self.all_codes)
+
+        [(section, block, plane)] = self.query(
+            "SELECT section, block, plane FROM code_paths WHERE codepoint = ?", 0x891
+        )
+        owner = [
+            (_plane.name, _block.name, _section.name)
+            for _plane, _block, _section in self.all_codes.walk_sections()
+            if 0x891 in _section.codes
+        ]
+        self.assertEqual([(plane, block, section)], owner)
+
+        self.assertEqual(
+            self.query(
+                "SELECT codes.name FROM codes"
+                " JOIN sections ON sections.id = codes.section_id"
+                " WHERE sections.start <= ? AND ? <= sections.stop"
+                " AND codes.codepoint = ?",
+                0x891,
+                0x891,
+                0x891,
+            ),
+            [("(colour) greyscale",)],
+        )
+
+        indexes = {
+            name
+            for (name,) in self.query(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        self.assertTrue(
+            {"blocks_plane", "sections_block", "sections_range", "codes_section"}
+            <= indexes
+        )
+
+    def test_replace(self):
+        """Test an export replaces the file, and leaves nothing on failure."""
+        self.path.write_text("not a database")
+        write_sqlite(self.path, self.all_codes)
+        self.assertEqual(self.query("SELECT count(*) FROM sections"), [(25,)])
+
+        with self.assertRaises(AttributeError):
+            write_sqlite(self.path, object())
+        self.assertEqual(os.listdir(self.directory), ["namecodes.sqlite"])
+        self.assertEqual(self.query("SELECT count(*) FROM sections"), [(25,)])
+
+    def test_cli(self):
+        """Test the 'codes --sqlite' option of the command line."""
+        result = CliRunner().invoke(app, ["codes", "--sqlite", str(self.path)])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            self.query("SELECT count(*) FROM codes"), [(len(self.all_codes.codes),)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
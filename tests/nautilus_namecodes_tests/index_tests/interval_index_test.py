@@ -0,0 +1,107 @@
+"""Testing the Interval Index of Namecodes"""
+
+import unittest
+
+from nautilus_namecodes.builder.synthetic_scheme import (
+    SyntheticShape,
+    build_synthetic_scheme,
+)
+from nautilus_namecodes.index.interval_index import CodepointLookupError, IntervalIndex
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class IntervalIndexTestCase(unittest.TestCase):
+    """Test Lookup of Sections and Codes by Codepoint"""
+
+    def setUp(self) -> None:
+        self.all_codes = AllNameCodes().get_all_codes
+        self.interval_index: IntervalIndex = IntervalIndex(self.all_codes)
+
+    def test_owner(self):
+        """Test the section owning a codepoint, with its block and plane."""
+        self.assertEqual(
+            self.interval_index.owner(0x891).path,
+            "MODIFICATION/Transformation/colour",
+        )
+        self.assertEqual(self.interval_index.owner(0x03F).section.name, "gold")
+        self.assertEqual(self.interval_index.owner(0x6FF).section.name, "edition")
+        self.assertEqual(len(self.interval_index), 25)
+
+    def test_every_codepoint(self):
+        """Test every allocated codepoint against a scan of the sections."""
+        for _, _, section in self.all_codes.walk_sections():
+            for codepoint in range(
+                section.codepoints_allocated.start,
+                section.codepoints_allocated.stop + 1,
+            ):
+                self.assertIs(self.interval_index.owner(codepoint).section, section)
+            self.assertEqual(
+                dict(
+                    self.interval_index.section_codes(
+                        section.codepoints_allocated.start
+                    )
+                ),
+                dict(section.codes),
+            )
+
+    def test_unallocated(self):
+        """Test codepoints outside any section raise the typed error."""
+        self.assertNotIn(0x02F, self.interval_index)
+        self.assertIn(0x030, self.interval_index)
+        for codepoint in [0x02F, 0x940, -1]:
+            with self.assertRaises(CodepointLookupError):
+                self.interval_index.owner(codepoint)
+
+    def test_within(self):
+        """Test the sections and codes within an interval."""
+        self.assertEqual(
+            [
+                owner.section.name
+                for owner in self.interval_index.sections_within(0x600, 0x6FF)
+            ],
+            ["edition"],
+        )
+        self.assertEqual(
+            [
+                owner.section.name
+                for owner in self.interval_index.sections_within(0x00F, 0x040)
+            ],
+            ["basictype", "gold", "alternative"],
+        )
+        self.assertEqual(self.interval_index.sections_within(0x010, 0x02F), [])
+
+        codes = self.interval_index.codes_within(0x600, 0x6FF)
+        self.assertEqual(
+            dict(codes),
+            {
+                codepoint: name
+                for codepoint, name in self.all_codes.codes.items()
+                if 0x600 <= codepoint <= 0x6FF
+            },
+        )
+
+    def test_next_free(self):
+        """Test the next free codepoint of a section."""
+        self.assertEqual(self.interval_index.next_free(0x030), 0x033)
+        self.assertEqual(self.interval_index.next_free(0x035), 0x035)
+        self.assertEqual(self.interval_index.next_free(0x600), 0x6FF)
+
+        full = IntervalIndex(
+            build_synthetic_scheme(
+                SyntheticShape(planes=1, blocks_per_plane=1, values_per_section=16)
+            )
+        )
+        self.assertIsNone(full.next_free(0x000))
+        self.assertIsNone(full.next_free(0x03F))
+
+        for _, _, section in self.all_codes.walk_sections():
+            start = section.codepoints_allocated.start
+            stop = section.codepoints_allocated.stop
+            free = [cp for cp in range(start, stop + 1) if cp not in section.codes]
+            self.assertEqual(
+                self.interval_index.next_free(start), free[0] if free else None
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
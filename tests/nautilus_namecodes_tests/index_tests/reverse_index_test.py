@@ -0,0 +1,47 @@
+"""Testing the Reverse Index of Namecodes"""
+
+import unittest
+
+from nautilus_namecodes.index.reverse_index import NamecodeLookupError, ReverseIndex
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class ReverseIndexTestCase(unittest.TestCase):
+    """Test Lookup of Codepoints by Name"""
+
+    def setUp(self) -> None:
+        self.all_codes = AllNameCodes().get_all_codes
+        self.reverse_index: ReverseIndex = ReverseIndex(self.all_codes)
+
+    def test_lookup(self):
+        """Test the exact formatted name lookup."""
+        self.assertEqual(self.reverse_index.lookup("(colour) greyscale"), 0x891)
+        self.assertEqual(self.reverse_index.lookup("(basictype) index"), 0x000)
+
+    def test_lookup_value(self):
+        """Test the (section, value) lookup."""
+        self.assertEqual(self.reverse_index.lookup_value("colour", "greyscale"), 0x891)
+        self.assertEqual(self.reverse_index.lookup_value("gold", "media"), 0x032)
+        self.assertIn(("edition", "edition: #1"), self.reverse_index)
+
+    def test_round_trip(self):
+        """Test every code resolves back to its codepoint."""
+        for codepoint, name in self.all_codes.codes.items():
+            self.assertEqual(self.reverse_index.lookup(name), codepoint)
+        self.assertEqual(len(self.reverse_index), len(self.all_codes.codes))
+
+    def test_miss(self):
+        """Test unknown names raise the typed error."""
+        with self.assertRaises(NamecodeLookupError):
+            self.reverse_index.lookup("(colour) sepia")
+        with self.assertRaises(KeyError):
+            self.reverse_index.lookup_value("colour", "sepia")
+
+    def test_immutable(self):
+        """Test the index mappings are read-only."""
+        with self.assertRaises(TypeError):
+            self.reverse_index.names["new"] = 1  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
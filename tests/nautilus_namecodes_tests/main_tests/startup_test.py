@@ -0,0 +1,80 @@
+"""Testing the Start-up Imports of the Command Line App"""
+
+import os
+import subprocess  # nosec
+import sys
+import unittest
+from typing import Dict, List
+
+HEAVY_MODULES: List[str] = ["pydantic", "snakemd", "atoml"]
+
+
+def imported_modules(*args: str) -> Dict[str, int]:
+    """Run python with '-X importtime', returning each module's cumulative time."""
+
+    env: Dict[str, str] = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        check=False,
+        env=env,
+        text=True,
+    )
+
+    modules: Dict[str, int] = {}
+    line: str
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+
+    return modules
+
+
+class StartupImportsTestCase(unittest.TestCase):
+    """Test the CLI does not import what it does not need"""
+
+    def assert_not_imported(self, modules: Dict[str, int], *names: str) -> None:
+        """Assert none of the (top level) modules were imported."""
+        imported = {module.split(".")[0] for module in modules}
+        for name in names:
+            self.assertNotIn(name, imported)
+
+    def test_import_main(self):
+        """Test importing the CLI avoids the heavy dependencies."""
+        modules = imported_modules("-c", "import nautilus_namecodes.main")
+        self.assertIn("nautilus_namecodes.main", modules)
+        self.assert_not_imported(modules, *HEAVY_MODULES)
+
+    def test_import_version(self):
+        """Test importing the version module defers resolving the version."""
+        modules = imported_modules("-c", "import nautilus_namecodes._version")
+        self.assert_not_imported(modules, "atoml")
+        self.assertNotIn("importlib.metadata", modules)
+
+    def test_version(self):
+        """Test '--version' avoids the output dependencies."""
+        modules = imported_modules("-m", "nautilus_namecodes", "--version")
+        self.assert_not_imported(modules, "pydantic", "snakemd")
+
+    def test_markdown(self):
+        """Test the (streamed) Markdown output avoids pydantic and snakemd."""
+        modules = imported_modules(
+            "-m", "nautilus_namecodes", "codes", "--show-tree", "--markdown"
+        )
+        self.assertIn("nautilus_namecodes.format.markdown_stream", modules)
+        self.assert_not_imported(modules, "pydantic", "snakemd")
+
+    def test_json(self):
+        """Test the (streamed) Json output avoids pydantic."""
+        modules = imported_modules(
+            "-m", "nautilus_namecodes", "codes", "--show-codes", "--json"
+        )
+        self.assertIn("nautilus_namecodes.format.json_stream", modules)
+        self.assert_not_imported(modules, "pydantic", "snakemd")
+
+
+if __name__ == "__main__":
+    unittest.main()
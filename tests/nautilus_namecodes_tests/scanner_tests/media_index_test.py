@@ -0,0 +1,194 @@
+"""Testing the On Disk Index of a Media Tree"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from nautilus_namecodes.codec.filename_codec import FilenameCodec
+from nautilus_namecodes.scanner.media_index import (
+    DirectoryState,
+    IndexedFile,
+    MediaIndex,
+    MediaIndexError,
+    MediaIndexLookupError,
+    split_path,
+)
+from nautilus_namecodes.scanner.tree_scanner import TreeScanner
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class MediaIndexTestCase(unittest.TestCase):
+    """Test Adding, Removing and Querying Files"""
+
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.database = Path(self.directory).joinpath("media.sqlite")
+        self.index = MediaIndex(self.database)
+        self.index.add_files("", [IndexedFile("001030891.png", (0x001, 0x030, 0x891))])
+        self.index.add_files(
+            "a/b",
+            [IndexedFile("001.png", (0x001,), 11), IndexedFile("600.tif", (0x600,))],
+        )
+        self.index.commit()
+
+    def tearDown(self) -> None:
+        self.index.close()
+        shutil.rmtree(self.directory)
+
+    def test_split_path(self):
+        """Test splitting paths into their directory and name."""
+        self.assertEqual(split_path("a/b/001.png"), ("a/b", "001.png"))
+        self.assertEqual(split_path("001.png"), ("", "001.png"))
+
+    def test_queries(self):
+        """Test the files of the codes, and the codes of the files."""
+        self.assertEqual(
+            list(self.index.files_with_code(0x001)), ["001030891.png", "a/b/001.png"]
+        )
+        self.assertEqual(
+            list(self.index.files_with_codes([0x001, 0x891])), ["001030891.png"]
+        )
+        self.assertEqual(list(self.index.files_with_code(0x700)), [])
+        self.assertEqual(self.index.codes_of("001030891.png"), (0x001, 0x030, 0x891))
+        self.assertEqual(self.index.codes_of("a/b/600.tif"), (0x600,))
+        self.assertEqual(len(self.index), 3)
+        self.assertIn("a/b/001.png", self.index)
+
+        with self.assertRaises(MediaIndexLookupError):
+            self.index.codes_of("a/001.png")
+
+    def test_replace_and_remove(self):
+        """Test files are replaced by name, and removed."""
+        self.index.add_files("a/b", [IndexedFile("001.png", (0x002,))])
+        self.assertEqual(self.index.codes_of("a/b/001.png"), (0x002,))
+        self.assertEqual(list(self.index.files_with_code(0x001)), ["001030891.png"])
+
+        self.index.remove_files("a/b", ["001.png", "missing.png"])
+        self.assertNotIn("a/b/001.png", self.index)
+        self.assertEqual(len(self.index), 2)
+
+        self.index.rollback()
+        self.assertEqual(self.index.codes_of("a/b/001.png"), (0x001,))
+
+    def test_directories(self):
+        """Test the directories, and their states, are kept."""
+        self.assertEqual(self.index.subdirectories(""), [("a", None)])
+        self.assertIsNone(self.index.directory_state("a"))
+
+        self.index.set_directory_state("a", DirectoryState(1_000, 42))
+        self.assertEqual(self.index.directory_state("a"), DirectoryState(1_000, 42))
+        self.assertEqual(
+            self.index.subdirectories(""), [("a", DirectoryState(1_000, 42))]
+        )
+
+        self.assertEqual(len(self.index.subtree_directory_ids("a")), 2)
+        self.assertEqual(len(self.index.subtree_directory_ids("a/b")), 1)
+        self.assertEqual(
+            self.index.remove_directories(self.index.subtree_directory_ids("a")), 2
+        )
+        self.assertEqual(list(self.index.files()), ["001030891.png"])
+        self.assertEqual(self.index.subdirectories(""), [])
+
+    def test_move(self):
+        """Test moving a file, by its inode, to a new name and codes."""
+        [(file_id, path)] = self.index.files_with_inode(11)
+        self.assertEqual(path, "a/b/001.png")
+
+        self.index.move_file(file_id, "c", IndexedFile("002.png", (0x002,), 11))
+        self.assertNotIn("a/b/001.png", self.index)
+        self.assertEqual(self.index.codes_of("c/002.png"), (0x002,))
+        self.assertEqual(self.index.directory_files("c"), {"002.png": (file_id, 11)})
+
+        # In place, with another inode.
+        self.index.move_file(file_id, "c", IndexedFile("002.png", (0x003,), 12))
+        self.assertEqual(self.index.codes_of("c/002.png"), (0x003,))
+        self.assertEqual(self.index.directory_files("c"), {"002.png": (file_id, 12)})
+
+        # Over another file of the index.
+        self.index.move_file(file_id, "a/b", IndexedFile("600.tif", (0x600,), 12))
+        self.assertEqual(self.index.directory_files("a/b"), {"600.tif": (file_id, 12)})
+
+    def test_migrate(self):
+        """Test an index of schema version 1 is upgraded, and rescanned."""
+        root = Path(self.directory).joinpath("media")
+        for file in ["001.png", "a/030.png", "a/b/600.png"]:
+            root.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+            root.joinpath(file).touch()
+        past = time.time_ns() - 3600 * 1_000_000_000
+        for path in [root, root.joinpath("a"), root.joinpath("a/b")]:
+            os.utime(path, ns=(past, past))
+
+        # As scanned by version 1: only the directories with files.
+        old = Path(self.directory).joinpath("old.sqlite")
+        with sqlite3.connect(old) as connection:
+            connection.executescript(
+                "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+                "CREATE TABLE directories (id INTEGER PRIMARY KEY,"
+                " path TEXT NOT NULL UNIQUE);"
+                "CREATE TABLE files (id INTEGER PRIMARY KEY,"
+                " directory_id INTEGER NOT NULL, name TEXT NOT NULL,"
+                " UNIQUE (directory_id, name));"
+                "CREATE TABLE file_codes (file_id INTEGER NOT NULL,"
+                " codepoint INTEGER NOT NULL, PRIMARY KEY (file_id, codepoint))"
+                " WITHOUT ROWID;"
+                "INSERT INTO directories VALUES (1, ''), (2, 'a'), (3, 'a/b');"
+                "INSERT INTO files VALUES (1, 1, '001.png'), (2, 2, '030.png'),"
+                " (3, 3, '600.png');"
+                "INSERT INTO file_codes VALUES (1, 1), (2, 48), (3, 1536);"
+                "PRAGMA user_version = 1;"
+            )
+            connection.execute(
+                "INSERT INTO meta VALUES ('root', ?)", (str(root.resolve()),)
+            )
+        connection.close()
+
+        with MediaIndex(old) as index:
+            self.assertEqual(
+                list(index.files()), ["001.png", "a/030.png", "a/b/600.png"]
+            )
+            self.assertIsNone(index.directory_state(""))
+            self.assertEqual(index.subdirectories(""), [("a", None)])
+            self.assertEqual(index.subdirectories("a"), [("a/b", None)])
+
+            scanner = TreeScanner(
+                root, index, FilenameCodec(AllNameCodes().get_all_codes)
+            )
+            self.assertEqual(scanner.rescan().directories, 3)
+
+            root.joinpath("a/b/891.png").touch()
+            root.joinpath("a/030.png").unlink()
+            stats = scanner.rescan()
+
+            self.assertEqual((stats.unchanged, stats.added, stats.removed), (1, 1, 1))
+            self.assertEqual(
+                list(index.files()), ["001.png", "a/b/600.png", "a/b/891.png"]
+            )
+
+    def test_reopen(self):
+        """Test the index is read back by another connection."""
+        self.index.set_meta("root", "/srv/media")
+        self.index.commit()
+
+        with MediaIndex(self.database) as index:
+            self.assertEqual(index.get_meta("root"), "/srv/media")
+            self.assertEqual(
+                list(index.files()), ["001030891.png", "a/b/001.png", "a/b/600.tif"]
+            )
+
+    def test_other_database(self):
+        """Test a database of another schema version is refused."""
+        other = Path(self.directory).joinpath("other.sqlite")
+        with sqlite3.connect(other) as connection:
+            connection.execute("CREATE TABLE files (path TEXT)")
+        connection.close()
+
+        with self.assertRaises(MediaIndexError):
+            MediaIndex(other)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+"""Testing the Scanner of Media Trees"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import List
+
+from nautilus_namecodes.codec.filename_codec import FilenameCodec
+from nautilus_namecodes.scanner.media_index import MediaIndex, MediaIndexError
+from nautilus_namecodes.scanner.tree_scanner import ScanStats, TreeScanner
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+FILES: List[str] = [
+    "001030891.png",
+    "README.md",
+    "gold/001030.png",
+    "gold/001030.xmp",
+    "gold/2022/001030600.tif",
+    "gold/2022/notes.txt",
+    "base/deep/er/and/deeper/002031.jpg",
+    "empty/.keep",
+]
+
+
+def make_tree(root: Path, files: List[str]) -> None:
+    """Make empty files, and their directories, under the root."""
+    for file in files:
+        path = root.joinpath(file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def age_tree(root: Path) -> None:
+    """Set the modification times of the directories an hour back, so they
+    are not too recent to be recorded by a scan."""
+    past: int = time.time_ns() - 3600 * 1_000_000_000
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, ns=(past, past))
+
+
+class TreeScannerTestCase(unittest.TestCase):
+    """Test Scanning Trees into an Index"""
+
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.root = Path(self.directory).joinpath("media")
+        make_tree(self.root, FILES)
+        age_tree(self.root)
+        self.index = MediaIndex(Path(self.directory).joinpath("media.sqlite"))
+        self.codec = FilenameCodec(AllNameCodes().get_all_codes)
+
+    def tearDown(self) -> None:
+        self.index.close()
+        shutil.rmtree(self.directory)
+
+    def test_scan(self):
+        """Test the decoded files are indexed, whatever the workers."""
+        for workers, batch_size in [(1, 1000), (4, 1)]:
+            stats = TreeScanner(
+                self.root,
+                self.index,
+                self.codec,
+                workers=workers,
+                batch_size=batch_size,
+            ).scan()
+
+            self.assertEqual(stats.directories, 9)
+            self.assertEqual(stats.files, 8)
+            self.assertEqual(stats.indexed, 5)
+            self.assertEqual(stats.undecoded, 3)
+            self.assertEqual(stats.errors, [])
+
+            self.assertEqual(
+                list(self.index.files_with_code(0x030)),
+                [
+                    "001030891.png",
+                    "gold/001030.png",
+                    "gold/001030.xmp",
+                    "gold/2022/001030600.tif",
+                ],
+            )
+            self.assertEqual(
+                self.index.codes_of("base/deep/er/and/deeper/002031.jpg"),
+                (0x002, 0x031),
+            )
+            self.assertEqual(self.index.get_meta("root"), str(self.root.resolve()))
+
+    def test_rescan_replaces(self):
+        """Test a full scan replaces the files of the previous scan."""
+        TreeScanner(self.root, self.index, self.codec).scan()
+        self.root.joinpath("001030891.png").unlink()
+
+        TreeScanner(self.root, self.index, self.codec).scan()
+        self.assertNotIn("001030891.png", self.index)
+        self.assertEqual(len(self.index), 4)
+
+    @unittest.skipIf(not hasattr(os, "symlink"), "no symbolic links")
+    def test_symlinks(self):
+        """Test symbolic links are not followed."""
+        self.root.joinpath("link").symlink_to(self.root.joinpath("gold"))
+        self.root.joinpath("600.png").symlink_to(self.root.joinpath("001030891.png"))
+
+        stats = TreeScanner(self.root, self.index, self.codec).scan()
+        self.assertEqual(stats.indexed, 5)
+
+    @unittest.skipIf(os.name != "posix" or os.geteuid() == 0, "needs permissions")
+    def test_unreadable(self):
+        """Test an unreadable directory is reported, and skipped."""
+        self.root.joinpath("gold", "2022").chmod(0)
+        try:
+            stats = TreeScanner(self.root, self.index, self.codec).scan()
+        finally:
+            self.root.joinpath("gold", "2022").chmod(0o755)
+
+        self.assertEqual(stats.errors, ["gold/2022"])
+        self.assertEqual(stats.indexed, 4)
+
+    def test_rescan_unchanged(self):
+        """Test an unchanged tree is only stat()ed by a rescan."""
+        TreeScanner(self.root, self.index, self.codec).scan()
+        stats = TreeScanner(self.root, self.index, self.codec).rescan()
+
+        self.assertEqual(stats.directories, 9)
+        self.assertEqual(stats.unchanged, 9)
+        self.assertEqual(stats.files, 0)
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (0, 0, 0))
+        self.assertEqual(len(self.index), 5)
+
+    def test_rescan_files(self):
+        """Test the added, removed and renamed files are applied."""
+        TreeScanner(self.root, self.index, self.codec).scan()
+        [(tif_id, _)] = self.index.files_with_inode(
+            self.root.joinpath("gold/2022/001030600.tif").stat().st_ino
+        )
+
+        self.root.joinpath("gold/002.png").touch()
+        self.root.joinpath("gold/001030.png").unlink()
+        self.root.joinpath("gold/001030.xmp").rename(self.root.joinpath("gold/031.xmp"))
+        self.root.joinpath("gold/2022/001030600.tif").rename(
+            self.root.joinpath("base/600.tif")
+        )
+
+        stats = TreeScanner(self.root, self.index, self.codec).rescan()
+        self.assertEqual(stats.directories, 9)
+        self.assertEqual(stats.unchanged, 6)
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (1, 1, 2))
+
+        self.assertEqual(
+            list(self.index.files()),
+            [
+                "001030891.png",
+                "base/600.tif",
+                "base/deep/er/and/deeper/002031.jpg",
+                "gold/002.png",
+                "gold/031.xmp",
+            ],
+        )
+        self.assertEqual(self.index.codes_of("gold/031.xmp"), (0x031,))
+        self.assertEqual(
+            self.index.directory_files("base"),
+            {"600.tif": (tif_id, self.root.joinpath("base/600.tif").stat().st_ino)},
+        )
+
+        # The changed directories were too recent to record, and are listed
+        # again, without any more changes.
+        self.assertIsNone(self.index.directory_state("gold"))
+        stats = TreeScanner(self.root, self.index, self.codec).rescan()
+        self.assertEqual(stats.unchanged, 6)
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (0, 0, 0))
+
+    def test_rescan_directories(self):
+        """Test the renamed, removed and new directories are applied."""
+        TreeScanner(self.root, self.index, self.codec).scan()
+
+        self.root.joinpath("gold/2022").rename(self.root.joinpath("gold/2023"))
+        shutil.rmtree(self.root.joinpath("base/deep/er"))
+        make_tree(self.root, ["new/003.png"])
+
+        stats = TreeScanner(self.root, self.index, self.codec).rescan()
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (1, 1, 1))
+        self.assertEqual(
+            list(self.index.files()),
+            [
+                "001030891.png",
+                "gold/001030.png",
+                "gold/001030.xmp",
+                "gold/2023/001030600.tif",
+                "new/003.png",
+            ],
+        )
+        self.assertEqual(self.index.subdirectories("base/deep"), [])
+        self.assertEqual(
+            [path for path, _ in self.index.subdirectories("gold")], ["gold/2023"]
+        )
+
+    def test_rescan_given(self):
+        """Test rescanning only some directories, and their subdirectories."""
+        TreeScanner(self.root, self.index, self.codec).scan()
+
+        self.root.joinpath("gold/002.png").touch()
+        self.root.joinpath("001030891.png").unlink()
+        shutil.rmtree(self.root.joinpath("base/deep/er"))
+
+        stats = TreeScanner(self.root, self.index, self.codec).rescan(
+            ["gold", "gold/2022", "base/deep/er"]
+        )
+        self.assertEqual(stats.directories, 2)
+        self.assertEqual(stats.unchanged, 1)
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (1, 1, 0))
+        self.assertIn("gold/002.png", self.index)
+        self.assertIn("001030891.png", self.index)
+        self.assertEqual(self.index.subdirectories("base/deep"), [])
+
+        total = ScanStats(files=1, errors=["a"])
+        total.merge(stats)
+        self.assertEqual((total.files, total.added, total.errors), (4, 1, ["a"]))
+
+    @unittest.skipIf(not hasattr(os, "link"), "no hard links")
+    def test_rescan_hard_link(self):
+        """Test a new hard link to an indexed file is not a rename."""
+        TreeScanner(self.root, self.index, self.codec).scan()
+        os.link(
+            self.root.joinpath("gold/001030.png"), self.root.joinpath("gold/031.png")
+        )
+
+        stats = TreeScanner(self.root, self.index, self.codec).rescan()
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (1, 0, 0))
+        self.assertIn("gold/001030.png", self.index)
+        self.assertIn("gold/031.png", self.index)
+
+    def test_rescan_other_root(self):
+        """Test the index of another tree is not rescanned."""
+        TreeScanner(self.root, self.index, self.codec).scan()
+
+        with self.assertRaises(MediaIndexError):
+            TreeScanner(self.root.joinpath("gold"), self.index, self.codec).rescan()
+        self.assertEqual(len(self.index), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""Testing the Watchers of Media Trees"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import List
+
+from nautilus_namecodes.codec.filename_codec import FilenameCodec
+from nautilus_namecodes.scanner.media_index import MediaIndex
+from nautilus_namecodes.scanner.tree_scanner import ScanStats, TreeScanner
+from nautilus_namecodes.scanner.tree_watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    TreeWatcher,
+    inotify_available,
+    tree_watcher,
+)
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+FILES: List[str] = [
+    "001030891.png",
+    "gold/001030.png",
+    "gold/001030.xmp",
+    "gold/notes.txt",
+    "gold/2022/001030600.tif",
+    "base/deep/er/and/deeper/002031.jpg",
+]
+
+
+def touch(root: Path, *files: str) -> None:
+    """Create the files under the root, with their directories."""
+    for file in files:
+        root.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+        root.joinpath(file).touch()
+
+
+class WatcherTestCase(unittest.TestCase):
+    """Base of the Tests of Watchers, on a scanned tree"""
+
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.root = Path(self.directory).joinpath("media")
+        touch(self.root, *FILES)
+        past: int = time.time_ns() - 3600 * 1_000_000_000
+        for directory, _, _ in os.walk(self.root):
+            os.utime(directory, ns=(past, past))
+        self.index = MediaIndex(Path(self.directory).joinpath("media.sqlite"))
+        self.scanner = TreeScanner(
+            self.root, self.index, FilenameCodec(AllNameCodes().get_all_codes)
+        )
+
+    def tearDown(self) -> None:
+        self.index.close()
+        shutil.rmtree(self.directory)
+
+    def settle(self, watcher: TreeWatcher) -> ScanStats:
+        """Apply the changes until there are no more."""
+        stats = ScanStats()
+        step = watcher.step(1.0)
+        while step is not None:
+            stats.merge(step)
+            step = watcher.step(0.2)
+        return stats
+
+
+class TreeWatcherTestCase(WatcherTestCase):
+    """Test Watching Trees by Polling"""
+
+    def test_polling(self):
+        """Test the polling watcher rescans the tree."""
+        with PollingWatcher(self.scanner, interval=0.0) as watcher:
+            self.assertEqual(watcher.start().added, 5)
+
+            self.root.joinpath("gold/002.png").touch()
+            self.root.joinpath("001030891.png").unlink()
+
+            stats = watcher.step(0.0)
+            self.assertEqual((stats.added, stats.removed), (1, 1))
+            self.assertIn("gold/002.png", self.index)
+            self.assertNotIn("001030891.png", self.index)
+
+        with PollingWatcher(self.scanner, interval=3600.0) as watcher:
+            watcher.start()
+            self.assertIsNone(watcher.step(0.0))
+
+    def test_run(self):
+        """Test running a watcher until it is stopped."""
+        batches = []
+
+        def callback(stats):
+            batches.append(stats)
+            watcher.stop()
+
+        with tree_watcher(self.scanner, polling=True) as watcher:
+            watcher.run(callback)
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].added, 5)
+
+
+@unittest.skipIf(not inotify_available(), "needs inotify")
+class InotifyWatcherTestCase(WatcherTestCase):
+    """Test Watching Trees with inotify"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.watcher = InotifyWatcher(self.scanner, latency=0.05)
+        self.assertEqual(self.watcher.start().added, 5)
+
+    def tearDown(self) -> None:
+        self.watcher.close()
+        super().tearDown()
+
+    def test_factory(self):
+        """Test inotify is used when available."""
+        self.assertIsInstance(tree_watcher(self.scanner), InotifyWatcher)
+
+    def test_files(self):
+        """Test the files created, deleted and renamed are applied."""
+        [(xmp_id, _)] = self.index.files_with_inode(
+            self.root.joinpath("gold/001030.xmp").stat().st_ino
+        )
+
+        self.root.joinpath("gold/002.png").touch()
+        self.root.joinpath("gold/notes.md").touch()
+        self.root.joinpath("gold/001030.png").unlink()
+        self.root.joinpath("gold/001030.xmp").rename(self.root.joinpath("031.xmp"))
+        self.root.joinpath("001030891.png").rename(self.root.joinpath("README.txt"))
+
+        stats = self.settle(self.watcher)
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (1, 2, 1))
+        self.assertEqual(stats.undecoded, 2)
+
+        self.assertEqual(
+            list(self.index.files()),
+            [
+                "031.xmp",
+                "base/deep/er/and/deeper/002031.jpg",
+                "gold/002.png",
+                "gold/2022/001030600.tif",
+            ],
+        )
+        self.assertEqual(self.index.codes_of("031.xmp"), (0x031,))
+        self.assertEqual(
+            self.index.files_with_inode(self.root.joinpath("031.xmp").stat().st_ino),
+            [(xmp_id, "031.xmp")],
+        )
+
+    def test_directories(self):
+        """Test the directories created, renamed and removed are applied."""
+        [(tif_id, _)] = self.index.files_with_inode(
+            self.root.joinpath("gold/2022/001030600.tif").stat().st_ino
+        )
+
+        touch(self.root, "new/er/003.png")
+        self.root.joinpath("gold/2022").rename(self.root.joinpath("2023"))
+        shutil.rmtree(self.root.joinpath("base/deep"))
+
+        stats = self.settle(self.watcher)
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (1, 1, 1))
+        self.assertEqual(
+            list(self.index.files()),
+            [
+                "001030891.png",
+                "2023/001030600.tif",
+                "gold/001030.png",
+                "gold/001030.xmp",
+                "new/er/003.png",
+            ],
+        )
+        self.assertEqual(self.index.directory_files("2023")["001030600.tif"][0], tif_id)
+
+        # The new directories are watched.
+        self.root.joinpath("new/er/004.png").touch()
+        self.root.joinpath("2023/001030600.tif").unlink()
+        stats = self.settle(self.watcher)
+        self.assertEqual((stats.added, stats.removed), (1, 1))
+        self.assertIn("new/er/004.png", self.index)
+        self.assertNotIn("2023/001030600.tif", self.index)
+
+    def test_outside(self):
+        """Test the files moved out of, and into, the tree."""
+        outside = Path(self.directory).joinpath("outside")
+        outside.mkdir()
+
+        self.root.joinpath("gold").rename(outside.joinpath("gold"))
+        self.root.joinpath("001030891.png").rename(outside.joinpath("001030891.png"))
+        outside.joinpath("600.png").touch()
+        outside.joinpath("600.png").rename(self.root.joinpath("600.png"))
+
+        stats = self.settle(self.watcher)
+        self.assertEqual((stats.added, stats.removed, stats.renamed), (1, 4, 0))
+        self.assertEqual(
+            list(self.index.files()),
+            ["600.png", "base/deep/er/and/deeper/002031.jpg"],
+        )
+
+        # The directories moved out are no longer watched.
+        outside.joinpath("gold/002.png").touch()
+        self.assertIsNone(self.watcher.step(0.2))
+
+
+if __name__ == "__main__":
+    unittest.main()
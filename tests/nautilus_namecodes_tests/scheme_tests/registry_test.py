@@ -0,0 +1,86 @@
+"""Testing the Namecodes Scheme Registry"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from nautilus_namecodes.namecodes_dataclasses import AllCodes
+from nautilus_namecodes.scheme.registry import (
+    DEFAULT_SCHEME_VERSION,
+    SchemeRegistry,
+    UnknownSchemeError,
+)
+from nautilus_namecodes.scheme.v_0_1_0.namecodes import AllNameCodes
+
+
+class SchemeRegistryTestCase(unittest.TestCase):
+    """Test the Lazy Building and Sharing of Schemes"""
+
+    def setUp(self) -> None:
+        self.builds: int = 0
+
+        def builder() -> AllCodes:
+            self.builds += 1
+            return AllNameCodes().get_all_codes
+
+        self.registry: SchemeRegistry = SchemeRegistry()
+        self.registry.register(DEFAULT_SCHEME_VERSION, builder)
+
+    def test_built_once(self):
+        """Test the scheme is only built on first use."""
+        self.assertEqual(self.builds, 0)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: self.registry.get_all_codes(), range(32))
+            )
+
+        self.assertEqual(self.builds, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertIs(self.registry.get_tree_stub(), self.registry.get_tree_stub())
+        self.assertIs(
+            self.registry.get_reverse_index(), self.registry.get_reverse_index()
+        )
+        self.assertIs(
+            self.registry.get_interval_index(), self.registry.get_interval_index()
+        )
+        self.assertEqual(self.builds, 1)
+
+    def test_read_only_codes(self):
+        """Test the codes view cannot be modified."""
+        codes = self.registry.get_codes()
+        self.assertEqual(codes[0x000], "(basictype) index")
+        with self.assertRaises(TypeError):
+            codes[0x000] = "changed"  # type: ignore
+
+    def test_copies(self):
+        """Test changing the copies handed out leaves the scheme as built."""
+        all_codes = self.registry.get_all_codes(copy=True)
+        self.assertIsNot(all_codes, self.registry.get_all_codes())
+        self.assertIs(all_codes.codes, self.registry.get_all_codes().codes)
+        all_codes.planes.clear()
+        all_codes.name = "changed"
+        self.assertEqual(len(self.registry.get_all_codes().planes), 3)
+        self.assertNotEqual(self.registry.get_all_codes().name, "changed")
+
+        tree_stub = self.registry.get_tree_stub(copy=True)
+        tree_stub.plane_branches[0].block_branches.clear()
+        self.assertTrue(self.registry.get_tree_stub().plane_branches[0].block_branches)
+
+    def test_invalidate(self):
+        """Test invalidation forces a rebuild."""
+        first = self.registry.get_all_codes()
+        self.registry.invalidate()
+        second = self.registry.get_all_codes()
+
+        self.assertEqual(self.builds, 2)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.codes, second.codes)
+
+    def test_unknown_scheme(self):
+        """Test an unregistered scheme version raises."""
+        with self.assertRaises(UnknownSchemeError):
+            self.registry.get_all_codes("v.9.9.9")
+
+
+if __name__ == "__main__":
+    unittest.main()